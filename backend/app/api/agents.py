@@ -4,6 +4,8 @@ from typing import List
 from app.core.database import get_db
 from app.models import AgentConfig
 from app.schemas.agent_config import AgentConfigResponse, AgentConfigUpdate
+from app.services.agents.config_registry import agent_config_registry
+from app.services.gigachat.response_cache import response_cache
 import yaml
 import os
 
@@ -42,6 +44,7 @@ def update_agent_config(
     
     db.commit()
     db.refresh(config)
+    agent_config_registry.invalidate(agent_name)
     return config
 
 
@@ -70,6 +73,19 @@ def reset_agent_config(agent_name: str, db: Session = Depends(get_db)):
         
         db.commit()
         db.refresh(config)
+        agent_config_registry.invalidate(agent_name)
     
     return config
 
+
+@router.get("/cache/stats")
+def get_response_cache_stats():
+    """Get LLM response cache hit/miss counters"""
+    return response_cache.stats()
+
+
+@router.delete("/cache")
+def clear_response_cache():
+    """Clear LLM response cache"""
+    response_cache.clear()
+    return {"message": "Response cache cleared"}
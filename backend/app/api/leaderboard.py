@@ -1,54 +1,82 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_
+from sqlalchemy import desc, tuple_
 from typing import List, Optional
 from app.core.database import get_db
-from app.models import Startup, Scoring
+from app.models import Startup, StartupLatestScore, WeightProfile, ProfileRanking
 from app.schemas.startup import StartupResponse
+from app.schemas.weight_profile import WhatIfRequest, WhatIfResponse
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.api.response_cache import portfolio_responses
+from app.services.scoring.what_if import what_if
 
 router = APIRouter(prefix="/api/leaderboard", tags=["leaderboard"])
 
 
 @router.get("/", response_model=List[dict])
 def get_leaderboard(
+    request: Request,
+    response: Response,
     limit: int = 50,
     industry: Optional[str] = None,
     stage: Optional[str] = None,
     geography: Optional[str] = None,
+    profile: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get top startups leaderboard"""
-    # Get latest scoring for each startup
-    subquery = db.query(
-        Scoring.startup_id,
-        func.max(Scoring.created_at).label('latest_date')
-    ).group_by(Scoring.startup_id).subquery()
+    """
+    Get top startups leaderboard
     
-    query = db.query(
-        Startup,
-        Scoring.total_score,
-        Scoring.id.label('scoring_id')
-    ).join(
-        Scoring, Startup.id == Scoring.startup_id
-    ).join(
-        subquery,
-        and_(
-            Scoring.startup_id == subquery.c.startup_id,
-            Scoring.created_at == subquery.c.latest_date
-        )
+    With profile, returns the ranking persisted for that weight profile (see POST /what-if).
+    A full page has X-Next-Cursor; pass it as cursor to get the following ranks.
+    Responses are cached until scorings, startups or profile rankings change and carry
+    an ETag; If-None-Match with the current ETag returns 304.
+    """
+    return portfolio_responses.respond(request, response, lambda: _get_leaderboard(
+        db, response, limit, industry, stage, geography, profile, cursor
+    ))
+
+
+def _get_leaderboard(
+    db: Session,
+    response: Response,
+    limit: int,
+    industry: Optional[str],
+    stage: Optional[str],
+    geography: Optional[str],
+    profile: Optional[str],
+    cursor: Optional[str]
+) -> List[dict]:
+    if profile:
+        return _get_profile_leaderboard(db, response, profile, limit, industry, stage, geography, cursor)
+    
+    # Latest scoring of each startup is kept in the startup_latest_score projection
+    query = db.query(Startup, StartupLatestScore).join(
+        StartupLatestScore, Startup.id == StartupLatestScore.startup_id
     )
     
     if industry:
-        query = query.filter(Startup.industry == industry)
+        query = query.filter(StartupLatestScore.industry == industry)
     if stage:
-        query = query.filter(Startup.stage == stage)
+        query = query.filter(StartupLatestScore.stage == stage)
     if geography:
-        query = query.filter(Startup.geography == geography)
+        query = query.filter(StartupLatestScore.geography == geography)
     
-    results = query.order_by(desc(Scoring.total_score)).limit(limit).all()
+    # Ties on score are ordered by startup id, so (score, startup id) is a unique sort key
+    sort_key = tuple_(StartupLatestScore.total_score, StartupLatestScore.startup_id)
+    first_rank = 1
+    if cursor:
+        last_score, last_startup_id, last_rank = decode_cursor(cursor, float, int, int)
+        query = query.filter(sort_key < (last_score, last_startup_id))
+        first_rank = last_rank + 1
+    
+    results = query.order_by(
+        desc(StartupLatestScore.total_score), desc(StartupLatestScore.startup_id)
+    ).limit(limit).all()
     
     leaderboard = []
-    for rank, (startup, score, scoring_id) in enumerate(results, 1):
+    for rank, (startup, latest) in enumerate(results, first_rank):
         leaderboard.append({
             "rank": rank,
             "startup": {
@@ -58,9 +86,103 @@ def get_leaderboard(
                 "stage": startup.stage,
                 "geography": startup.geography
             },
-            "score": float(score),
-            "scoring_id": scoring_id
+            "score": float(latest.total_score),
+            "scoring_id": latest.scoring_id
         })
     
+    if results:
+        last = leaderboard[-1]
+        set_next_cursor(response, len(results), limit, [last["score"], last["startup"]["id"], last["rank"]])
     return leaderboard
 
+
+def _get_profile_leaderboard(
+    db: Session,
+    response: Response,
+    profile_name: str,
+    limit: int,
+    industry: Optional[str],
+    stage: Optional[str],
+    geography: Optional[str],
+    cursor: Optional[str]
+) -> List[dict]:
+    """Leaderboard from the persisted ranking of a weight profile"""
+    profile = db.query(WeightProfile).filter(WeightProfile.name == profile_name).first()
+    if not profile:
+        raise HTTPException(status_code=404, detail=f"Weight profile '{profile_name}' not found")
+    
+    query = db.query(Startup, ProfileRanking).join(
+        ProfileRanking, Startup.id == ProfileRanking.startup_id
+    ).filter(ProfileRanking.profile_id == profile.id)
+    
+    if industry:
+        query = query.filter(Startup.industry == industry)
+    if stage:
+        query = query.filter(Startup.stage == stage)
+    if geography:
+        query = query.filter(Startup.geography == geography)
+    
+    first_rank = 1
+    if cursor:
+        last_portfolio_rank, last_rank = decode_cursor(cursor, int, int)
+        query = query.filter(ProfileRanking.rank > last_portfolio_rank)
+        first_rank = last_rank + 1
+    
+    results = query.order_by(ProfileRanking.rank).limit(limit).all()
+    
+    leaderboard = [
+        {
+            "rank": rank,
+            "startup": {
+                "id": startup.id,
+                "name": startup.name,
+                "industry": startup.industry,
+                "stage": startup.stage,
+                "geography": startup.geography
+            },
+            "score": float(ranking.total_score),
+            "scoring_id": ranking.scoring_id,
+            "portfolio_rank": ranking.rank
+        }
+        for rank, (startup, ranking) in enumerate(results, first_rank)
+    ]
+    if leaderboard:
+        last = leaderboard[-1]
+        set_next_cursor(response, len(leaderboard), limit, [last["portfolio_rank"], last["rank"]])
+    return leaderboard
+
+
+@router.post("/what-if", response_model=WhatIfResponse)
+def what_if_leaderboard(request: WhatIfRequest, db: Session = Depends(get_db)):
+    """
+    Rank all startups under a weight profile (or ad-hoc weights) and compare with the current leaderboard
+    
+    With persist=true (named profile only) the ranking is stored and served by GET /api/leaderboard?profile=...
+    """
+    profile = None
+    if request.profile:
+        profile = db.query(WeightProfile).filter(WeightProfile.name == request.profile).first()
+        if not profile:
+            raise HTTPException(status_code=404, detail=f"Weight profile '{request.profile}' not found")
+        weights = profile.weights
+    elif request.weights:
+        weights = request.weights
+    else:
+        raise HTTPException(status_code=400, detail="Either profile or weights is required")
+    
+    if request.persist and profile is None:
+        raise HTTPException(status_code=400, detail="Only rankings of a named profile can be persisted")
+    
+    try:
+        return what_if(
+            db,
+            weights,
+            limit=request.limit,
+            industry=request.industry,
+            stage=request.stage,
+            geography=request.geography,
+            profile=profile,
+            persist=request.persist
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,48 @@
+"""
+Keyset (cursor) pagination helpers.
+A cursor is the opaque encoding of the sort key of the last row of a page;
+the next page continues strictly after it, so rows inserted meanwhile
+don't shift or repeat entries the way offsets do.
+"""
+from typing import Any, Callable, List, Sequence
+from fastapi import HTTPException, Response
+import base64
+import json
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values (JSON-serializable, datetimes as ISO strings)"""
+    payload = json.dumps(list(values), separators=(",", ":"), default=lambda value: value.isoformat())
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> List[Any]:
+    """
+    Decode cursor into sort key values
+
+    Args:
+        cursor: Cursor from a previous page
+        types: Converter for each value (e.g. int, float, datetime.fromisoformat)
+
+    Returns:
+        Converted values
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("unexpected number of values")
+        return [convert(value) for convert, value in zip(types, values)]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
+def set_next_cursor(response: Response, page_size: int, limit: int, values: Sequence[Any]) -> None:
+    """Send cursor of the next page in X-Next-Cursor when the page is full"""
+    if limit > 0 and page_size >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(values)
@@ -1,13 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from typing import List
 from app.core.database import get_db
 from app.models import PitchDocument
-from app.schemas.pitch_document import PitchDocumentResponse, PitchDocumentUpdate
+from app.schemas.pitch_document import PitchDocumentResponse, PitchDocumentUpdate, NearDuplicateResponse
 from app.services.analysis.missing_info_analyzer import MissingInfoAnalyzer
+from app.services.analysis.section_segmenter import SectionSegmenter
+from app.services.analysis.content_hash import content_hash
+from app.services.analysis.near_duplicates import near_duplicate_index
+from app.services.parsers.parse_cache import parse_cache
+from app.services.parsers.parse_executor import parse_executor
+from app.services.parsers.url_fetcher import url_fetcher
 
 router = APIRouter(prefix="/api/pitch-documents", tags=["pitch-documents"])
 
 
+@router.get("/parser/stats")
+def get_parser_stats():
+    """Document parser pools (workers, in-flight and queued documents, failures, timeouts, timings), parse cache and URL fetcher"""
+    return {**parse_executor.stats(), "cache": parse_cache.stats(), "url": url_fetcher.stats()}
+
+
 @router.get("/{document_id}", response_model=PitchDocumentResponse)
 def get_pitch_document(document_id: int, db: Session = Depends(get_db)):
     """Get pitch document by ID"""
@@ -17,6 +30,60 @@ def get_pitch_document(document_id: int, db: Session = Depends(get_db)):
     return doc
 
 
+@router.get("/{document_id}/pages")
+def get_pitch_pages(document_id: int, db: Session = Depends(get_db)):
+    """Get extracted text split into pages/slides (PDF and presentation uploads)"""
+    doc = db.query(PitchDocument).filter(PitchDocument.id == document_id).first()
+    if not doc:
+        raise HTTPException(status_code=404, detail="Pitch document not found")
+    
+    text = doc.extracted_text or ""
+    offsets = doc.page_offsets or [0]
+    ends = offsets[1:] + [len(text)]
+    return {
+        "pages": [text[start:end].strip() for start, end in zip(offsets, ends)],
+        "is_edited": bool(doc.is_edited)
+    }
+
+
+@router.get("/{document_id}/sections")
+def get_pitch_sections(document_id: int, db: Session = Depends(get_db)):
+    """Get pitch document text split into tagged sections"""
+    doc = db.query(PitchDocument).filter(PitchDocument.id == document_id).first()
+    if not doc:
+        raise HTTPException(status_code=404, detail="Pitch document not found")
+    
+    if doc.sections is None and doc.text_content:
+        doc.sections = SectionSegmenter().segment(doc.text_content)
+        db.commit()
+    
+    return doc.sections or {"summary": "", "sections": {}}
+
+
+@router.get("/{document_id}/near-duplicates", response_model=List[NearDuplicateResponse])
+def get_near_duplicates(
+    document_id: int,
+    threshold: float = Query(0.5, ge=0.0, le=1.0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Get pitch documents with similar text and their estimated Jaccard similarity"""
+    doc = db.query(PitchDocument).filter(PitchDocument.id == document_id).first()
+    if not doc:
+        raise HTTPException(status_code=404, detail="Pitch document not found")
+    
+    return [
+        NearDuplicateResponse(
+            pitch_document_id=similar_doc.id,
+            startup_id=similar_doc.startup_id,
+            startup_name=similar_doc.startup.name if similar_doc.startup else None,
+            similarity=round(similarity, 3),
+            created_at=similar_doc.created_at
+        )
+        for similar_doc, similarity in near_duplicate_index.find_similar(db, doc, threshold=threshold, limit=limit)
+    ]
+
+
 @router.put("/{document_id}/text", response_model=PitchDocumentResponse)
 def update_pitch_text(
     document_id: int,
@@ -31,6 +98,9 @@ def update_pitch_text(
     if update.edited_text is not None:
         doc.edited_text = update.edited_text
         doc.is_edited = True
+        doc.sections = SectionSegmenter().segment(doc.text_content)
+        doc.content_hash = content_hash(doc.text_content)
+        near_duplicate_index.index_document(db, doc)
     
     if update.missing_info is not None:
         doc.missing_info = update.missing_info
@@ -0,0 +1,76 @@
+"""
+In-process cache of rendered list responses with strong ETags.
+Entries are keyed by path, query parameters and the version of the data
+they are built from, so a write (version bump) makes them unreachable.
+A request whose If-None-Match matches the cached ETag gets 304 without
+touching the DB.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.data_version import VersionCounter, portfolio_version
+import hashlib
+
+# Clients must revalidate, the ETag makes revalidation cheap
+CACHE_CONTROL = "no-cache"
+
+
+class ResponseCache:
+    """Rendered JSON responses of GET endpoints, invalidated by a VersionCounter"""
+
+    def __init__(self, version: VersionCounter):
+        self.version = version
+        # key -> (etag, body, headers)
+        self.entries = LRUCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+            size_of=lambda entry: len(entry[1])
+        )
+
+    def respond(self, request: Request, response: Response, build: Callable[[], Any]) -> Response:
+        """
+        Cached response for the request, built on a miss
+
+        Args:
+            request: Incoming request (path and query parameters form the key)
+            response: Response injected into the endpoint; headers build sets on it are cached too
+            build: Returns the response content, called only on a cache miss
+
+        Returns:
+            304 if If-None-Match matches, otherwise the JSON response with ETag
+        """
+        key = (request.url.path, tuple(sorted(request.query_params.multi_items())), self.version.current())
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._render(build(), response)
+            self.entries.set(key, entry)
+
+        etag, body, headers = entry
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def _render(self, content: Any, response: Response) -> Tuple[str, bytes, Dict[str, str]]:
+        body = JSONResponse(jsonable_encoder(content)).body
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ("content-length", "content-type")
+        }
+        headers.update({"ETag": etag, "Cache-Control": CACHE_CONTROL})
+        return etag, body, headers
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+# Startup list and leaderboards
+portfolio_responses = ResponseCache(portfolio_version)
@@ -1,22 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import DateTime, func, literal, select, tuple_
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.models import Scoring, Startup, PitchDocument
-from app.schemas.scoring import ScoringResponse, ScoringCreate
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.models import Scoring, Startup, PitchDocument, ScoringJob, AgentResult
+from app.schemas.scoring import ScoringResponse, ScoringCreate, AgentResultResponse, ReaggregationResponse
+from app.schemas.scoring_job import ScoringJobResponse
 from app.schemas.comment import CommentCreate, CommentResponse
-from app.services.scoring.scoring_service import ScoringService
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.services.scoring.scoring_service import ScoringService, SCORING_MODES
+from app.services.scoring.scoring_jobs import enqueue_scoring_job
+from app.services.scoring.reaggregation import reaggregate_scorings
+import asyncio
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds between keep-alive comments in scoring event streams
+SSE_KEEPALIVE_INTERVAL = 15
+
+# Streamed scorings run here, not in the default executor shared with sync routes and
+# asyncio.to_thread; streams above the limit wait (with keep-alives) for a free worker
+stream_executor = ThreadPoolExecutor(max_workers=settings.SCORING_STREAM_WORKERS, thread_name_prefix="scoring-stream")
+
 router = APIRouter(prefix="/api/scorings", tags=["scorings"])
 
 
-@router.post("/startups/{startup_id}/score", response_model=ScoringResponse)
-def create_scoring(startup_id: int, db: Session = Depends(get_db)):
-    """Create scoring for startup"""
-    logger.info(f"[API] Starting scoring request for startup_id={startup_id}")
+@router.post(
+    "/startups/{startup_id}/score",
+    response_model=Union[ScoringJobResponse, ScoringResponse],
+    status_code=202
+)
+def create_scoring(
+    startup_id: int,
+    response: Response,
+    sync: bool = False,
+    mode: Optional[str] = None,
+    force: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Create scoring for startup
+    
+    Scoring runs as a background job: returns 202 with the job, poll GET /api/scorings/jobs/{id}.
+    With sync=true scoring runs within the request and the Scoring is returned.
+    mode overrides SCORING_MODE: per_agent (one call per agent) or combined (one call for all agents).
+    If identical text was already scored with the same agent configs, that scoring is reused
+    and returned with 200 right away; force=true always runs the agents and calls the model
+    (stored agent results and cached GigaChat responses are not reused, fresh responses are cached).
+    """
+    logger.info(f"[API] Starting scoring request for startup_id={startup_id} (sync={sync}, mode={mode}, force={force})")
+    _validate_mode(mode)
     
     startup = db.query(Startup).filter(Startup.id == startup_id).first()
     if not startup:
@@ -39,32 +78,171 @@ def create_scoring(startup_id: int, db: Session = Depends(get_db)):
     
     logger.info(f"[API] Pitch document found. Text length: {len(text)} chars")
     
+    scoring_service = ScoringService(db, mode=mode)
+    if not force:
+        existing = scoring_service.find_reusable_scoring(pitch_doc)
+        if existing:
+            scoring = scoring_service.reuse_scoring(pitch_doc, existing)
+            response.status_code = 200
+            return ScoringResponse.model_validate(scoring)
+    
+    if not sync:
+        job = enqueue_scoring_job(db, startup_id, pitch_doc.id, options={"mode": mode, "force": force})
+        return ScoringJobResponse.model_validate(job)
+    
     # Run scoring service
-    logger.info(f"[API] Calling ScoringService.score_startup()")
-    scoring_service = ScoringService(db)
-    scoring_result = scoring_service.score_startup(text, startup_id)
-    logger.info(f"[API] Scoring completed. Total score: {scoring_result.get('total_score', 'N/A')}")
-    
-    # Create scoring record
-    scoring = Scoring(
-        startup_id=startup_id,
-        total_score=scoring_result["total_score"],
-        breakdown=scoring_result["breakdown"],
-        risks=scoring_result["risks"],
-        recommendations=scoring_result["recommendations"],
-        team_info=scoring_result.get("team_info", {})
-    )
-    db.add(scoring)
-    db.commit()
-    db.refresh(scoring)
+    logger.info(f"[API] Calling ScoringService.score_and_save()")
+    scoring = scoring_service.score_and_save(pitch_doc, force=force)
     
-    return scoring
+    response.status_code = 200
+    return ScoringResponse.model_validate(scoring)
+
+
+def _validate_mode(mode: Optional[str]) -> None:
+    if mode is not None and mode not in SCORING_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown scoring mode '{mode}'. Available: {', '.join(SCORING_MODES)}"
+        )
+
+
+def _sse_event(event: str, payload: Dict[str, Any]) -> str:
+    """Format server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.post("/startups/{startup_id}/score/stream")
+def stream_scoring(
+    startup_id: int,
+    mode: Optional[str] = None,
+    force: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Create scoring for startup, streaming progress as server-sent events
+    
+    Events: started, agent_started, agent_completed (with agent score and details),
+    scoring_completed (breakdown and total), done (saved scoring id) or error.
+    scoring_reused replaces agent events when identical text was already scored (unless force=true,
+    which also bypasses stored agent results and cached GigaChat responses).
+    """
+    logger.info(f"[API] Starting streamed scoring for startup_id={startup_id} (mode={mode})")
+    _validate_mode(mode)
+    
+    startup = db.query(Startup).filter(Startup.id == startup_id).first()
+    if not startup:
+        raise HTTPException(status_code=404, detail="Startup not found")
+    
+    pitch_doc = db.query(PitchDocument).filter(
+        PitchDocument.startup_id == startup_id
+    ).order_by(PitchDocument.created_at.desc()).first()
+    
+    if not pitch_doc:
+        raise HTTPException(status_code=404, detail="No pitch document found for this startup")
+    if not pitch_doc.text_content:
+        raise HTTPException(status_code=400, detail="No text content available for scoring")
+    
+    pitch_document_id = pitch_doc.id
+    
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def on_event(event: str, payload: Dict[str, Any]) -> None:
+            # Called from agent threads
+            loop.call_soon_threadsafe(queue.put_nowait, (event, payload))
+        
+        def run_scoring() -> None:
+            # Scoring runs in a worker thread with its own session
+            session = SessionLocal()
+            try:
+                doc = session.query(PitchDocument).filter(PitchDocument.id == pitch_document_id).first()
+                scoring_service = ScoringService(session, mode=mode)
+                scoring = scoring_service.score_and_save(doc, on_event=on_event, force=force)
+                on_event("done", {"scoring_id": scoring.id, "total_score": scoring.total_score})
+            except Exception as e:
+                logger.error(f"[API] Streamed scoring failed for startup_id={startup_id}: {str(e)}", exc_info=True)
+                on_event("error", {"detail": str(e)})
+            finally:
+                session.close()
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+        
+        scoring_task = loop.run_in_executor(stream_executor, run_scoring)
+        yield _sse_event("started", {
+            "startup_id": startup_id,
+            "agents": list(ScoringService.AGENT_CLASSES)
+        })
+        
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                # Keep proxies from closing an idle connection while agents are working
+                yield ": keep-alive\n\n"
+                continue
+            if item is None:
+                break
+            yield _sse_event(*item)
+        
+        await scoring_task
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=ScoringJobResponse)
+def get_scoring_job(job_id: int, db: Session = Depends(get_db)):
+    """Get scoring job status and progress"""
+    job = db.query(ScoringJob).filter(ScoringJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Scoring job not found")
+    return job
+
+
+@router.post("/reaggregate", response_model=ReaggregationResponse)
+def reaggregate(scoring_ids: Optional[List[int]] = Query(None), db: Session = Depends(get_db)):
+    """
+    Recompute scorings (all or scoring_ids) from stored agent results with current
+    category mapping and weights, without calling GigaChat
+    """
+    return reaggregate_scorings(db, scoring_ids)
 
 
 @router.get("/", response_model=List[ScoringResponse])
-def get_scorings(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get list of scorings"""
-    return db.query(Scoring).order_by(Scoring.created_at.desc()).offset(skip).limit(limit).all()
+def get_scorings(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Get list of scorings, newest first
+    
+    A full page has X-Next-Cursor; pass it as cursor to continue after the page
+    (skip is ignored with cursor).
+    """
+    query = db.query(Scoring).order_by(Scoring.created_at.desc(), Scoring.id.desc())
+    if cursor:
+        # Sort key (created_at, id) of the last row. The stored created_at of the row is
+        # preferred while it exists (exact value as the database stores it), the encoded one
+        # keeps pagination going if the row was deleted between pages
+        encoded_created_at, last_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        last_created_at = func.coalesce(
+            select(Scoring.created_at).where(Scoring.id == last_id).scalar_subquery(),
+            literal(encoded_created_at, DateTime(timezone=True))
+        )
+        query = query.filter(tuple_(Scoring.created_at, Scoring.id) < tuple_(last_created_at, last_id))
+    else:
+        query = query.offset(skip)
+    
+    scorings = query.limit(limit).all()
+    if scorings:
+        set_next_cursor(response, len(scorings), limit, [scorings[-1].created_at, scorings[-1].id])
+    return scorings
 
 
 @router.get("/{scoring_id}", response_model=ScoringResponse)
@@ -82,6 +260,15 @@ def get_scoring(scoring_id: int, db: Session = Depends(get_db)):
     return scoring
 
 
+@router.get("/{scoring_id}/agent-results", response_model=List[AgentResultResponse])
+def get_agent_results(scoring_id: int, db: Session = Depends(get_db)):
+    """Get per-agent results of scoring with raw responses, latency and token usage"""
+    scoring = db.query(Scoring).filter(Scoring.id == scoring_id).first()
+    if not scoring:
+        raise HTTPException(status_code=404, detail="Scoring not found")
+    return db.query(AgentResult).filter(AgentResult.scoring_id == scoring_id).order_by(AgentResult.id).all()
+
+
 @router.post("/{scoring_id}/comments", response_model=CommentResponse)
 def create_comment(
     scoring_id: int,
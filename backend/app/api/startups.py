@@ -1,17 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, literal, select, union_all
 from typing import List, Optional
 from app.core.database import get_db
-from app.models import Startup, PitchDocument, Scoring
-from app.schemas.startup import StartupCreate, StartupResponse, StartupUpdate
+from app.models import Startup, PitchDocument, Scoring, StartupLatestScore
+from app.schemas.startup import StartupCreate, StartupResponse, StartupUpdate, FacetValue, StartupFacetsResponse
 from app.schemas.pitch_document import PitchDocumentResponse
-from app.services.parsers.document_parser_factory import DocumentParserFactory
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.api.response_cache import portfolio_responses
+from app.core.data_version import portfolio_version
+from app.services.parsers.base_parser import join_pages
+from app.services.parsers.parse_cache import parse_cache
+from app.services.parsers.parse_executor import ParserBusyError, ParseTimeoutError, parse_executor
+from app.services.parsers.url_fetcher import PageTooLargeError
+from app.services.parsers.upload_storage import UploadTooLargeError, save_upload
+from app.services.analysis.section_segmenter import SectionSegmenter
+from app.services.analysis.content_hash import content_hash
+from app.services.analysis.near_duplicates import near_duplicate_index
+from app.services.scoring.latest_scoring import latest_scoring_id, refresh_latest_score
+from app.services.scoring.what_if import portfolio_cache
+import asyncio
 import os
+import time
 from app.core.config import settings
 
 router = APIRouter(prefix="/api/startups", tags=["startups"])
 
+# Filter attributes returned by /facets
+FACET_COLUMNS = {
+    "industry": Startup.industry,
+    "stage": Startup.stage,
+    "geography": Startup.geography
+}
+
 
 @router.post("/", response_model=StartupResponse)
 def create_startup(startup: StartupCreate, db: Session = Depends(get_db)):
@@ -20,21 +41,55 @@ def create_startup(startup: StartupCreate, db: Session = Depends(get_db)):
     db.add(db_startup)
     db.commit()
     db.refresh(db_startup)
+    portfolio_version.bump()
     return db_startup
 
 
 @router.get("/", response_model=List[dict])
 def get_startups(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     industry: Optional[str] = None,
     stage: Optional[str] = None,
     geography: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get list of startups with optional filters and latest scoring info"""
-    # Get all startups
-    query = db.query(Startup)
+    """
+    Get list of startups with optional filters and latest scoring info
+    
+    Startups, their latest scoring and the total number of matching startups
+    (X-Total-Count header) come from a single query.
+    Pages are ordered by id. A full page has X-Next-Cursor; pass it as cursor
+    to continue after the page (skip is ignored with cursor).
+    Responses are cached until startups or scorings change and carry an ETag;
+    If-None-Match with the current ETag returns 304.
+    """
+    return portfolio_responses.respond(request, response, lambda: _list_startups(
+        db, response, skip, limit, industry, stage, geography, cursor
+    ))
+
+
+def _list_startups(
+    db: Session,
+    response: Response,
+    skip: int,
+    limit: int,
+    industry: Optional[str],
+    stage: Optional[str],
+    geography: Optional[str],
+    cursor: Optional[str]
+) -> List[dict]:
+    query = db.query(
+        Startup,
+        Scoring.id,
+        Scoring.total_score,
+        func.count().over().label("total_count")
+    ).outerjoin(
+        Scoring, Scoring.id == latest_scoring_id(Startup.id)
+    )
     
     if industry:
         query = query.filter(Startup.industry == industry)
@@ -43,30 +98,81 @@ def get_startups(
     if geography:
         query = query.filter(Startup.geography == geography)
     
-    startups_list = query.offset(skip).limit(limit).all()
+    if cursor:
+        last_id, = decode_cursor(cursor, int)
+        # Window count would only see startups after the cursor
+        total = query.with_entities(func.count(Startup.id)).scalar()
+        rows = query.filter(Startup.id > last_id).order_by(Startup.id).limit(limit).all()
+    else:
+        rows = query.order_by(Startup.id).offset(skip).limit(limit).all()
+        if rows:
+            total = rows[0].total_count
+        else:
+            # Page past the end: the window count has no row to ride on
+            total = query.with_entities(func.count(Startup.id)).scalar()
+    
+    response.headers["X-Total-Count"] = str(total)
+    if rows:
+        set_next_cursor(response, len(rows), limit, [rows[-1][0].id])
     
-    # Get latest scoring for each startup
     startups = []
-    for startup in startups_list:
-        latest_scoring = db.query(Scoring).filter(
-            Scoring.startup_id == startup.id
-        ).order_by(Scoring.created_at.desc()).first()
-        
-        startup_dict = {
+    for startup, scoring_id, score, _ in rows:
+        startups.append({
             "id": startup.id,
             "name": startup.name,
             "industry": startup.industry,
             "stage": startup.stage,
             "geography": startup.geography,
             "created_at": startup.created_at,
-            "latest_scoring_id": latest_scoring.id if latest_scoring else None,
-            "latest_score": float(latest_scoring.total_score) if latest_scoring else None
-        }
-        startups.append(startup_dict)
+            "latest_scoring_id": scoring_id,
+            "latest_score": float(score) if score is not None else None
+        })
     
     return startups
 
 
+@router.get("/facets", response_model=StartupFacetsResponse)
+def get_startup_facets(request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Industries, stages and geographies with startup counts and latest score
+    range per value, for building filters
+    
+    Computed in one grouped query and cached like the startup list.
+    """
+    return portfolio_responses.respond(request, response, lambda: _startup_facets(db))
+
+
+def _startup_facets(db: Session) -> StartupFacetsResponse:
+    facets = {name: [] for name in FACET_COLUMNS}
+    query = union_all(*[
+        select(
+            literal(name).label("facet"),
+            column.label("value"),
+            func.count(Startup.id).label("count"),
+            func.count(StartupLatestScore.startup_id).label("scored"),
+            func.avg(StartupLatestScore.total_score).label("avg_score"),
+            func.min(StartupLatestScore.total_score).label("min_score"),
+            func.max(StartupLatestScore.total_score).label("max_score")
+        ).select_from(Startup).outerjoin(
+            StartupLatestScore, Startup.id == StartupLatestScore.startup_id
+        ).group_by(column)
+        for name, column in FACET_COLUMNS.items()
+    ])
+    
+    for row in db.execute(query):
+        facets[row.facet].append(FacetValue(
+            value=row.value,
+            count=row.count,
+            scored=row.scored,
+            avg_score=round(float(row.avg_score), 2) if row.avg_score is not None else None,
+            min_score=row.min_score,
+            max_score=row.max_score
+        ))
+    for values in facets.values():
+        values.sort(key=lambda facet: -facet.count)
+    return StartupFacetsResponse(**facets)
+
+
 @router.get("/{startup_id}", response_model=StartupResponse)
 def get_startup(startup_id: int, db: Session = Depends(get_db)):
     """Get startup by ID"""
@@ -90,9 +196,12 @@ def update_startup(
     update_data = startup_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(startup, field, value)
+    refresh_latest_score(db, startup.id)
     
     db.commit()
     db.refresh(startup)
+    portfolio_cache.invalidate()
+    portfolio_version.bump()
     return startup
 
 
@@ -105,6 +214,8 @@ def delete_startup(startup_id: int, db: Session = Depends(get_db)):
     
     db.delete(startup)
     db.commit()
+    portfolio_cache.invalidate()
+    portfolio_version.bump()
     return {"message": "Startup deleted successfully"}
 
 
@@ -127,12 +238,16 @@ async def upload_pitch(
         db.add(startup)
         db.commit()
         db.refresh(startup)
+        portfolio_version.bump()
     
     # Determine content type and source
     content_type = None
     source_type = "file"
     extracted_text = None
+    page_offsets = None
     file_path = None
+    file_size = None
+    file_hash = None
     
     if file:
         # File upload
@@ -140,20 +255,27 @@ async def upload_pitch(
         os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
         file_path = os.path.join(settings.UPLOAD_DIR, f"{startup.id}_{file.filename}")
         
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        try:
+            file_size, file_hash = await save_upload(file, file_path)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
         
-        # Parse document
-        parser = DocumentParserFactory.get_parser(content_type)
-        extracted_text = parser.parse(file_path)
+        # Parse document, unless this file was already parsed by the current parser version
+        # Cache reads and writes hit the DB, keep them off the event loop like parsing
+        cached = await asyncio.to_thread(parse_cache.get, file_hash, content_type)
+        if cached is not None:
+            pages = cached.pages
+        else:
+            started_at = time.monotonic()
+            pages = await _parse_upload(content_type, file_path)
+            await asyncio.to_thread(parse_cache.set, file_hash, content_type, pages, time.monotonic() - started_at)
+        extracted_text, page_offsets = join_pages(pages)
         
     elif url:
         # URL upload
         source_type = "url"
         content_type = "url"
-        parser = DocumentParserFactory.get_parser("url")
-        extracted_text = parser.parse(url)
+        extracted_text, _ = join_pages(await _parse_upload("url", url))
         
     elif text:
         # Direct text
@@ -165,13 +287,32 @@ async def upload_pitch(
     pitch_doc = PitchDocument(
         startup_id=startup.id,
         file_path=file_path,
+        file_size=file_size,
+        file_hash=file_hash,
         content_type=content_type,
         source_type=source_type,
-        extracted_text=extracted_text
+        extracted_text=extracted_text,
+        page_offsets=page_offsets,
+        sections=SectionSegmenter().segment(extracted_text) if extracted_text else None,
+        content_hash=content_hash(extracted_text) if extracted_text else None
     )
     db.add(pitch_doc)
+    db.flush()
+    near_duplicate_index.index_document(db, pitch_doc)
     db.commit()
     db.refresh(pitch_doc)
     
     return pitch_doc
 
+
+async def _parse_upload(content_type: str, source: str) -> List[str]:
+    """Parse uploaded document into pages in the parser pools, mapping overload and timeouts to HTTP errors"""
+    try:
+        return await parse_executor.parse_pages(content_type, source)
+    except ParserBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "10"})
+    except ParseTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except PageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import Dict, List
+from app.core.database import get_db
+from app.core.data_version import portfolio_version
+from app.models import WeightProfile, ProfileRanking
+from app.schemas.weight_profile import WeightProfileCreate, WeightProfileResponse, WeightProfileUpdate
+from app.services.scoring.scoring_service import ScoringService
+from app.services.scoring.what_if import normalize_weights
+
+router = APIRouter(prefix="/api/weight-profiles", tags=["weight-profiles"])
+
+
+def _validate_weights(weights: Dict[str, float]) -> None:
+    try:
+        normalize_weights(weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/", response_model=List[WeightProfileResponse])
+def get_weight_profiles(db: Session = Depends(get_db)):
+    """Get all weight profiles"""
+    return db.query(WeightProfile).order_by(WeightProfile.name).all()
+
+
+@router.get("/default")
+def get_default_weights():
+    """Get category weights used for the total score"""
+    return ScoringService.DEFAULT_WEIGHTS
+
+
+@router.post("/", response_model=WeightProfileResponse)
+def create_weight_profile(profile: WeightProfileCreate, db: Session = Depends(get_db)):
+    """Create weight profile"""
+    _validate_weights(profile.weights)
+    if db.query(WeightProfile).filter(WeightProfile.name == profile.name).first():
+        raise HTTPException(status_code=400, detail=f"Weight profile '{profile.name}' already exists")
+    
+    db_profile = WeightProfile(**profile.dict())
+    db.add(db_profile)
+    db.commit()
+    db.refresh(db_profile)
+    return db_profile
+
+
+@router.get("/{name}", response_model=WeightProfileResponse)
+def get_weight_profile(name: str, db: Session = Depends(get_db)):
+    """Get weight profile by name"""
+    profile = db.query(WeightProfile).filter(WeightProfile.name == name).first()
+    if not profile:
+        raise HTTPException(status_code=404, detail=f"Weight profile '{name}' not found")
+    return profile
+
+
+@router.put("/{name}", response_model=WeightProfileResponse)
+def update_weight_profile(name: str, update: WeightProfileUpdate, db: Session = Depends(get_db)):
+    """Update weight profile"""
+    profile = db.query(WeightProfile).filter(WeightProfile.name == name).first()
+    if not profile:
+        raise HTTPException(status_code=404, detail=f"Weight profile '{name}' not found")
+    
+    update_data = update.dict(exclude_unset=True)
+    new_name = update_data.get("name")
+    if new_name is not None and new_name != name:
+        if db.query(WeightProfile).filter(WeightProfile.name == new_name).first():
+            raise HTTPException(status_code=400, detail=f"Weight profile '{new_name}' already exists")
+    if "weights" in update_data:
+        _validate_weights(update_data["weights"])
+        # Persisted ranking was computed with the old weights
+        db.query(ProfileRanking).filter(ProfileRanking.profile_id == profile.id).delete(synchronize_session=False)
+        profile.ranked_at = None
+    for field, value in update_data.items():
+        setattr(profile, field, value)
+    
+    db.commit()
+    db.refresh(profile)
+    if update_data:
+        # Cached leaderboards are keyed by profile name and built with its weights
+        portfolio_version.bump()
+    return profile
+
+
+@router.delete("/{name}")
+def delete_weight_profile(name: str, db: Session = Depends(get_db)):
+    """Delete weight profile and its persisted ranking"""
+    profile = db.query(WeightProfile).filter(WeightProfile.name == name).first()
+    if not profile:
+        raise HTTPException(status_code=404, detail=f"Weight profile '{name}' not found")
+    
+    db.delete(profile)
+    db.commit()
+    portfolio_version.bump()
+    return {"message": f"Weight profile '{name}' deleted"}
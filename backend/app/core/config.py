@@ -6,9 +6,56 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     GIGACHAT_API_KEY: Optional[str] = None
     GIGACHAT_AUTH_URL: str = "https://ngw.devices.sberbank.ru:9443/api/v2/oauth"
+    GIGACHAT_SCOPE: str = "GIGACHAT_API_PERS"
+    GIGACHAT_TOKEN_REFRESH_MARGIN: int = 60  # Seconds before expires_at to refresh the token
+    GIGACHAT_API_URL: str = "https://gigachat.devices.sberbank.ru/api/v1"
+    GIGACHAT_CONNECT_TIMEOUT: float = 5.0
+    GIGACHAT_READ_TIMEOUT: float = 30.0
+    GIGACHAT_POOL_SIZE: Optional[int] = None  # Defaults to SCORING_MAX_CONCURRENCY * SCORING_CHUNK_CONCURRENCY
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PERSISTENT: bool = True  # Keep responses in DB in addition to memory
+    LLM_CACHE_TTL: int = 7 * 24 * 3600  # Seconds
+    LLM_CACHE_MEMORY_MAX_ENTRIES: int = 512
+    LLM_CACHE_DB_MAX_ENTRIES: int = 10000
+    PORTFOLIO_CACHE_TTL: float = 60.0  # Seconds a cached what-if portfolio is trusted when LISTEN/NOTIFY is unavailable
+    AGENT_CONFIG_VERSION_CHECK_INTERVAL: float = 5.0  # Seconds between config version checks when LISTEN/NOTIFY is unavailable
+    DATA_VERSION_CHECK_INTERVAL: float = 2.0  # Seconds between data version checks when LISTEN/NOTIFY is unavailable
+    NOTIFY_RECONNECT_DELAY: float = 5.0  # Seconds before the LISTEN connection is re-established
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
     SECRET_KEY: str = "your-secret-key-change-in-production"
     UPLOAD_DIR: str = "./uploads"
+    MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # Bytes, larger uploads are rejected with 413
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # Bytes written to disk at a time
+    PARSER_PROCESS_WORKERS: int = 2  # Processes parsing PDF/PPTX
+    PARSER_THREAD_WORKERS: int = 4  # Threads reading text files
+    PARSER_TIMEOUT: float = 120.0  # Seconds a single document may take to parse
+    PARSER_MAX_QUEUE: int = 16  # Documents waiting per pool before uploads are rejected with 503
+    PARSER_PDF_PAGES_PER_TASK: int = 20  # Pages of a PDF parsed by one worker process
+    PARSE_CACHE_ENABLED: bool = True  # Reuse text extracted from identical uploaded files
+    PARSE_CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024  # Characters of extracted text kept in memory
+    PARSE_CACHE_DB_MAX_ENTRIES: int = 5000
+    URL_FETCH_TIMEOUT: float = 10.0  # Seconds for connecting to and each read from a pitch web page
+    URL_FETCH_MAX_BYTES: int = 5 * 1024 * 1024  # Larger pages are rejected
+    URL_FETCH_MAX_CONNECTIONS: int = 10  # Pages fetched at the same time
+    URL_CACHE_MAX_ENTRIES: int = 256  # Pages whose text is kept for conditional GET revalidation
+    URL_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
     MCP_BASE_PORT: int = 8000
+    SCORING_PARALLEL: bool = True  # Run scoring agents concurrently
+    SCORING_MAX_CONCURRENCY: int = 5  # Max agents running at the same time
+    SCORING_MODE: str = "per_agent"  # per_agent: one call per agent, combined: one call for all agents
+    SCORING_SECTION_ROUTING: bool = True  # Send each agent only its relevant sections of the pitch
+    SCORING_INCREMENTAL: bool = True  # Reuse stored agent results when the agent's input and config are unchanged
+    SCORING_NEAR_DUPLICATE_THRESHOLD: Optional[float] = None  # Reuse scoring of a pitch at least this similar (0-1), None disables
+    SCORING_CHUNK_TOKENS: int = 6000  # Documents above this estimate are split into chunks
+    SCORING_CHUNK_OVERLAP_TOKENS: int = 200
+    SCORING_CHUNK_CONCURRENCY: int = 3  # Chunks analyzed at the same time per agent
+    SCORING_STREAM_WORKERS: int = 4  # Streamed (SSE) scorings running at the same time per process
+    SCORING_JOB_WORKERS: int = 1  # Background scoring workers per process, 0 disables
+    SCORING_JOB_POLL_INTERVAL: float = 2.0  # Seconds between queue polls
+    SCORING_JOB_TIMEOUT: int = 900  # Seconds without heartbeat after which a running job is considered abandoned
+    SCORING_JOB_HEARTBEAT_INTERVAL: float = 30.0  # Seconds between heartbeats of a running job
+    SCORING_JOB_MAX_ATTEMPTS: int = 3
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,105 @@
+"""
+Version counters for data that in-process caches are derived from.
+Writers bump the counter in the data_versions table after committing;
+the new value is broadcast with LISTEN/NOTIFY so other workers learn it
+without querying. Without notifications each worker re-reads the counter
+at most every DATA_VERSION_CHECK_INTERVAL seconds.
+"""
+from typing import Optional
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.notifications import notify, notification_listener
+from app.models import DataVersion
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class VersionCounter:
+    """Monotonic counter of writes to one group of data"""
+
+    def __init__(self, name: str, check_interval: Optional[float] = None):
+        self.name = name
+        self.channel = f"data_version_{name}"
+        self.check_interval = settings.DATA_VERSION_CHECK_INTERVAL if check_interval is None else check_interval
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        notification_listener.subscribe(self.channel, self._on_notification)
+
+    def current(self) -> int:
+        """Latest known version, read from the DB only when it may be stale"""
+        with self._lock:
+            fresh = notification_listener.is_listening or time.monotonic() - self._checked_at < self.check_interval
+            if self._version is not None and fresh:
+                return self._version
+
+        version = self._read()
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._version = version
+            self._checked_at = time.monotonic()
+            return self._version
+
+    def bump(self) -> int:
+        """
+        Increment version after data was committed and tell other workers
+
+        Returns:
+            New version
+        """
+        db = SessionLocal()
+        try:
+            version = self._increment(db)
+        except IntegrityError:
+            # Another worker created the row first
+            db.rollback()
+            version = self._increment(db)
+        finally:
+            db.close()
+
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._version = version
+            self._checked_at = time.monotonic()
+        notify(self.channel, str(version))
+        return version
+
+    def _increment(self, db) -> int:
+        version = db.execute(
+            update(DataVersion).where(DataVersion.name == self.name)
+            .values(version=DataVersion.version + 1)
+            .returning(DataVersion.version)
+        ).scalar()
+        if version is None:
+            version = 1
+            db.add(DataVersion(name=self.name, version=version))
+        db.commit()
+        return version
+
+    def _read(self) -> int:
+        db = SessionLocal()
+        try:
+            version = db.query(DataVersion.version).filter(DataVersion.name == self.name).scalar()
+        finally:
+            db.close()
+        return version or 0
+
+    def _on_notification(self, payload: Optional[str]) -> None:
+        with self._lock:
+            if payload:
+                version = int(payload)
+                if self._version is None or version > self._version:
+                    self._version = version
+            else:
+                # Reconnected: notifications may have been missed
+                self._checked_at = 0.0
+                self._version = None
+
+
+# Startups, scorings and leaderboards (startup list, leaderboard responses)
+portfolio_version = VersionCounter("portfolio")
@@ -17,7 +17,8 @@ def init_agent_configs():
         "financial_analyzer",
         "market_analyzer",
         "team_analyzer",
-        "risk_predictor"
+        "risk_predictor",
+        "combined_analyzer"
     ]
     
     for agent_name in agent_names:
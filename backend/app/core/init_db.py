@@ -1,11 +1,47 @@
+from sqlalchemy import inspect, text
 from app.core.database import engine, Base
 from app.models import Startup, PitchDocument, Scoring, Comment, AgentConfig
 from app.core.init_agents import init_agent_configs
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Indexes replaced by ones with different columns, dropped on upgrade
+OBSOLETE_INDEXES = [
+    "ix_startup_latest_score_total",
+    "ix_startup_latest_score_industry",
+    "ix_startup_latest_score_stage",
+    "ix_startup_latest_score_geography",
+]
+
+
+def upgrade_schema():
+    """
+    Add columns and indexes introduced after tables were created.
+    create_all only creates missing tables, it never alters existing ones.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                logger.info(f"Added column {table.name}.{column.name}")
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        for index_name in OBSOLETE_INDEXES:
+            conn.execute(text(f'DROP INDEX IF EXISTS {index_name}'))
 
 
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
     print("Database tables created successfully!")
     
     # Initialize agent configurations
@@ -17,4 +53,3 @@ def init_db():
 
 if __name__ == "__main__":
     init_db()
-
@@ -0,0 +1,122 @@
+"""
+Cross-process notifications over Postgres LISTEN/NOTIFY.
+Used to tell every worker and replica that shared in-process state
+(caches, registries) is stale. On other databases notify() is a no-op
+and listeners report themselves as inactive, so callers fall back to
+polling.
+"""
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.database import engine
+import logging
+import select
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Called with the notification payload; payload None means "notifications may have been missed"
+NotificationCallback = Callable[[Optional[str]], None]
+
+
+def notifications_supported() -> bool:
+    """LISTEN/NOTIFY is available only on Postgres"""
+    return engine.dialect.name == "postgresql"
+
+
+def notify(channel: str, payload: str = "") -> None:
+    """
+    Send notification to all listeners of channel
+
+    Args:
+        channel: Channel name
+        payload: Short text payload
+    """
+    if not notifications_supported():
+        return
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+    except Exception as e:
+        logger.warning(f"[Notifications] Failed to notify {channel}: {str(e)}")
+
+
+class NotificationListener:
+    """Background thread holding a dedicated LISTEN connection"""
+
+    def __init__(self, reconnect_delay: Optional[float] = None):
+        self.reconnect_delay = reconnect_delay or settings.NOTIFY_RECONNECT_DELAY
+        self._callbacks: Dict[str, List[NotificationCallback]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._listening = threading.Event()
+
+    @property
+    def is_listening(self) -> bool:
+        """True while notifications are being received"""
+        return self._listening.is_set()
+
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        """Register callback for channel, takes effect on the next (re)connect if already running"""
+        self._callbacks.setdefault(channel, []).append(callback)
+
+    def start(self) -> None:
+        """Start listener thread (does nothing on non-Postgres databases)"""
+        if self._thread or not self._callbacks or not notifications_supported():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop listener thread"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+        self._listening.clear()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.warning(f"[Notifications] Listener connection lost: {str(e)}")
+            self._listening.clear()
+            self._stop_event.wait(self.reconnect_delay)
+
+    def _listen(self) -> None:
+        import psycopg2
+
+        connection = psycopg2.connect(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                for channel in self._callbacks:
+                    cursor.execute(f'LISTEN "{channel}"')
+            self._listening.set()
+            logger.info(f"[Notifications] Listening on {', '.join(self._callbacks)}")
+
+            # Anything sent while we were disconnected is lost
+            for channel in self._callbacks:
+                self._dispatch(channel, None)
+
+            while not self._stop_event.is_set():
+                if select.select([connection], [], [], 1.0) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notification = connection.notifies.pop(0)
+                    self._dispatch(notification.channel, notification.payload)
+        finally:
+            connection.close()
+
+    def _dispatch(self, channel: str, payload: Optional[str]) -> None:
+        for callback in self._callbacks.get(channel, []):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"[Notifications] Callback for {channel} failed: {str(e)}", exc_info=True)
+
+
+notification_listener = NotificationListener()
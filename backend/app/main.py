@@ -1,9 +1,17 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api import startups, pitch_documents, scorings, leaderboard, export, agents
-from app.core.database import engine, Base
+from app.api import startups, pitch_documents, scorings, leaderboard, export, agents, weight_profiles
+from app.core.database import engine, Base, SessionLocal
 from app.core.init_agents import init_agent_configs
+from app.core.init_db import upgrade_schema
+from app.core.notifications import notification_listener
+from app.services.gigachat.client import gigachat_client, async_gigachat_client
+from app.services.scoring.scoring_jobs import scoring_job_runner
+from app.services.scoring.latest_scoring import backfill_latest_scores
+from app.services.parsers.parse_executor import parse_executor
+from app.services.parsers.url_fetcher import url_fetcher
 import logging
 
 # Configure logging
@@ -31,8 +39,16 @@ async def startup_event():
         logger.info("Initializing database...")
         # Create all tables if they don't exist
         Base.metadata.create_all(bind=engine)
+        upgrade_schema()
         logger.info("Database tables created/verified successfully!")
         
+        # Fill leaderboard projection for scorings made before it existed
+        db = SessionLocal()
+        try:
+            backfill_latest_scores(db)
+        finally:
+            db.close()
+        
         # Initialize agent configurations
         try:
             init_agent_configs()
@@ -42,7 +58,41 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
         # Don't fail startup, but log the error
+    
+    # Receive cache invalidations from other workers
+    notification_listener.start()
+    
+    # Start background scoring workers
+    scoring_job_runner.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown"""
+    scoring_job_runner.stop()
+    parse_executor.shutdown()
+    scorings.stream_executor.shutdown(wait=False, cancel_futures=True)
+    await url_fetcher.aclose()
+    notification_listener.stop()
+    gigachat_client.close()
+    await async_gigachat_client.aclose()
+    logger.info("GigaChat HTTP clients closed")
+
+# Multipart fields besides the file (name, industry, ...) and boundaries
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Reject declared bodies above MAX_UPLOAD_SIZE before multipart parsing spools them"""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.MAX_UPLOAD_SIZE + UPLOAD_FORM_OVERHEAD:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Request exceeds maximum upload size of {settings.MAX_UPLOAD_SIZE} bytes"}
+        )
+    return await call_next(request)
 
+# Added last so it wraps the size limit and 413 responses get CORS headers
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -56,6 +106,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
 app.include_router(startups.router)
@@ -64,6 +115,7 @@ app.include_router(scorings.router)
 app.include_router(leaderboard.router)
 app.include_router(export.router)
 app.include_router(agents.router)
+app.include_router(weight_profiles.router)
 
 @app.get("/")
 async def root():
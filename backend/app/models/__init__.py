@@ -3,6 +3,18 @@ from app.models.pitch_document import PitchDocument
 from app.models.scoring import Scoring
 from app.models.comment import Comment
 from app.models.agent_config import AgentConfig
+from app.models.llm_response import CachedLLMResponse
+from app.models.scoring_job import ScoringJob
+from app.models.pitch_lsh_bucket import PitchLSHBucket
+from app.models.agent_result import AgentResult
+from app.models.weight_profile import WeightProfile, ProfileRanking
+from app.models.startup_latest_score import StartupLatestScore
+from app.models.data_version import DataVersion
+from app.models.parsed_document import CachedParse
 
-__all__ = ["Startup", "PitchDocument", "Scoring", "Comment", "AgentConfig"]
+__all__ = [
+    "Startup", "PitchDocument", "Scoring", "Comment", "AgentConfig",
+    "CachedLLMResponse", "ScoringJob", "PitchLSHBucket", "AgentResult",
+    "WeightProfile", "ProfileRanking", "StartupLatestScore", "DataVersion", "CachedParse",
+]
 
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class AgentResult(Base):
+    """Result of one agent within a scoring, with the input it was computed from"""
+    __tablename__ = "agent_results"
+
+    id = Column(Integer, primary_key=True, index=True)
+    scoring_id = Column(Integer, ForeignKey("scorings.id", ondelete="CASCADE"), nullable=False, index=True)
+    agent_name = Column(String, nullable=False)
+    input_hash = Column(String(64), nullable=False)  # Hash of normalized text the agent received
+    config_version = Column(String, nullable=False)  # Agent config version (see AgentConfigRegistry)
+    result = Column(JSON, nullable=False)  # Parsed agent result
+    raw_responses = Column(JSON, nullable=True)  # Raw model responses, one per call (chunk)
+    latency = Column(Float, nullable=True)  # Seconds
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+    total_tokens = Column(Integer, nullable=True)
+    failed = Column(Boolean, default=False)  # Fallback result of a failed call, never reused
+    reused_from_id = Column(Integer, nullable=True)  # AgentResult copied instead of calling the agent
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    scoring = relationship("Scoring", back_populates="agent_results")
+
+    __table_args__ = (
+        # Lookup of a reusable result for unchanged agent input
+        Index("ix_agent_results_lookup", "agent_name", "input_hash", "config_version", "created_at"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class CachedParse(Base):
+    """Pages extracted from an uploaded file by a given parser version"""
+    __tablename__ = "parse_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_hash = Column(String(64), nullable=False)  # SHA-256 of the uploaded file
+    parser_type = Column(String, nullable=False)  # Parser class name
+    parser_version = Column(String, nullable=False)
+    pages = Column(JSON, nullable=False)  # Text of each page/slide
+    text_length = Column(Integer, nullable=False)
+    parse_seconds = Column(Float, nullable=True)  # Time the original parse took
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        Index("ix_parse_cache_key", "file_hash", "parser_type", "parser_version", unique=True),
+    )
@@ -10,17 +10,24 @@ class PitchDocument(Base):
     id = Column(Integer, primary_key=True, index=True)
     startup_id = Column(Integer, ForeignKey("startups.id"), nullable=False, index=True)
     file_path = Column(String, nullable=True)
+    file_size = Column(Integer, nullable=True)  # Bytes of the uploaded file
+    file_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded file
     content_type = Column(String, nullable=False)  # pdf, text, url, markdown, pptx
     source_type = Column(String, nullable=False)  # file or url
     extracted_text = Column(Text, nullable=True)
+    page_offsets = Column(JSON, nullable=True)  # Offset of each page/slide in extracted_text
     edited_text = Column(Text, nullable=True)
     is_edited = Column(Boolean, default=False)
     missing_info = Column(JSON, nullable=True)  # List of missing information
+    sections = Column(JSON, nullable=True)  # Text split into tagged sections (team, market, ...)
+    content_hash = Column(String(64), nullable=True, index=True)  # Hash of normalized text_content
+    minhash = Column(JSON, nullable=True)  # MinHash signature of text_content for near-duplicate search
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     startup = relationship("Startup", back_populates="pitch_documents")
+    lsh_buckets = relationship("PitchLSHBucket", back_populates="pitch_document", cascade="all, delete-orphan")
 
     @property
     def text_content(self):
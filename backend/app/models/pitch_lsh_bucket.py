@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+
+class PitchLSHBucket(Base):
+    """LSH band bucket of a pitch document's MinHash signature"""
+    __tablename__ = "pitch_lsh_buckets"
+
+    id = Column(Integer, primary_key=True, index=True)
+    pitch_document_id = Column(Integer, ForeignKey("pitch_documents.id", ondelete="CASCADE"), nullable=False, index=True)
+    bucket = Column(String(16), nullable=False, index=True)  # Hash of band number and band values
+
+    # Relationships
+    pitch_document = relationship("PitchDocument", back_populates="lsh_buckets")
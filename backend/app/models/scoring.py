@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -14,9 +14,22 @@ class Scoring(Base):
     risks = Column(JSON, nullable=False)  # Top 5 risks
     recommendations = Column(JSON, nullable=False)  # Recommendations
     team_info = Column(JSON, nullable=True)  # Team information from team_analyzer
+    content_hash = Column(String(64), nullable=True)  # Hash of normalized pitch text that was scored
+    config_fingerprint = Column(String(64), nullable=True)  # Hash of scoring mode and agent config versions
+    config_versions = Column(JSON, nullable=True)  # Agent config versions used
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     startup = relationship("Startup", back_populates="scorings")
     comments = relationship("Comment", back_populates="scoring", cascade="all, delete-orphan")
+    agent_results = relationship("AgentResult", back_populates="scoring", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Lookup of a reusable scoring for identical text and configs
+        Index("ix_scorings_content_hash_config", "content_hash", "config_fingerprint", "created_at"),
+        # Latest scoring per startup (startup list, leaderboard, what-if)
+        Index("ix_scorings_startup_latest", startup_id, created_at.desc()),
+        # Newest-first scoring list with keyset pagination
+        Index("ix_scorings_created", created_at.desc(), id.desc()),
+    )
 
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class ScoringJob(Base):
+    __tablename__ = "scoring_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    startup_id = Column(Integer, ForeignKey("startups.id"), nullable=False, index=True)
+    pitch_document_id = Column(Integer, ForeignKey("pitch_documents.id", ondelete="SET NULL"), nullable=True)
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+    options = Column(JSON, nullable=True)  # Scoring options passed by the client
+    progress = Column(JSON, nullable=True)  # Per-agent progress of the running job
+    scoring_id = Column(Integer, ForeignKey("scorings.id", ondelete="SET NULL"), nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    worker_id = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)  # Last heartbeat of the running job
+
+    # Relationships
+    startup = relationship("Startup", back_populates="scoring_jobs")
+
+    # Workers claim the oldest queued job
+    __table_args__ = (Index("ix_scoring_jobs_status_created", "status", "created_at"),)
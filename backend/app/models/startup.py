@@ -17,4 +17,6 @@ class Startup(Base):
     # Relationships
     pitch_documents = relationship("PitchDocument", back_populates="startup", cascade="all, delete-orphan")
     scorings = relationship("Scoring", back_populates="startup", cascade="all, delete-orphan")
+    scoring_jobs = relationship("ScoringJob", back_populates="startup", cascade="all, delete-orphan")
+    latest_score = relationship("StartupLatestScore", back_populates="startup", uselist=False, cascade="all, delete-orphan")
 
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class StartupLatestScore(Base):
+    """
+    Latest scoring of each startup with its filter attributes (leaderboard projection).
+    Maintained in the same transaction as scorings and startups, see refresh_latest_score.
+    """
+    __tablename__ = "startup_latest_score"
+
+    startup_id = Column(Integer, ForeignKey("startups.id", ondelete="CASCADE"), primary_key=True)
+    scoring_id = Column(Integer, ForeignKey("scorings.id", ondelete="CASCADE"), nullable=False)
+    total_score = Column(Float, nullable=False)
+    breakdown = Column(JSON, nullable=False)  # Scores by category
+    industry = Column(String, nullable=True)
+    stage = Column(String, nullable=True)
+    geography = Column(String, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    startup = relationship("Startup", back_populates="latest_score")
+
+    # Leaderboard: top scores overall or within one filter value, in keyset order (score, startup id)
+    __table_args__ = (
+        Index("ix_startup_latest_score_rank", total_score.desc(), startup_id.desc()),
+        Index("ix_startup_latest_score_industry_rank", industry, total_score.desc(), startup_id.desc()),
+        Index("ix_startup_latest_score_stage_rank", stage, total_score.desc(), startup_id.desc()),
+        Index("ix_startup_latest_score_geography_rank", geography, total_score.desc(), startup_id.desc()),
+    )
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class WeightProfile(Base):
+    """Named set of category weights for ranking the portfolio (e.g. team-heavy)"""
+    __tablename__ = "weight_profiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False, unique=True, index=True)
+    description = Column(Text, nullable=True)
+    weights = Column(JSON, nullable=False)  # Category -> weight, normalized to sum 1 when applied
+    ranked_at = Column(DateTime(timezone=True), nullable=True)  # When rankings were last persisted
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    rankings = relationship("ProfileRanking", back_populates="profile", cascade="all, delete-orphan")
+
+
+class ProfileRanking(Base):
+    """Persisted portfolio ranking under a weight profile (alternate leaderboard)"""
+    __tablename__ = "profile_rankings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    profile_id = Column(Integer, ForeignKey("weight_profiles.id", ondelete="CASCADE"), nullable=False)
+    startup_id = Column(Integer, ForeignKey("startups.id", ondelete="CASCADE"), nullable=False, index=True)
+    scoring_id = Column(Integer, ForeignKey("scorings.id", ondelete="CASCADE"), nullable=False)
+    total_score = Column(Float, nullable=False)
+    rank = Column(Integer, nullable=False)
+
+    # Relationships
+    profile = relationship("WeightProfile", back_populates="rankings")
+    startup = relationship("Startup")
+
+    # Leaderboard reads a profile's ranking in rank order
+    __table_args__ = (Index("ix_profile_rankings_profile_rank", "profile_id", "rank"),)
@@ -1,14 +1,22 @@
-from app.schemas.startup import StartupCreate, StartupResponse, StartupUpdate
-from app.schemas.pitch_document import PitchDocumentCreate, PitchDocumentResponse, PitchDocumentUpdate
-from app.schemas.scoring import ScoringCreate, ScoringResponse
+from app.schemas.startup import StartupCreate, StartupResponse, StartupUpdate, FacetValue, StartupFacetsResponse
+from app.schemas.pitch_document import PitchDocumentCreate, PitchDocumentResponse, PitchDocumentUpdate, NearDuplicateResponse
+from app.schemas.scoring import ScoringCreate, ScoringResponse, AgentResultResponse, ReaggregationResponse
+from app.schemas.scoring_job import ScoringJobResponse
 from app.schemas.comment import CommentCreate, CommentResponse
 from app.schemas.agent_config import AgentConfigResponse, AgentConfigUpdate
+from app.schemas.weight_profile import (
+    WeightProfileCreate, WeightProfileResponse, WeightProfileUpdate,
+    WhatIfRequest, WhatIfResponse, WhatIfEntry,
+)
 
 __all__ = [
-    "StartupCreate", "StartupResponse", "StartupUpdate",
-    "PitchDocumentCreate", "PitchDocumentResponse", "PitchDocumentUpdate",
-    "ScoringCreate", "ScoringResponse",
+    "StartupCreate", "StartupResponse", "StartupUpdate", "FacetValue", "StartupFacetsResponse",
+    "PitchDocumentCreate", "PitchDocumentResponse", "PitchDocumentUpdate", "NearDuplicateResponse",
+    "ScoringCreate", "ScoringResponse", "AgentResultResponse", "ReaggregationResponse",
+    "ScoringJobResponse",
     "CommentCreate", "CommentResponse",
     "AgentConfigResponse", "AgentConfigUpdate",
+    "WeightProfileCreate", "WeightProfileResponse", "WeightProfileUpdate",
+    "WhatIfRequest", "WhatIfResponse", "WhatIfEntry",
 ]
 
@@ -24,6 +24,8 @@ class PitchDocumentResponse(PitchDocumentBase):
     id: int
     startup_id: int
     file_path: Optional[str]
+    file_size: Optional[int] = None
+    file_hash: Optional[str] = None
     extracted_text: Optional[str]
     edited_text: Optional[str]
     is_edited: bool
@@ -34,3 +36,11 @@ class PitchDocumentResponse(PitchDocumentBase):
     class Config:
         from_attributes = True
 
+
+
+class NearDuplicateResponse(BaseModel):
+    pitch_document_id: int
+    startup_id: int
+    startup_name: Optional[str]
+    similarity: float  # Estimated Jaccard similarity, 0-1
+    created_at: datetime
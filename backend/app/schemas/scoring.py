@@ -24,3 +24,27 @@ class ScoringResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class AgentResultResponse(BaseModel):
+    id: int
+    scoring_id: int
+    agent_name: str
+    result: Dict[str, Any]
+    raw_responses: Optional[List[str]] = None
+    config_version: str
+    latency: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    failed: Optional[bool] = None
+    reused_from_id: Optional[int] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ReaggregationResponse(BaseModel):
+    updated: int
+    unchanged: int
+    skipped: int
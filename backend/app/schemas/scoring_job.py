@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+
+class ScoringJobResponse(BaseModel):
+    id: int
+    startup_id: int
+    pitch_document_id: Optional[int]
+    status: str
+    progress: Optional[Dict[str, Any]] = None
+    scoring_id: Optional[int] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class StartupBase(BaseModel):
@@ -28,3 +28,18 @@ class StartupResponse(StartupBase):
     class Config:
         from_attributes = True
 
+
+
+class FacetValue(BaseModel):
+    value: Optional[str] = None  # None groups startups without the attribute
+    count: int
+    scored: int  # Startups with at least one scoring
+    avg_score: Optional[float] = None  # Over latest scores
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+
+
+class StartupFacetsResponse(BaseModel):
+    industry: List[FacetValue]
+    stage: List[FacetValue]
+    geography: List[FacetValue]
@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class WeightProfileBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+    weights: Dict[str, float]
+
+
+class WeightProfileCreate(WeightProfileBase):
+    pass
+
+
+class WeightProfileUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    weights: Optional[Dict[str, float]] = None
+
+
+class WeightProfileResponse(WeightProfileBase):
+    id: int
+    ranked_at: Optional[datetime]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class WhatIfRequest(BaseModel):
+    profile: Optional[str] = None  # Name of stored profile
+    weights: Optional[Dict[str, float]] = None  # Ad-hoc weights, used if profile is not given
+    limit: int = Field(50, ge=1, le=1000)
+    industry: Optional[str] = None
+    stage: Optional[str] = None
+    geography: Optional[str] = None
+    persist: bool = False  # Store ranking of the whole portfolio as the profile's leaderboard
+
+
+class WhatIfEntry(BaseModel):
+    rank: int
+    startup: Dict[str, Any]
+    score: float
+    baseline_rank: int
+    baseline_score: float
+    rank_change: int  # Positive when the startup moves up
+    scoring_id: int
+
+
+class WhatIfResponse(BaseModel):
+    profile: Optional[str]
+    weights: Dict[str, float]  # Normalized weights applied
+    total: int  # Startups ranked
+    persisted: bool
+    results: List[WhatIfEntry]
@@ -1,4 +1,4 @@
 from app.services.agents.base.mcp_agent import MCPAgent
+from app.services.agents.config_registry import AgentConfigRegistry, agent_config_registry
 
-__all__ = ["MCPAgent"]
-
+__all__ = ["MCPAgent", "AgentConfigRegistry", "agent_config_registry"]
@@ -1,4 +1,4 @@
 from app.services.agents.base.mcp_agent import MCPAgent
+from app.services.agents.base.call_log import AgentCallLog, capture_calls
 
-__all__ = ["MCPAgent"]
-
+__all__ = ["MCPAgent", "AgentCallLog", "capture_calls"]
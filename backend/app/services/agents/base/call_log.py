@@ -0,0 +1,63 @@
+"""
+Collects raw responses and token usage of GigaChat calls made while an
+agent runs. The active log is held in a context variable so agents don't
+need to pass it around; threads started for chunks must run in a copy of
+the caller's context (contextvars.copy_context) to record into it.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+import threading
+
+
+class AgentCallLog:
+    """Raw responses and token usage of one agent run"""
+
+    def __init__(self):
+        self.raw_responses: List[str] = []
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.calls = 0
+        self.cached_calls = 0
+        self._lock = threading.Lock()
+
+    def record(self, content: str, usage: Optional[Dict[str, Any]] = None, cached: bool = False) -> None:
+        """
+        Record one model response
+
+        Args:
+            content: Raw message content
+            usage: Usage block of the API response (prompt_tokens, completion_tokens, total_tokens)
+            cached: Response came from the response cache, no tokens were spent
+        """
+        usage = usage or {}
+        with self._lock:
+            self.raw_responses.append(content)
+            self.calls += 1
+            if cached:
+                self.cached_calls += 1
+            self.prompt_tokens += usage.get("prompt_tokens") or 0
+            self.completion_tokens += usage.get("completion_tokens") or 0
+            self.total_tokens += usage.get("total_tokens") or 0
+
+
+_current_call_log: ContextVar[Optional[AgentCallLog]] = ContextVar("agent_call_log", default=None)
+
+
+@contextmanager
+def capture_calls() -> Iterator[AgentCallLog]:
+    """Record model calls made within the block into a new AgentCallLog"""
+    call_log = AgentCallLog()
+    token = _current_call_log.set(call_log)
+    try:
+        yield call_log
+    finally:
+        _current_call_log.reset(token)
+
+
+def record_call(content: str, usage: Optional[Dict[str, Any]] = None, cached: bool = False) -> None:
+    """Record model response into the active call log, if any"""
+    call_log = _current_call_log.get()
+    if call_log is not None:
+        call_log.record(content, usage, cached)
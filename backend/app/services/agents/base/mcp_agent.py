@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-from app.models import AgentConfig
-import yaml
-import os
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from app.core.config import settings
+from app.services.agents.base.call_log import record_call
+from app.services.agents.config_registry import agent_config_registry
+from app.services.analysis.chunking import chunk_text, estimate_tokens
+from app.services.gigachat.auth import token_provider
+from app.services.gigachat.client import gigachat_client
+from app.services.gigachat.response_cache import response_cache
+import requests
+import json
 import logging
+import threading
 import urllib3
 
 # Disable SSL warnings
@@ -13,244 +21,226 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Details of fallback results of failed agent or model calls
+FAILED_RESULT_MARKERS = ("Agent error:", "Error calling GigaChat")
+
 
 class MCPAgent(ABC):
     """Base class for MCP agents"""
     
-    def __init__(self, db: Session, agent_name: str):
-        self.db = db
+    # Pitch sections the agent needs (see SectionSegmenter), None means the whole document
+    SECTIONS: Optional[List[str]] = None
+    
+    def __init__(self, agent_name: str):
         self.agent_name = agent_name
-        self.config = self._load_config()
+        # Fresh model response of the last call on each thread, cached once the agent parsed it
+        self._uncached = threading.local()
     
-    def _load_config(self) -> Dict[str, Any]:
-        """Load agent configuration from DB or YAML"""
-        # Try to load from DB first
-        db_config = self.db.query(AgentConfig).filter(
-            AgentConfig.agent_name == self.agent_name
-        ).first()
-        
-        if db_config and db_config.is_active:
-            return {
-                "model": db_config.model,
-                "system_prompt": db_config.system_prompt,
-                "prompts": db_config.prompts,
-                "temperature": db_config.temperature,
-                "max_tokens": db_config.max_tokens,
-                "mcp_server_config": db_config.mcp_server_config or {}
-            }
-        
-        # Fallback to YAML
-        config_path = os.path.join(
-            "app", "services", "agents", self.agent_name, "config.yaml"
-        )
-        
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        
-        # Default config
-        return {
-            "model": "GigaChat-Pro",
-            "system_prompt": "You are an AI assistant analyzing startup pitches.",
-            "prompts": {},
-            "temperature": 0.7,
-            "max_tokens": 2000,
-            "mcp_server_config": {}
-        }
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current agent configuration (from the in-process registry, reloaded when it changes)"""
+        return agent_config_registry.get(self.agent_name)
     
     @abstractmethod
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def analyze(self, text: str, force: bool = False) -> Dict[str, Any]:
         """
         Analyze text and return results
         
         Args:
             text: Text to analyze
+            force: Call the model even if the response cache has the response
             
         Returns:
             Dictionary with analysis results including 'score' key
         """
         pass
     
-    def _call_mcp(self, prompt: str) -> str:
+    def relevant_text(self, document_sections: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Text of the document sections the agent needs, None if routing doesn't apply"""
+        if not self.SECTIONS or not document_sections:
+            return None
+        sections = document_sections.get("sections") or {}
+        parts = [sections[name] for name in self.SECTIONS if sections.get(name)]
+        return "\n\n".join(dict.fromkeys(parts)) or None
+    
+    def select_input(self, text: str, document_sections: Optional[Dict[str, Any]]) -> str:
+        """
+        Build agent input from the relevant sections of the document
+        
+        Args:
+            text: Full document text
+            document_sections: Output of SectionSegmenter.segment()
+            
+        Returns:
+            Global summary plus relevant sections, or full text if routing doesn't apply
+        """
+        relevant = self.relevant_text(document_sections)
+        if relevant is None:
+            # Nothing relevant found - let the agent see everything
+            return text
+        
+        routed = "Краткое содержание питча:\n{summary}\n\nРелевантные разделы:\n\n{sections}".format(
+            summary=document_sections.get("summary", ""),
+            sections=relevant
+        )
+        if len(routed) >= len(text):
+            return text
+        logger.info(f"[{self.agent_name}] Routed {len(routed)} of {len(text)} chars (sections: {', '.join(self.SECTIONS)})")
+        return routed
+    
+    def analyze_document(self, text: str, force: bool = False) -> Dict[str, Any]:
+        """
+        Analyze document of any length
+        
+        Documents above the agent's token budget are split into overlapping chunks on
+        page/slide boundaries, analyzed in parallel and merged back into one result.
+        
+        Args:
+            text: Document text
+            force: Call the model even if the response cache has the response
+            
+        Returns:
+            Dictionary with analysis results including 'score' key
+        """
+        max_tokens, overlap_tokens = self._chunk_budget()
+        chunks = chunk_text(text, max_tokens, overlap_tokens)
+        if len(chunks) == 1:
+            return self.analyze(text, force=force)
+        
+        logger.info(
+            f"[{self.agent_name}] Document (~{estimate_tokens(text)} tokens) split into "
+            f"{len(chunks)} chunks of up to {max_tokens} tokens"
+        )
+        max_workers = max(1, min(settings.SCORING_CHUNK_CONCURRENCY, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.agent_name}-chunk") as executor:
+            # Each chunk runs in a copy of the caller's context so its calls are recorded in the agent's call log
+            futures = [executor.submit(copy_context().run, self.analyze, chunk, force) for chunk in chunks]
+            partials = [future.result() for future in futures]
+        return self.merge_results(partials, [len(chunk) for chunk in chunks])
+    
+    def merge_results(self, partials: List[Dict[str, Any]], weights: List[float]) -> Dict[str, Any]:
+        """
+        Reduce per-chunk results into one result
+        
+        Numbers are averaged weighted by chunk size, lists are concatenated without
+        duplicates, details are joined and other strings take the first meaningful value.
+        Chunks whose call failed or whose response couldn't be parsed are left out;
+        if every chunk failed, the failure is returned.
+        
+        Args:
+            partials: Results of analyze() for each chunk
+            weights: Relative size of each chunk
+            
+        Returns:
+            Merged result
+        """
+        defaults = self.default_result()
+        succeeded = [
+            (partial, weight) for partial, weight in zip(partials, weights)
+            if not self.is_failed(partial)
+        ]
+        if not succeeded:
+            failures = [partial for partial in partials if self.is_failed_result(partial)]
+            return failures[0] if failures else partials[0]
+        if len(succeeded) < len(partials):
+            logger.warning(f"[{self.agent_name}] {len(partials) - len(succeeded)} of {len(partials)} chunks failed, merging the rest")
+        partials = [partial for partial, _ in succeeded]
+        weights = [weight for _, weight in succeeded]
+        
+        merged: Dict[str, Any] = {}
+        for key in {key for partial in partials for key in partial}:
+            values = [(partial[key], weight) for partial, weight in zip(partials, weights) if key in partial]
+            first = values[0][0]
+            if isinstance(first, (int, float)) and not isinstance(first, bool):
+                numbers = [(value, weight) for value, weight in values if isinstance(value, (int, float))]
+                total_weight = sum(weight for _, weight in numbers) or 1
+                merged[key] = round(sum(value * weight for value, weight in numbers) / total_weight, 2)
+            elif isinstance(first, list):
+                merged[key] = self._merge_lists([value for value, _ in values])
+            elif key == "details":
+                merged[key] = " ".join(dict.fromkeys(str(value) for value, _ in values if value))
+            else:
+                meaningful = [value for value, _ in values if value and value != defaults.get(key)]
+                merged[key] = meaningful[0] if meaningful else first
+        return self.parse_result(merged)
+    
+    @staticmethod
+    def is_failed_result(result: Dict[str, Any]) -> bool:
+        """Fallback result returned when the agent or model call failed"""
+        details = str(result.get("details", ""))
+        return any(marker in details for marker in FAILED_RESULT_MARKERS)
+    
+    def is_failed(self, result: Dict[str, Any]) -> bool:
+        """Result of a failed call or of a model response that couldn't be parsed, must not be reused"""
+        return self.is_failed_result(result) or result == self.default_result()
+    
+    @staticmethod
+    def _merge_lists(lists: List[List[Any]]) -> List[Any]:
+        """Concatenate lists, dropping duplicates (items with description are compared by it)"""
+        merged = []
+        seen = set()
+        for items in lists:
+            for item in items:
+                if isinstance(item, dict) and "description" in item:
+                    key = str(item["description"]).strip().lower()
+                else:
+                    key = json.dumps(item, ensure_ascii=False, sort_keys=True, default=str)
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(item)
+        return merged
+    
+    def _chunk_budget(self) -> Tuple[int, int]:
+        """Chunk size and overlap in tokens, overridable per agent via mcp_server_config"""
+        mcp_server_config = self.config.get("mcp_server_config") or {}
+        max_tokens = mcp_server_config.get("chunk_tokens") or settings.SCORING_CHUNK_TOKENS
+        overlap_tokens = mcp_server_config.get("chunk_overlap_tokens", settings.SCORING_CHUNK_OVERLAP_TOKENS)
+        return max_tokens, overlap_tokens
+    
+    def parse_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize parsed model response to the agent's result fields
+        
+        Args:
+            result: JSON object returned by the model
+            
+        Returns:
+            Result dict with all agent fields filled in
+        """
+        return {
+            "score": result.get("score", 50.0),
+            "details": result.get("details", "Analysis completed")
+        }
+    
+    def default_result(self) -> Dict[str, Any]:
+        """Result used when the model response can't be parsed"""
+        return self.parse_result({"details": "Analysis completed with default scores"})
+    
+    def _use_response_cache(self) -> bool:
+        """Agents can opt out of response caching with mcp_server_config.response_cache: false"""
+        mcp_server_config = self.config.get("mcp_server_config") or {}
+        return mcp_server_config.get("response_cache", True)
+    
+    def _call_mcp(self, prompt: str, force: bool = False) -> str:
         """
         Call MCP server for this agent (or directly GigaChat API)
         
         Args:
             prompt: Prompt to send to MCP server
+            force: Skip the response cache lookup; the fresh response still replaces the cached one
             
         Returns:
-            Response from MCP server
+            Response from MCP server. A fresh response is cached only after the agent
+            parsed it and called _cache_response.
         """
+        self._uncached.response = None
         # For now, call GigaChat API directly
         # In production, this would call the agent's MCP server
         try:
-            import requests
-            from app.core.config import settings
-            
             logger.info(f"[{self.agent_name}] Starting GigaChat API call")
             logger.info(f"[{self.agent_name}] System prompt: {self.config.get('system_prompt', '')[:100]}...")
             logger.info(f"[{self.agent_name}] User prompt length: {len(prompt)} chars")
             
-            # Get token
-            auth_url = settings.GIGACHAT_AUTH_URL
-            api_key = settings.GIGACHAT_API_KEY
-            
-            if not api_key:
-                logger.error(f"[{self.agent_name}] GIGACHAT_API_KEY not configured")
-                raise ValueError("GIGACHAT_API_KEY not configured")
-            
-            logger.info(f"[{self.agent_name}] Requesting access token from {auth_url}")
-            logger.info(f"[{self.agent_name}] API Key length: {len(api_key) if api_key else 0} chars")
-            logger.info(f"[{self.agent_name}] API Key preview: {api_key[:30]}..." if api_key and len(api_key) > 30 else (api_key if api_key else "API Key is None"))
-            
-            # Try to decode base64 to see what's inside (for debugging)
-            try:
-                import base64
-                # Try to decode with padding
-                for padding in ['', '=', '==', '===']:
-                    try:
-                        decoded = base64.b64decode(api_key + padding)
-                        decoded_str = decoded.decode('utf-8', errors='ignore')
-                        logger.info(f"[{self.agent_name}] API Key decoded (first 100 chars): {decoded_str[:100]}")
-                        # Check if it contains colon (ClientID:ClientSecret format)
-                        if ':' in decoded_str:
-                            parts = decoded_str.split(':', 1)
-                            logger.info(f"[{self.agent_name}] API Key appears to be base64(ClientID:ClientSecret)")
-                            logger.info(f"[{self.agent_name}] ClientID preview: {parts[0][:20]}..., ClientSecret preview: {parts[1][:20] if len(parts) > 1 else 'N/A'}...")
-                        break
-                    except:
-                        continue
-            except Exception as e:
-                logger.warning(f"[{self.agent_name}] Could not decode API key as base64: {str(e)}")
-            
-            # Check if API key is already an access token (R-M-... format)
-            # If it starts with R-M-, we can use it directly without getting a new token
-            token = None
-            if api_key and (api_key.startswith("R-M-") or api_key.startswith("R-")):
-                logger.info(f"[{self.agent_name}] API key appears to be an access token (R-M- format), using directly")
-                token = api_key
-            else:
-                # Request token - GigaChat API format
-                # According to GigaChat docs, the request should be:
-                # POST with Authorization: Basic {base64_encoded_credentials} header
-                # where credentials = ClientID:ClientSecret encoded in base64
-                # and scope in the body as form-urlencoded data
-                token_response = None
-                
-                try:
-                    import base64
-                    logger.info(f"[{self.agent_name}] Trying format 1: Basic auth with form-urlencoded")
-                    
-                    # API key should be base64(ClientID:ClientSecret)
-                    # Use it directly with "Basic " prefix
-                    auth_header = f"Basic {api_key}" if not api_key.startswith("Basic ") else api_key
-                    logger.info(f"[{self.agent_name}] Authorization header: {auth_header[:50]}...")
-                    
-                    # Use dictionary for form data - requests will encode it properly
-                    # GigaChat API requires RqUID header (unique request ID in UUID4 format)
-                    import uuid
-                    rquid = str(uuid.uuid4())
-                    logger.info(f"[{self.agent_name}] Generated RqUID: {rquid}")
-                    
-                    token_response = requests.post(
-                        auth_url,
-                        data={"scope": "GIGACHAT_API_PERS"},
-                        headers={
-                            "Authorization": auth_header,
-                            "Content-Type": "application/x-www-form-urlencoded",
-                            "Accept": "application/json",
-                            "RqUID": rquid
-                        },
-                        verify=False,
-                        timeout=10
-                    )
-                    logger.info(f"[{self.agent_name}] Format 1 response status: {token_response.status_code}")
-                    logger.info(f"[{self.agent_name}] Format 1 response headers: {dict(token_response.headers)}")
-                    logger.info(f"[{self.agent_name}] Format 1 response body (full): {token_response.text}")
-                    
-                    if token_response.status_code == 200:
-                        try:
-                            response_json = token_response.json()
-                            token = response_json.get("access_token")
-                            if token:
-                                logger.info(f"[{self.agent_name}] Access token received (format 1). Token length: {len(token)} chars")
-                        except Exception as e:
-                            logger.error(f"[{self.agent_name}] Failed to parse JSON response: {str(e)}")
-                            logger.error(f"[{self.agent_name}] Response text: {token_response.text}")
-                    elif token_response.status_code == 400:
-                        # Try alternative: without explicit Content-Type but with RqUID
-                        logger.info(f"[{self.agent_name}] Got 400, trying without explicit Content-Type")
-                        import uuid
-                        rquid = str(uuid.uuid4())
-                        token_response = requests.post(
-                            auth_url,
-                            data={"scope": "GIGACHAT_API_PERS"},
-                            headers={
-                                "Authorization": auth_header,
-                                "Accept": "application/json",
-                                "RqUID": rquid
-                            },
-                            verify=False,
-                            timeout=10
-                        )
-                        logger.info(f"[{self.agent_name}] Alternative response status: {token_response.status_code}")
-                        logger.info(f"[{self.agent_name}] Alternative response body: {token_response.text}")
-                        if token_response.status_code == 200:
-                            try:
-                                response_json = token_response.json()
-                                token = response_json.get("access_token")
-                                if token:
-                                    logger.info(f"[{self.agent_name}] Access token received (alternative). Token length: {len(token)} chars")
-                            except Exception as e:
-                                logger.error(f"[{self.agent_name}] Failed to parse JSON response: {str(e)}")
-                except Exception as e:
-                    logger.warning(f"[{self.agent_name}] Format 1 failed: {str(e)}", exc_info=True)
-                
-                # Try format 2: Bearer token (in case API key is actually a token)
-                if not token:
-                    try:
-                        logger.info(f"[{self.agent_name}] Trying format 2: Bearer token")
-                        token_response = requests.post(
-                            auth_url,
-                            data={"scope": "GIGACHAT_API_PERS"},
-                            headers={
-                                "Authorization": f"Bearer {api_key}",
-                                "Content-Type": "application/x-www-form-urlencoded",
-                                "Accept": "application/json"
-                            },
-                            verify=False,
-                            timeout=10
-                        )
-                        logger.info(f"[{self.agent_name}] Format 2 response status: {token_response.status_code}")
-                        logger.info(f"[{self.agent_name}] Format 2 response body (full): {token_response.text}")
-                        
-                        if token_response.status_code == 200:
-                            try:
-                                response_json = token_response.json()
-                                token = response_json.get("access_token")
-                                if token:
-                                    logger.info(f"[{self.agent_name}] Access token received (format 2). Token length: {len(token)} chars")
-                            except Exception as e:
-                                logger.error(f"[{self.agent_name}] Failed to parse JSON response: {str(e)}")
-                    except Exception as e:
-                        logger.warning(f"[{self.agent_name}] Format 2 failed: {str(e)}")
-                
-                if not token:
-                    # Last resort: try using API key directly as access token
-                    logger.warning(f"[{self.agent_name}] Failed to get access token via OAuth. Trying to use API key directly as token...")
-                    logger.warning(f"[{self.agent_name}] Last response: {token_response.status_code if token_response else 'N/A'} - {token_response.text[:500] if token_response and token_response.text else 'No response body'}")
-                    if token_response:
-                        logger.warning(f"[{self.agent_name}] Response headers: {dict(token_response.headers)}")
-                    # Use API key as token (might work if it's already a valid token)
-                    token = api_key
-                    logger.info(f"[{self.agent_name}] Using API key directly as access token (fallback mode)")
-            
-            # Call GigaChat
-            url = "https://gigachat.devices.sberbank.ru/api/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "model": self.config.get("model", "GigaChat-Pro"),
                 "messages": [
@@ -261,11 +251,35 @@ class MCPAgent(ABC):
                 "max_tokens": self.config.get("max_tokens", 2000)
             }
             
-            logger.info(f"[{self.agent_name}] Calling GigaChat API: {url}")
+            cache_key = None
+            if self._use_response_cache():
+                cache_key = response_cache.make_key(
+                    data["model"],
+                    data["messages"][0]["content"],
+                    prompt,
+                    data["temperature"],
+                    data["max_tokens"]
+                )
+                cached = None if force else response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"[{self.agent_name}] Response served from cache ({len(cached)} chars)")
+                    record_call(cached, cached=True)
+                    return cached
+            
+            # Token is cached process-wide and refreshed only shortly before expiry
+            token = token_provider.get_token()
+            
+            # Call GigaChat
+            logger.info(f"[{self.agent_name}] Calling GigaChat API: {gigachat_client.base_url}")
             logger.info(f"[{self.agent_name}] Model: {data['model']}, Temperature: {data['temperature']}, Max tokens: {data['max_tokens']}")
             logger.info(f"[{self.agent_name}] Request payload: {str(data)[:500]}...")
             
-            response = requests.post(url, json=data, headers=headers, verify=False, timeout=30)
+            response = gigachat_client.chat_completion(data, token)
+            if response.status_code == 401:
+                # Token was revoked or expired earlier than announced - refresh once and retry
+                logger.warning(f"[{self.agent_name}] GigaChat rejected access token, refreshing")
+                token_provider.invalidate(token)
+                response = gigachat_client.chat_completion(data, token_provider.get_token())
             response.raise_for_status()
             
             result = response.json()
@@ -276,6 +290,10 @@ class MCPAgent(ABC):
             logger.info(f"[{self.agent_name}] Response preview: {content[:200]}...")
             logger.info(f"[{self.agent_name}] Full response: {content}")
             
+            if cache_key:
+                self._uncached.response = (cache_key, content, data["model"])
+            record_call(content, result.get("usage"))
+            
             return content
         except requests.exceptions.RequestException as e:
             logger.error(f"[{self.agent_name}] GigaChat API request error: {str(e)}")
@@ -283,13 +301,21 @@ class MCPAgent(ABC):
                 logger.error(f"[{self.agent_name}] Response status: {e.response.status_code}")
                 logger.error(f"[{self.agent_name}] Response body: {e.response.text[:500]}")
             # Fallback to placeholder if API call fails
-            error_msg = f'{{"score": 50.0, "details": "Error calling GigaChat: {str(e)}"}}'
+            error_msg = json.dumps({"score": 50.0, "details": f"Error calling GigaChat: {str(e)}"}, ensure_ascii=False)
             logger.warning(f"[{self.agent_name}] Returning fallback response: {error_msg}")
             return error_msg
         except Exception as e:
             logger.error(f"[{self.agent_name}] Unexpected error: {str(e)}", exc_info=True)
             # Fallback to placeholder if API call fails
-            error_msg = f'{{"score": 50.0, "details": "Error calling GigaChat: {str(e)}"}}'
+            error_msg = json.dumps({"score": 50.0, "details": f"Error calling GigaChat: {str(e)}"}, ensure_ascii=False)
             logger.warning(f"[{self.agent_name}] Returning fallback response: {error_msg}")
             return error_msg
+    
+    def _cache_response(self, response: str) -> None:
+        """Cache the fresh response of the last _call_mcp on this thread, once the agent parsed it"""
+        pending = getattr(self._uncached, "response", None)
+        self._uncached.response = None
+        if pending and pending[1] == response:
+            cache_key, content, model = pending
+            response_cache.set(cache_key, content, model, self.agent_name)
 
@@ -0,0 +1,3 @@
+from app.services.agents.combined_analyzer.agent import CombinedAnalyzerAgent
+
+__all__ = ["CombinedAnalyzerAgent"]
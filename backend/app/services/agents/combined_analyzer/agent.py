@@ -0,0 +1,87 @@
+from typing import Dict, Any, List
+from app.services.agents.base.mcp_agent import MCPAgent
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CombinedAnalyzerAgent(MCPAgent):
+    """Agent that runs all scoring agents' analyses in a single GigaChat call"""
+
+    def __init__(self, agents: Dict[str, MCPAgent]):
+        """
+        Args:
+            agents: Per-agent instances used to normalize their part of the response
+        """
+        super().__init__("combined_analyzer")
+        self.agents = agents
+
+    def analyze(self, text: str, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze text for all agents at once
+
+        Returns:
+            Dictionary of per-agent results keyed by agent name
+        """
+        logger.info(f"[{self.agent_name}] Starting combined analysis. Text length: {len(text)} chars")
+
+        prompt_template = self.config["prompts"].get(
+            "analysis_prompt",
+            f"""Analyze the following startup pitch for text quality, financials, market, team and risks.
+
+Text:
+{{text}}
+
+Provide a JSON object with keys {", ".join(self.agents)}.
+Each key holds the analysis of that aspect with a score (0-100) and details (string).
+
+Return only valid JSON."""
+        )
+        prompt = prompt_template.format(text=text)
+
+        response = self._call_mcp(prompt, force=force)
+
+        try:
+            result = json.loads(response)
+        except json.JSONDecodeError as e:
+            logger.error(f"[{self.agent_name}] JSON parsing failed: {str(e)}")
+            logger.error(f"[{self.agent_name}] Raw response: {response[:500]}")
+            return {agent_name: agent.default_result() for agent_name, agent in self.agents.items()}
+
+        results = self.split_result(result)
+        # A response missing some agents would replay their default scores
+        if not any(self.agents[agent_name].is_failed(agent_result) for agent_name, agent_result in results.items()):
+            self._cache_response(response)
+        return results
+
+    def split_result(self, result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Split combined response into per-agent results"""
+        results = {}
+        for agent_name, agent in self.agents.items():
+            agent_result = result.get(agent_name)
+            if isinstance(agent_result, dict):
+                results[agent_name] = agent.parse_result(agent_result)
+            elif "score" in result or "details" in result:
+                # Error fallback from _call_mcp is a flat {"score", "details"} object
+                results[agent_name] = agent.parse_result(
+                    {key: result[key] for key in ("score", "details") if key in result}
+                )
+            else:
+                logger.warning(f"[{self.agent_name}] No result for {agent_name} in combined response")
+                results[agent_name] = agent.default_result()
+        return results
+
+    def merge_results(
+        self,
+        partials: List[Dict[str, Dict[str, Any]]],
+        weights: List[float]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Merge per-chunk results agent by agent"""
+        return {
+            agent_name: agent.merge_results(
+                [partial.get(agent_name, agent.default_result()) for partial in partials],
+                weights
+            )
+            for agent_name, agent in self.agents.items()
+        }
@@ -0,0 +1,153 @@
+"""
+In-process registry of agent configurations.
+Configurations are loaded from the DB once per worker and kept until
+they change. Changes made through the API are broadcast to other
+workers with LISTEN/NOTIFY; without it each worker compares cached
+versions (updated_at) with the DB at most every few seconds.
+"""
+from typing import Dict, Any, Optional, Tuple
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.notifications import notify, notification_listener
+from app.models import AgentConfig
+import logging
+import os
+import threading
+import time
+import yaml
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CHANNEL = "agent_config_changed"
+
+# Version of configs that don't come from the DB
+YAML_VERSION = "yaml"
+
+DEFAULT_CONFIG = {
+    "model": "GigaChat-Pro",
+    "system_prompt": "You are an AI assistant analyzing startup pitches.",
+    "prompts": {},
+    "temperature": 0.7,
+    "max_tokens": 2000,
+    "mcp_server_config": {}
+}
+
+
+def _db_version(updated_at) -> str:
+    return updated_at.isoformat() if updated_at else "0"
+
+
+class AgentConfigRegistry:
+    """Agent configurations keyed by agent_name, versioned by updated_at"""
+
+    def __init__(self, version_check_interval: Optional[float] = None):
+        self.version_check_interval = (
+            settings.AGENT_CONFIG_VERSION_CHECK_INTERVAL if version_check_interval is None else version_check_interval
+        )
+        # agent_name -> (version, config)
+        self._configs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._last_version_check = time.monotonic()
+        notification_listener.subscribe(CONFIG_CHANNEL, self._on_notification)
+
+    def get(self, agent_name: str) -> Dict[str, Any]:
+        """
+        Get agent configuration
+
+        Args:
+            agent_name: Agent name
+
+        Returns:
+            Configuration dict (shared, must not be modified)
+        """
+        return self._entry(agent_name)[1]
+
+    def version(self, agent_name: str) -> str:
+        """Version of the configuration currently used by the agent"""
+        return self._entry(agent_name)[0]
+
+    def invalidate(self, agent_name: Optional[str] = None) -> None:
+        """
+        Drop cached configuration in this worker and tell other workers to do the same
+
+        Args:
+            agent_name: Agent to invalidate, None for all agents
+        """
+        self._drop(agent_name)
+        notify(CONFIG_CHANNEL, agent_name or "")
+
+    def _entry(self, agent_name: str) -> Tuple[str, Dict[str, Any]]:
+        self._check_versions()
+        entry = self._configs.get(agent_name)
+        if entry is None:
+            with self._lock:
+                entry = self._configs.get(agent_name)
+                if entry is None:
+                    entry = self._load(agent_name)
+                    self._configs[agent_name] = entry
+        return entry
+
+    def _load(self, agent_name: str) -> Tuple[str, Dict[str, Any]]:
+        """Load configuration from DB or YAML"""
+        db = SessionLocal()
+        try:
+            db_config = db.query(AgentConfig).filter(AgentConfig.agent_name == agent_name).first()
+            if db_config and db_config.is_active:
+                logger.info(f"[AgentConfigRegistry] Loaded {agent_name} config from DB")
+                return _db_version(db_config.updated_at), {
+                    "model": db_config.model,
+                    "system_prompt": db_config.system_prompt,
+                    "prompts": db_config.prompts,
+                    "temperature": db_config.temperature,
+                    "max_tokens": db_config.max_tokens,
+                    "mcp_server_config": db_config.mcp_server_config or {}
+                }
+        finally:
+            db.close()
+
+        # Fallback to YAML
+        config_path = os.path.join("app", "services", "agents", agent_name, "config.yaml")
+        if os.path.exists(config_path):
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return YAML_VERSION, yaml.safe_load(f)
+
+        return YAML_VERSION, dict(DEFAULT_CONFIG)
+
+    def _check_versions(self) -> None:
+        """Fallback when notifications aren't received: compare cached versions with the DB"""
+        if notification_listener.is_listening or not self._configs:
+            return
+        if time.monotonic() - self._last_version_check < self.version_check_interval:
+            return
+        self._last_version_check = time.monotonic()
+
+        db = SessionLocal()
+        try:
+            rows = db.query(AgentConfig.agent_name, AgentConfig.updated_at, AgentConfig.is_active).all()
+        except Exception as e:
+            logger.warning(f"[AgentConfigRegistry] Version check failed: {str(e)}")
+            return
+        finally:
+            db.close()
+
+        current = {
+            agent_name: _db_version(updated_at) if is_active else YAML_VERSION
+            for agent_name, updated_at, is_active in rows
+        }
+        for agent_name, (version, _) in list(self._configs.items()):
+            if current.get(agent_name, YAML_VERSION) != version:
+                logger.info(f"[AgentConfigRegistry] {agent_name} config changed, reloading")
+                self._drop(agent_name)
+
+    def _on_notification(self, payload: Optional[str]) -> None:
+        self._drop(payload or None)
+
+    def _drop(self, agent_name: Optional[str]) -> None:
+        with self._lock:
+            if agent_name is None:
+                self._configs.clear()
+            else:
+                self._configs.pop(agent_name, None)
+
+
+agent_config_registry = AgentConfigRegistry()
@@ -1,5 +1,4 @@
 from typing import Dict, Any
-from sqlalchemy.orm import Session
 from app.services.agents.base.mcp_agent import MCPAgent
 import json
 
@@ -7,10 +6,12 @@ import json
 class FinancialAnalyzerAgent(MCPAgent):
     """Agent for analyzing financial data"""
     
-    def __init__(self, db: Session):
-        super().__init__(db, "financial_analyzer")
+    SECTIONS = ["finances", "business_model", "traction"]
     
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def __init__(self):
+        super().__init__("financial_analyzer")
+    
+    def analyze(self, text: str, force: bool = False) -> Dict[str, Any]:
         """Analyze financial information"""
         prompt_template = self.config["prompts"].get(
             "analysis_prompt",
@@ -31,23 +32,21 @@ Return only valid JSON."""
         # Format prompt with actual text
         prompt = prompt_template.format(text=text)
         
-        response = self._call_mcp(prompt)
+        response = self._call_mcp(prompt, force=force)
         
         try:
-            result = json.loads(response)
-            return {
-                "score": result.get("score", 50.0),
-                "revenue_model": result.get("revenue_model", "Not specified"),
-                "financial_health": result.get("financial_health", 50.0),
-                "funding_needs": result.get("funding_needs", "Not specified"),
-                "details": result.get("details", "Analysis completed")
-            }
+            result = self.parse_result(json.loads(response))
         except json.JSONDecodeError:
-            return {
-                "score": 50.0,
-                "revenue_model": "Not specified",
-                "financial_health": 50.0,
-                "funding_needs": "Not specified",
-                "details": "Analysis completed with default scores"
-            }
-
+            return self.default_result()
+        self._cache_response(response)
+        return result
+    
+    def parse_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize parsed model response"""
+        return {
+            "score": result.get("score", 50.0),
+            "revenue_model": result.get("revenue_model", "Not specified"),
+            "financial_health": result.get("financial_health", 50.0),
+            "funding_needs": result.get("funding_needs", "Not specified"),
+            "details": result.get("details", "Analysis completed")
+        }
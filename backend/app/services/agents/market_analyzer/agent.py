@@ -1,5 +1,4 @@
 from typing import Dict, Any
-from sqlalchemy.orm import Session
 from app.services.agents.base.mcp_agent import MCPAgent
 import json
 
@@ -7,10 +6,12 @@ import json
 class MarketAnalyzerAgent(MCPAgent):
     """Agent for analyzing market and competition"""
     
-    def __init__(self, db: Session):
-        super().__init__(db, "market_analyzer")
+    SECTIONS = ["market", "competition", "business_model", "traction", "product"]
     
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def __init__(self):
+        super().__init__("market_analyzer")
+    
+    def analyze(self, text: str, force: bool = False) -> Dict[str, Any]:
         """Analyze market opportunity and competition"""
         prompt_template = self.config["prompts"].get(
             "analysis_prompt",
@@ -32,25 +33,22 @@ Return only valid JSON."""
         # Format prompt with actual text
         prompt = prompt_template.format(text=text)
         
-        response = self._call_mcp(prompt)
+        response = self._call_mcp(prompt, force=force)
         
         try:
-            result = json.loads(response)
-            return {
-                "score": result.get("score", 50.0),
-                "market_size": result.get("market_size", "Not specified"),
-                "competition_level": result.get("competition_level", "Unknown"),
-                "competitive_advantages": result.get("competitive_advantages", []),
-                "market_opportunity": result.get("market_opportunity", 50.0),
-                "details": result.get("details", "Analysis completed")
-            }
+            result = self.parse_result(json.loads(response))
         except json.JSONDecodeError:
-            return {
-                "score": 50.0,
-                "market_size": "Not specified",
-                "competition_level": "Unknown",
-                "competitive_advantages": [],
-                "market_opportunity": 50.0,
-                "details": "Analysis completed with default scores"
-            }
-
+            return self.default_result()
+        self._cache_response(response)
+        return result
+    
+    def parse_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize parsed model response"""
+        return {
+            "score": result.get("score", 50.0),
+            "market_size": result.get("market_size", "Not specified"),
+            "competition_level": result.get("competition_level", "Unknown"),
+            "competitive_advantages": result.get("competitive_advantages", []),
+            "market_opportunity": result.get("market_opportunity", 50.0),
+            "details": result.get("details", "Analysis completed")
+        }
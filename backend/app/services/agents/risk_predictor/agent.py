@@ -1,5 +1,4 @@
 from typing import Dict, Any
-from sqlalchemy.orm import Session
 from app.services.agents.base.mcp_agent import MCPAgent
 import json
 
@@ -7,10 +6,12 @@ import json
 class RiskPredictorAgent(MCPAgent):
     """Agent for predicting risks"""
     
-    def __init__(self, db: Session):
-        super().__init__(db, "risk_predictor")
+    SECTIONS = ["risks", "product", "market", "competition", "finances"]
     
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def __init__(self):
+        super().__init__("risk_predictor")
+    
+    def analyze(self, text: str, force: bool = False) -> Dict[str, Any]:
         """Predict risks"""
         prompt_template = self.config["prompts"].get(
             "analysis_prompt",
@@ -34,21 +35,20 @@ Return only valid JSON."""
         # Format prompt with actual text
         prompt = prompt_template.format(text=text)
         
-        response = self._call_mcp(prompt)
+        response = self._call_mcp(prompt, force=force)
         
         try:
-            result = json.loads(response)
-            return {
-                "score": result.get("score", 50.0),
-                "risks": result.get("risks", []),
-                "overall_risk_level": result.get("overall_risk_level", "medium"),
-                "details": result.get("details", "Analysis completed")
-            }
+            result = self.parse_result(json.loads(response))
         except json.JSONDecodeError:
-            return {
-                "score": 50.0,
-                "risks": [],
-                "overall_risk_level": "medium",
-                "details": "Analysis completed with default scores"
-            }
-
+            return self.default_result()
+        self._cache_response(response)
+        return result
+    
+    def parse_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize parsed model response"""
+        return {
+            "score": result.get("score", 50.0),
+            "risks": result.get("risks", []),
+            "overall_risk_level": result.get("overall_risk_level", "medium"),
+            "details": result.get("details", "Analysis completed")
+        }
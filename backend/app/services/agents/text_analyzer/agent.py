@@ -1,5 +1,4 @@
 from typing import Dict, Any
-from sqlalchemy.orm import Session
 from app.services.agents.base.mcp_agent import MCPAgent
 import json
 import logging
@@ -10,10 +9,10 @@ logger = logging.getLogger(__name__)
 class TextAnalyzerAgent(MCPAgent):
     """Agent for analyzing text quality, structure, and clarity"""
     
-    def __init__(self, db: Session):
-        super().__init__(db, "text_analyzer")
+    def __init__(self):
+        super().__init__("text_analyzer")
     
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def analyze(self, text: str, force: bool = False) -> Dict[str, Any]:
         """Analyze text quality and structure"""
         logger.info(f"[{self.agent_name}] Starting analysis. Text length: {len(text)} chars")
         
@@ -38,30 +37,28 @@ Return only valid JSON."""
         
         logger.info(f"[{self.agent_name}] Prompt prepared. Calling MCP...")
         # Call MCP server
-        response = self._call_mcp(prompt)
+        response = self._call_mcp(prompt, force=force)
         logger.info(f"[{self.agent_name}] MCP response received. Length: {len(response)} chars")
         
         try:
             result = json.loads(response)
             logger.info(f"[{self.agent_name}] JSON parsed successfully. Score: {result.get('score', 'N/A')}")
-            parsed_result = {
-                "score": result.get("score", 50.0),
-                "clarity": result.get("clarity", 50.0),
-                "structure": result.get("structure", 50.0),
-                "completeness": result.get("completeness", 50.0),
-                "details": result.get("details", "Analysis completed")
-            }
+            parsed_result = self.parse_result(result)
             logger.info(f"[{self.agent_name}] Analysis complete. Result: {parsed_result}")
-            return parsed_result
         except json.JSONDecodeError as e:
             logger.error(f"[{self.agent_name}] JSON parsing failed: {str(e)}")
             logger.error(f"[{self.agent_name}] Raw response: {response[:500]}")
             # Fallback if JSON parsing fails
-            return {
-                "score": 50.0,
-                "clarity": 50.0,
-                "structure": 50.0,
-                "completeness": 50.0,
-                "details": "Analysis completed with default scores"
-            }
-
+            return self.default_result()
+        self._cache_response(response)
+        return parsed_result
+    
+    def parse_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize parsed model response"""
+        return {
+            "score": result.get("score", 50.0),
+            "clarity": result.get("clarity", 50.0),
+            "structure": result.get("structure", 50.0),
+            "completeness": result.get("completeness", 50.0),
+            "details": result.get("details", "Analysis completed")
+        }
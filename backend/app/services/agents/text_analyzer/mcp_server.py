@@ -4,39 +4,20 @@ This server connects to GigaChat API and provides text analysis capabilities
 """
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from app.core.config import settings
-import requests
+from app.services.gigachat.auth import token_provider
+from app.services.gigachat.client import async_gigachat_client
 import json
 
 
 async def get_gigachat_token() -> str:
-    """Get GigaChat access token"""
-    auth_url = settings.GIGACHAT_AUTH_URL
-    api_key = settings.GIGACHAT_API_KEY
-    
-    if not api_key:
-        raise ValueError("GIGACHAT_API_KEY not configured")
-    
-    # Request token
-    response = requests.post(
-        auth_url,
-        data={"scope": "GIGACHAT_API_PERS"},
-        headers={"Authorization": f"Bearer {api_key}"},
-        verify=False
-    )
-    response.raise_for_status()
-    return response.json()["access_token"]
+    """Get GigaChat access token from the shared process-wide cache"""
+    return await token_provider.aget_token()
 
 
 async def call_gigachat(prompt: str, model: str = "GigaChat-Pro", temperature: float = 0.7, max_tokens: int = 2000) -> str:
     """Call GigaChat API"""
     token = await get_gigachat_token()
     
-    url = "https://gigachat.devices.sberbank.ru/api/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
     data = {
         "model": model,
         "messages": [{"role": "user", "content": prompt}],
@@ -44,7 +25,7 @@ async def call_gigachat(prompt: str, model: str = "GigaChat-Pro", temperature: f
         "max_tokens": max_tokens
     }
     
-    response = requests.post(url, json=data, headers=headers, verify=False)
+    response = await async_gigachat_client.chat_completion(data, token)
     response.raise_for_status()
     return response.json()["choices"][0]["message"]["content"]
 
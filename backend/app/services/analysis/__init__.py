@@ -1,4 +1,8 @@
 from app.services.analysis.missing_info_analyzer import MissingInfoAnalyzer
+from app.services.analysis.section_segmenter import SectionSegmenter
+from app.services.analysis.content_hash import content_hash, normalize_text
+from app.services.analysis.minhash import MinHasher
+from app.services.analysis.near_duplicates import NearDuplicateIndex, near_duplicate_index
 
-__all__ = ["MissingInfoAnalyzer"]
-
+__all__ = ["MissingInfoAnalyzer", "SectionSegmenter", "content_hash", "normalize_text",
+           "MinHasher", "NearDuplicateIndex", "near_duplicate_index"]
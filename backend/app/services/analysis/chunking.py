@@ -0,0 +1,98 @@
+from typing import List
+import math
+import re
+
+# Rough chars-per-token ratio for mixed Russian/English text (errs on the side of more tokens)
+CHARS_PER_TOKEN = 3
+
+# Pages (PDF), slides (PPTX) and paragraphs are separated by blank lines or form feeds
+SEGMENT_BOUNDARY = re.compile(r"\f|\n\s*\n")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate number of model tokens in text"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_segments(text: str) -> List[str]:
+    """Split text on page/slide/paragraph boundaries"""
+    return [segment.strip() for segment in SEGMENT_BOUNDARY.split(text) if segment.strip()]
+
+
+def _split_oversized(segment: str, max_tokens: int) -> List[str]:
+    """Split a single segment that doesn't fit into a chunk by lines, then by characters"""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    parts = []
+    current = ""
+    for line in segment.splitlines():
+        while len(line) > max_chars:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and len(current) + len(line) + 1 > max_chars:
+            parts.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        parts.append(current)
+    return parts
+
+
+def chunk_text(text: str, max_tokens: int, overlap_tokens: int = 0) -> List[str]:
+    """
+    Split text into chunks that fit the token budget
+
+    Chunks are built from whole pages/slides/paragraphs where possible.
+    Each chunk after the first repeats trailing segments of the previous one
+    (up to overlap_tokens) so content on a boundary is seen in context.
+
+    Args:
+        text: Document text
+        max_tokens: Max estimated tokens per chunk
+        overlap_tokens: Max estimated tokens repeated between neighbouring chunks
+
+    Returns:
+        List of chunks, a single element if the text fits as is
+    """
+    if not text or estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    segments = []
+    for segment in split_segments(text):
+        if estimate_tokens(segment) > max_tokens:
+            segments.extend(_split_oversized(segment, max_tokens))
+        else:
+            segments.append(segment)
+
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for segment in segments:
+        segment_tokens = estimate_tokens(segment)
+        if current and current_tokens + segment_tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+
+            # Carry trailing segments over as overlap
+            overlap: List[str] = []
+            overlap_size = 0
+            for previous in reversed(current):
+                previous_tokens = estimate_tokens(previous)
+                if overlap_size + previous_tokens > overlap_tokens or \
+                        overlap_size + previous_tokens + segment_tokens > max_tokens:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += previous_tokens
+            current = overlap
+            current_tokens = overlap_size
+
+        current.append(segment)
+        current_tokens += segment_tokens
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
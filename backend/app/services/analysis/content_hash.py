@@ -0,0 +1,26 @@
+import hashlib
+import re
+import unicodedata
+
+# More than one blank line in a row carries no meaning for analysis
+EXTRA_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text so that re-uploads of the same pitch compare equal
+
+    Unicode is NFKC-normalized, runs of spaces/tabs are collapsed, line ends
+    stripped and repeated blank lines collapsed. Case and wording are kept
+    since agents see them.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text)
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    return EXTRA_BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of normalized text"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
@@ -0,0 +1,81 @@
+"""
+MinHash signatures and LSH banding for near-duplicate detection.
+Two texts' Jaccard similarity over word shingles is estimated by the share
+of equal signature positions. Signatures are split into bands; texts
+sharing any band bucket are candidate duplicates.
+"""
+from typing import List, Sequence
+from app.services.analysis.content_hash import normalize_text
+import hashlib
+import re
+import zlib
+import numpy as np
+
+# Mersenne prime for universal hashing: a * x + b stays below 2^63 for 32-bit x
+MERSENNE_PRIME = (1 << 61) - 1
+
+WORD = re.compile(r"\w+")
+
+
+class MinHasher:
+    """Computes MinHash signatures over word shingles"""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 3, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length
+            bands: Number of LSH bands, must divide num_perm
+            shingle_size: Words per shingle
+            seed: Seed of hash permutations, must be the same wherever signatures are compared
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """32-bit hashes of word shingles of normalized lowercase text"""
+        words = WORD.findall(normalize_text(text).lower())
+        if len(words) < self.shingle_size:
+            grams = [" ".join(words)] if words else []
+        else:
+            grams = {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+        return np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64)
+
+    def signature(self, text: str) -> List[int]:
+        """
+        MinHash signature of text
+
+        Returns:
+            num_perm integers, empty list for text without words
+        """
+        shingles = self.shingles(text)
+        if not shingles.size:
+            return []
+        hashes = (self._a[:, None] * shingles[None, :] + self._b[:, None]) % MERSENNE_PRIME
+        return hashes.min(axis=1).tolist()
+
+    def band_buckets(self, signature: Sequence[int]) -> List[str]:
+        """LSH bucket key of each band (band number is part of the key)"""
+        if not signature:
+            return []
+        values = np.asarray(signature, dtype=np.uint64)
+        return [
+            hashlib.blake2b(
+                band.to_bytes(2, "little") + values[band * self.rows:(band + 1) * self.rows].tobytes(),
+                digest_size=8
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def jaccard(signature: Sequence[int], other: Sequence[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        if not signature or not other or len(signature) != len(other):
+            return 0.0
+        return float(np.mean(np.asarray(signature) == np.asarray(other)))
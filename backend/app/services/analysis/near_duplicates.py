@@ -0,0 +1,108 @@
+"""
+Near-duplicate pitch search over an LSH index stored in pitch_lsh_buckets.
+Candidates are the documents sharing at least one band bucket (an index
+lookup), only their signatures are compared, so search cost depends on the
+number of similar documents rather than on the table size.
+"""
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from app.core.database import SessionLocal
+from app.models import PitchDocument, PitchLSHBucket
+from app.services.analysis.minhash import MinHasher
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index of pitch documents"""
+
+    def __init__(self, hasher: Optional[MinHasher] = None):
+        self.hasher = hasher or MinHasher()
+
+    def index_document(self, db: Session, doc: PitchDocument) -> None:
+        """
+        Compute signature of document text and (re)place its buckets, caller commits
+
+        Args:
+            db: Database session
+            doc: Pitch document (must have an id)
+        """
+        doc.minhash = self.hasher.signature(doc.text_content or "")
+        db.query(PitchLSHBucket).filter(PitchLSHBucket.pitch_document_id == doc.id).delete(synchronize_session=False)
+        db.add_all([
+            PitchLSHBucket(pitch_document_id=doc.id, bucket=bucket)
+            for bucket in set(self.hasher.band_buckets(doc.minhash))
+        ])
+
+    def find_similar(
+        self,
+        db: Session,
+        doc: PitchDocument,
+        threshold: float = 0.5,
+        limit: int = 20
+    ) -> List[Tuple[PitchDocument, float]]:
+        """
+        Find documents similar to doc
+
+        Args:
+            db: Database session
+            doc: Pitch document
+            threshold: Min estimated Jaccard similarity
+            limit: Max number of documents returned
+
+        Returns:
+            (document, similarity) pairs, most similar first
+        """
+        if doc.minhash is None:
+            self.index_document(db, doc)
+            db.commit()
+        if not doc.minhash:
+            return []
+
+        buckets = self.hasher.band_buckets(doc.minhash)
+        candidate_ids = [
+            pitch_document_id for pitch_document_id, in db.query(PitchLSHBucket.pitch_document_id).filter(
+                PitchLSHBucket.bucket.in_(buckets),
+                PitchLSHBucket.pitch_document_id != doc.id
+            ).group_by(PitchLSHBucket.pitch_document_id).order_by(
+                func.count().desc()
+            ).limit(limit * 5)
+        ]
+        if not candidate_ids:
+            return []
+
+        similar = []
+        for candidate in db.query(PitchDocument).filter(PitchDocument.id.in_(candidate_ids)):
+            similarity = self.hasher.jaccard(doc.minhash, candidate.minhash)
+            if similarity >= threshold:
+                similar.append((candidate, similarity))
+        similar.sort(key=lambda item: item[1], reverse=True)
+        return similar[:limit]
+
+
+near_duplicate_index = NearDuplicateIndex()
+
+
+def index_missing_documents(batch_size: int = 500) -> int:
+    """Index documents stored before near-duplicate search existed"""
+    db = SessionLocal()
+    indexed = 0
+    try:
+        while True:
+            docs = db.query(PitchDocument).filter(PitchDocument.minhash.is_(None)).limit(batch_size).all()
+            if not docs:
+                break
+            for doc in docs:
+                near_duplicate_index.index_document(db, doc)
+            db.commit()
+            indexed += len(docs)
+            logger.info(f"[NearDuplicateIndex] Indexed {indexed} documents")
+    finally:
+        db.close()
+    return indexed
+
+
+if __name__ == "__main__":
+    print(f"Indexed {index_missing_documents()} documents")
@@ -0,0 +1,72 @@
+from typing import Dict, Any, List
+from app.services.analysis.chunking import split_segments
+from app.services.analysis.missing_info_analyzer import MissingInfoAnalyzer
+
+
+class SectionSegmenter:
+    """Splits pitch text into tagged sections (team, market, finances, ...)"""
+
+    # Section vocabulary shared with missing info analysis, plus risks
+    SECTION_KEYWORDS = {
+        **{
+            section_key: section_info["keywords"]
+            for section_key, section_info in MissingInfoAnalyzer.REQUIRED_SECTIONS.items()
+        },
+        "risks": ["риск", "risk", "угроз", "threat", "митигац", "mitigation", "регулятор", "regulat"]
+    }
+
+    # Keyword in the first line of a page/slide counts as a heading
+    HEADING_WEIGHT = 3
+    SUMMARY_CHARS = 1000
+
+    def segment(self, text: str) -> Dict[str, Any]:
+        """
+        Split text into sections
+
+        Args:
+            text: Pitch document text
+
+        Returns:
+            {"summary": beginning of the document, "sections": {section: text}}
+        """
+        if not text:
+            return {"summary": "", "sections": {}}
+
+        sections: Dict[str, List[str]] = {}
+        for segment in split_segments(text):
+            for section in self._classify(segment):
+                sections.setdefault(section, []).append(segment)
+
+        return {
+            "summary": self._summary(text),
+            "sections": {section: "\n\n".join(parts) for section, parts in sections.items()}
+        }
+
+    def _classify(self, segment: str) -> List[str]:
+        """Sections a page/slide/paragraph belongs to, by keyword hits"""
+        segment_lower = segment.lower()
+        heading = segment_lower.split("\n", 1)[0]
+
+        scores = {}
+        for section, keywords in self.SECTION_KEYWORDS.items():
+            score = sum(segment_lower.count(keyword) for keyword in keywords)
+            score += sum(self.HEADING_WEIGHT for keyword in keywords if keyword in heading)
+            if score:
+                scores[section] = score
+
+        if not scores:
+            return ["other"]
+
+        # Keep every section that is at least half as strong as the best one
+        best = max(scores.values())
+        return [section for section, score in scores.items() if score * 2 >= best]
+
+    def _summary(self, text: str) -> str:
+        """Beginning of the document (title, one-liner) as short global context"""
+        summary = text[:self.SUMMARY_CHARS]
+        if len(text) > self.SUMMARY_CHARS:
+            cut = summary.rfind("\n")
+            if cut > self.SUMMARY_CHARS // 2:
+                summary = summary[:cut]
+            summary += "\n..."
+        return summary.strip()
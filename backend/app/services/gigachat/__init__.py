@@ -0,0 +1,11 @@
+from app.services.gigachat.auth import GigaChatTokenProvider, token_provider
+from app.services.gigachat.client import (
+    GigaChatClient, AsyncGigaChatClient, gigachat_client, async_gigachat_client
+)
+from app.services.gigachat.response_cache import ResponseCache, response_cache
+
+__all__ = [
+    "GigaChatTokenProvider", "token_provider",
+    "GigaChatClient", "AsyncGigaChatClient", "gigachat_client", "async_gigachat_client",
+    "ResponseCache", "response_cache",
+]
@@ -0,0 +1,180 @@
+"""
+Process-wide GigaChat OAuth token provider.
+The token is cached until shortly before its expires_at and refreshed
+by a single caller while the others wait for the result.
+"""
+from typing import Optional, Tuple
+from app.core.config import settings
+from app.services.gigachat.client import gigachat_client
+import asyncio
+import logging
+import threading
+import time
+import uuid
+import requests
+
+logger = logging.getLogger(__name__)
+
+# GigaChat access tokens live 30 minutes; used when the response has no expires_at
+DEFAULT_TOKEN_LIFETIME = 30 * 60
+# When OAuth fails and the API key is used as a token, retry OAuth after this delay
+FALLBACK_TOKEN_LIFETIME = 60
+AUTH_TIMEOUT = 10
+
+
+class GigaChatTokenProvider:
+    """Caches GigaChat access token shared by all agents and MCP servers"""
+
+    # Auth request formats tried in order until one returns a token
+    AUTH_FORMATS = ("basic_form", "basic", "bearer")
+
+    def __init__(
+        self,
+        auth_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        scope: Optional[str] = None,
+        refresh_margin: Optional[int] = None
+    ):
+        self.auth_url = auth_url or settings.GIGACHAT_AUTH_URL
+        self.api_key = api_key if api_key is not None else settings.GIGACHAT_API_KEY
+        self.scope = scope or settings.GIGACHAT_SCOPE
+        self.refresh_margin = settings.GIGACHAT_TOKEN_REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._refresh_at = 0.0
+        self._auth_format: Optional[str] = None
+
+    @property
+    def auth_format(self) -> Optional[str]:
+        """Auth format that succeeded last time"""
+        return self._auth_format
+
+    def get_token(self) -> str:
+        """
+        Get access token, refreshing it if it is missing or about to expire
+
+        Returns:
+            Access token for GigaChat API
+        """
+        token = self._token
+        if token and time.time() < self._refresh_at:
+            return token
+
+        with self._lock:
+            # Another caller may have refreshed the token while we were waiting
+            if self._token and time.time() < self._refresh_at:
+                return self._token
+            self._token, self._refresh_at = self._refresh()
+            return self._token
+
+    async def aget_token(self) -> str:
+        """Async variant of get_token for MCP servers"""
+        token = self._token
+        if token and time.time() < self._refresh_at:
+            return token
+        return await asyncio.to_thread(self.get_token)
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Drop cached token (e.g. after 401 from GigaChat)
+
+        Args:
+            token: Token that was rejected. If the cache already holds a newer one it is kept.
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._refresh_at = 0.0
+
+    def _refresh(self) -> Tuple[str, float]:
+        """Request new token, returns token and the time it should be refreshed at"""
+        api_key = self.api_key
+        if not api_key:
+            logger.error("[GigaChatAuth] GIGACHAT_API_KEY not configured")
+            raise ValueError("GIGACHAT_API_KEY not configured")
+
+        # API key is already an access token (R-M-... format)
+        if api_key.startswith("R-"):
+            logger.info("[GigaChatAuth] API key appears to be an access token, using directly")
+            return api_key, float("inf")
+
+        # Try the format that worked last time first
+        formats = list(self.AUTH_FORMATS)
+        if self._auth_format in formats:
+            formats.remove(self._auth_format)
+            formats.insert(0, self._auth_format)
+
+        last_response = None
+        for auth_format in formats:
+            try:
+                logger.info(f"[GigaChatAuth] Requesting access token from {self.auth_url} (format: {auth_format})")
+                response = self._request_token(auth_format)
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"[GigaChatAuth] Format {auth_format} failed: {str(e)}")
+                continue
+
+            last_response = response
+            if response.status_code != 200:
+                logger.warning(
+                    f"[GigaChatAuth] Format {auth_format} response status: {response.status_code}, "
+                    f"body: {response.text[:500]}"
+                )
+                continue
+
+            try:
+                payload = response.json()
+            except ValueError as e:
+                logger.error(f"[GigaChatAuth] Failed to parse JSON response: {str(e)}")
+                continue
+
+            token = payload.get("access_token")
+            if token:
+                if self._auth_format != auth_format:
+                    logger.info(f"[GigaChatAuth] Auth format {auth_format} works, remembering it")
+                self._auth_format = auth_format
+                refresh_at = self._refresh_deadline(payload.get("expires_at"))
+                logger.info(f"[GigaChatAuth] Access token received, refresh in {refresh_at - time.time():.0f}s")
+                return token, refresh_at
+
+        # Last resort: use API key directly as access token
+        logger.warning(
+            f"[GigaChatAuth] Failed to get access token via OAuth. Last response: "
+            f"{last_response.status_code if last_response is not None else 'N/A'}. "
+            f"Using API key directly as access token (fallback mode)"
+        )
+        return api_key, time.time() + FALLBACK_TOKEN_LIFETIME
+
+    def _request_token(self, auth_format: str) -> requests.Response:
+        """Send token request in the given format"""
+        api_key = self.api_key
+        headers = {"Accept": "application/json"}
+
+        if auth_format == "bearer":
+            headers["Authorization"] = f"Bearer {api_key}"
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        else:
+            # API key should be base64(ClientID:ClientSecret)
+            headers["Authorization"] = api_key if api_key.startswith("Basic ") else f"Basic {api_key}"
+            # GigaChat API requires RqUID header (unique request ID in UUID4 format)
+            headers["RqUID"] = str(uuid.uuid4())
+            if auth_format == "basic_form":
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        return gigachat_client.post(
+            self.auth_url,
+            data={"scope": self.scope},
+            headers=headers,
+            timeout=(settings.GIGACHAT_CONNECT_TIMEOUT, AUTH_TIMEOUT)
+        )
+
+    def _refresh_deadline(self, expires_at: Optional[float]) -> float:
+        """Convert expires_at from auth response into refresh time"""
+        if not expires_at:
+            expires_at = time.time() + DEFAULT_TOKEN_LIFETIME
+        elif expires_at > 1e11:
+            # GigaChat returns expires_at in milliseconds
+            expires_at = expires_at / 1000
+        return max(time.time(), expires_at - self.refresh_margin)
+
+
+token_provider = GigaChatTokenProvider()
@@ -0,0 +1,150 @@
+"""
+Long-lived pooled HTTP clients for GigaChat API.
+Connections are kept alive between calls so agents don't pay
+a TCP + TLS handshake on every request.
+"""
+from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from app.core.config import settings
+import logging
+import threading
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+def _default_pool_size() -> int:
+    """Pool size follows the number of agent calls that may run at once"""
+    return max(1, settings.GIGACHAT_POOL_SIZE or settings.SCORING_MAX_CONCURRENCY * settings.SCORING_CHUNK_CONCURRENCY)
+
+
+class GigaChatClient:
+    """Pooled keep-alive sync client shared by all MCP agents"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        verify: bool = False
+    ):
+        self.base_url = (base_url or settings.GIGACHAT_API_URL).rstrip("/")
+        self.pool_size = pool_size or _default_pool_size()
+        self.timeout = (
+            connect_timeout or settings.GIGACHAT_CONNECT_TIMEOUT,
+            read_timeout or settings.GIGACHAT_READ_TIMEOUT
+        )
+        self.verify = verify
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Session is created lazily and reused until close()"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    # One pool per host (auth + API), each keeping up to pool_size connections alive
+                    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+                    logger.info(f"[GigaChatClient] HTTP pool created (pool_size={self.pool_size})")
+        return self._session
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST through the pooled session with default timeouts"""
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("verify", self.verify)
+        return self.session.post(url, **kwargs)
+
+    def chat_completion(self, data: Dict[str, Any], token: str) -> requests.Response:
+        """
+        Call chat completions endpoint
+
+        Args:
+            data: Request payload (model, messages, temperature, max_tokens)
+            token: GigaChat access token
+
+        Returns:
+            Raw HTTP response
+        """
+        return self.post(
+            f"{self.base_url}/chat/completions",
+            json=data,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            }
+        )
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                logger.info("[GigaChatClient] HTTP pool closed")
+
+
+class AsyncGigaChatClient:
+    """Pooled keep-alive async client for MCP servers"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        verify: bool = False
+    ):
+        self.base_url = (base_url or settings.GIGACHAT_API_URL).rstrip("/")
+        self.pool_size = pool_size or _default_pool_size()
+        self.timeout = httpx.Timeout(
+            read_timeout or settings.GIGACHAT_READ_TIMEOUT,
+            connect=connect_timeout or settings.GIGACHAT_CONNECT_TIMEOUT
+        )
+        self.verify = verify
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Client is created lazily and reused until aclose()"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size
+                )
+            )
+        return self._client
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """POST through the pooled client"""
+        return await self.client.post(url, **kwargs)
+
+    async def chat_completion(self, data: Dict[str, Any], token: str) -> httpx.Response:
+        """Async variant of GigaChatClient.chat_completion"""
+        return await self.post(
+            f"{self.base_url}/chat/completions",
+            json=data,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            }
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+gigachat_client = GigaChatClient()
+async_gigachat_client = AsyncGigaChatClient()
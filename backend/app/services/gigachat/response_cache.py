@@ -0,0 +1,183 @@
+"""
+Content-addressed cache of GigaChat responses.
+Identical requests (model, prompts, sampling parameters) are served from
+memory or from the llm_response_cache table instead of calling the API again.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import CachedLLMResponse
+import hashlib
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Fallback responses produced by MCPAgent._call_mcp on errors start with this text
+ERROR_MARKER = "Error calling GigaChat"
+# Check DB tier size every N writes
+PRUNE_EVERY = 100
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + DB) cache for LLM responses"""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        persistent: Optional[bool] = None,
+        ttl: Optional[int] = None,
+        memory_max_entries: Optional[int] = None,
+        db_max_entries: Optional[int] = None
+    ):
+        self.enabled = settings.LLM_CACHE_ENABLED if enabled is None else enabled
+        self.persistent = settings.LLM_CACHE_PERSISTENT if persistent is None else persistent
+        self.ttl = ttl or settings.LLM_CACHE_TTL
+        self.db_max_entries = db_max_entries or settings.LLM_CACHE_DB_MAX_ENTRIES
+        self.memory = LRUCache(
+            max_entries=memory_max_entries or settings.LLM_CACHE_MEMORY_MAX_ENTRIES,
+            ttl=self.ttl
+        )
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.db_hits = 0
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Hash of everything that affects the response"""
+        payload = json.dumps(
+            [model, system_prompt, prompt, temperature, max_tokens],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_cacheable(response: str) -> bool:
+        """Error fallbacks must never be cached"""
+        return bool(response) and ERROR_MARKER not in response
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached response, checking memory first and then DB"""
+        if not self.enabled:
+            return None
+
+        response = self.memory.get(key)
+        if response is None and self.persistent:
+            response = self._db_get(key)
+            if response is not None:
+                self.memory.set(key, response)
+                with self._lock:
+                    self.db_hits += 1
+
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def set(self, key: str, response: str, model: str, agent_name: Optional[str] = None) -> None:
+        """Store response in both tiers"""
+        if not self.enabled or not self.is_cacheable(response):
+            return
+
+        self.memory.set(key, response)
+        if self.persistent:
+            self._db_set(key, response, model, agent_name)
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        self.memory.clear()
+        if not self.persistent:
+            return
+        db = SessionLocal()
+        try:
+            db.query(CachedLLMResponse).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[ResponseCache] Failed to clear DB cache: {str(e)}")
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "persistent": self.persistent,
+                "hits": self.hits,
+                "misses": self.misses,
+                "db_hits": self.db_hits,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "memory": self.memory.stats()
+            }
+
+    def _db_get(self, key: str) -> Optional[str]:
+        db = SessionLocal()
+        try:
+            entry = db.query(CachedLLMResponse).filter(
+                CachedLLMResponse.cache_key == key,
+                CachedLLMResponse.expires_at > datetime.now(timezone.utc)
+            ).first()
+            return entry.response if entry else None
+        except Exception as e:
+            # Cache must never break scoring
+            logger.warning(f"[ResponseCache] DB lookup failed: {str(e)}")
+            return None
+        finally:
+            db.close()
+
+    def _db_set(self, key: str, response: str, model: str, agent_name: Optional[str]) -> None:
+        db = SessionLocal()
+        try:
+            expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+            entry = db.query(CachedLLMResponse).filter(CachedLLMResponse.cache_key == key).first()
+            if entry:
+                entry.response = response
+                entry.expires_at = expires_at
+            else:
+                db.add(CachedLLMResponse(
+                    cache_key=key,
+                    agent_name=agent_name,
+                    model=model,
+                    response=response,
+                    expires_at=expires_at
+                ))
+            db.commit()
+
+            with self._lock:
+                self._writes += 1
+                should_prune = self._writes % PRUNE_EVERY == 0
+            if should_prune:
+                self._db_prune(db)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[ResponseCache] DB write failed: {str(e)}")
+        finally:
+            db.close()
+
+    def _db_prune(self, db) -> None:
+        """Delete expired entries and the oldest ones above db_max_entries"""
+        db.query(CachedLLMResponse).filter(
+            CachedLLMResponse.expires_at <= datetime.now(timezone.utc)
+        ).delete(synchronize_session=False)
+
+        cutoff = db.query(CachedLLMResponse.id).order_by(
+            CachedLLMResponse.id.desc()
+        ).offset(self.db_max_entries).limit(1).scalar()
+        if cutoff is not None:
+            deleted = db.query(CachedLLMResponse).filter(
+                CachedLLMResponse.id <= cutoff
+            ).delete(synchronize_session=False)
+            logger.info(f"[ResponseCache] Evicted {deleted} oldest DB entries")
+        db.commit()
+
+
+response_cache = ResponseCache()
@@ -1,5 +1,15 @@
 from app.services.parsers.base_parser import DocumentParser
 from app.services.parsers.document_parser_factory import DocumentParserFactory
+from app.services.parsers.parse_cache import ParseCache, ParsedPages, parse_cache
+from app.services.parsers.parse_executor import ParseExecutor, ParserBusyError, ParseTimeoutError, parse_executor
+from app.services.parsers.url_fetcher import PageTooLargeError, URLFetcher, url_fetcher
+from app.services.parsers.upload_storage import UploadTooLargeError, save_upload
 
-__all__ = ["DocumentParser", "DocumentParserFactory"]
+__all__ = [
+    "DocumentParser", "DocumentParserFactory",
+    "ParseCache", "ParsedPages", "parse_cache",
+    "ParseExecutor", "ParserBusyError", "ParseTimeoutError", "parse_executor",
+    "UploadTooLargeError", "save_upload",
+    "PageTooLargeError", "URLFetcher", "url_fetcher",
+]
 
@@ -1,9 +1,41 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+# Separator between pages/slides in extracted text
+PAGE_SEPARATOR = "\n\n"
+
+
+def join_pages(pages: List[str]) -> Tuple[str, List[int]]:
+    """
+    Join page texts into document text
+
+    Args:
+        pages: Text of every page, empty pages are skipped in the result
+
+    Returns:
+        Document text and the offset where each page starts in it
+    """
+    parts = []
+    offsets = []
+    position = 0
+    for page in pages:
+        offsets.append(position)
+        if not page:
+            continue
+        if parts:
+            position += len(PAGE_SEPARATOR)
+            offsets[-1] = position
+        parts.append(page)
+        position += len(page)
+    return PAGE_SEPARATOR.join(parts), offsets
 
 
 class DocumentParser(ABC):
     """Base class for document parsers"""
     
+    # Bump when a change to the parser changes its output; cached parses of older versions are ignored
+    VERSION = "1"
+    
     @abstractmethod
     def parse(self, source: str) -> str:
         """
@@ -16,4 +48,11 @@ class DocumentParser(ABC):
             Extracted text content
         """
         pass
-
+    
+    def parse_pages(self, source: str) -> List[str]:
+        """
+        Parse document into per-page (per-slide) texts
+        
+        Formats without pages return the whole text as a single page.
+        """
+        return [self.parse(source)]
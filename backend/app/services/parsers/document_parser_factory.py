@@ -1,3 +1,4 @@
+from typing import List, Type
 from app.services.parsers.base_parser import DocumentParser
 from app.services.parsers.pdf_parser import PDFParser
 from app.services.parsers.markdown_parser import MarkdownParser
@@ -31,12 +32,15 @@ class DocumentParserFactory:
         Returns:
             DocumentParser instance
         """
-        content_type = content_type.lower()
-        parser_class = cls._parsers.get(content_type)
-        
-        if not parser_class:
-            # Default to text parser
-            parser_class = TextParser
-        
-        return parser_class()
+        return cls.get_parser_class(content_type)()
+    
+    @classmethod
+    def get_parser_class(cls, content_type: str) -> Type[DocumentParser]:
+        """Parser class for content type, TextParser for unknown types"""
+        return cls._parsers.get(content_type.lower(), TextParser)
+    
+    @classmethod
+    def parser_classes(cls) -> List[Type[DocumentParser]]:
+        """All registered parser classes"""
+        return list(dict.fromkeys(cls._parsers.values()))
 
@@ -0,0 +1,58 @@
+"""
+Streaming HTML to text conversion.
+The document is fed in chunks as it is downloaded and only the text is
+kept, so large pages never have to be held or turned into a tree.
+"""
+from html.parser import HTMLParser
+from typing import List
+
+# Elements whose content is not page text
+SKIPPED_TAGS = {"script", "style", "noscript", "template", "svg"}
+# Elements that start a new line of text
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "td", "th",
+    "title", "tr", "ul"
+}
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Collects visible text of an HTML document fed with feed()"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def text(self) -> str:
+        """Text collected so far, whitespace cleaned up"""
+        self.close()
+        return clean_text("".join(self._parts))
+
+
+def clean_text(text: str) -> str:
+    """One phrase per line, without blank lines and surrounding whitespace"""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
@@ -0,0 +1,197 @@
+"""
+Content-addressed cache of parsed uploads.
+Pages extracted from a file are keyed by the file's SHA-256, the parser
+class and its VERSION, so re-uploading the same deck skips parsing and a
+parser change (VERSION bump) makes older entries unreachable; they are
+deleted on the next prune. Memory tier is bounded by extracted text size.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import CachedParse
+from app.services.parsers.document_parser_factory import DocumentParserFactory
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Check DB tier size every N writes
+PRUNE_EVERY = 50
+
+
+class ParsedPages(NamedTuple):
+    pages: List[str]
+    parse_seconds: Optional[float]  # Time the original parse took
+
+
+class ParseCache:
+    """Two-tier (memory LRU + DB) cache of pages extracted from uploaded files"""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        memory_max_bytes: Optional[int] = None,
+        db_max_entries: Optional[int] = None
+    ):
+        self.enabled = settings.PARSE_CACHE_ENABLED if enabled is None else enabled
+        self.db_max_entries = db_max_entries or settings.PARSE_CACHE_DB_MAX_ENTRIES
+        self.memory = LRUCache(
+            max_entries=self.db_max_entries,
+            max_bytes=memory_max_bytes or settings.PARSE_CACHE_MEMORY_MAX_BYTES,
+            size_of=lambda entry: sum(len(page) for page in entry.pages)
+        )
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.db_hits = 0
+        self.seconds_saved = 0.0
+
+    @staticmethod
+    def parser_key(content_type: str) -> Tuple[str, str]:
+        """(parser type, parser version) used for content_type"""
+        parser_class = DocumentParserFactory.get_parser_class(content_type)
+        return parser_class.__name__, parser_class.VERSION
+
+    def get(self, file_hash: str, content_type: str) -> Optional[ParsedPages]:
+        """Get pages of a file parsed by the current parser for content_type, memory first and then DB"""
+        if not self.enabled or not file_hash:
+            return None
+
+        key = (file_hash, *self.parser_key(content_type))
+        entry = self.memory.get(key)
+        if entry is None:
+            entry = self._db_get(key)
+            if entry is not None:
+                self.memory.set(key, entry)
+                with self._lock:
+                    self.db_hits += 1
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.seconds_saved += entry.parse_seconds or 0.0
+        return entry
+
+    def set(self, file_hash: str, content_type: str, pages: List[str], parse_seconds: Optional[float] = None) -> None:
+        """Store pages of a parsed file in both tiers"""
+        if not self.enabled or not file_hash:
+            return
+
+        key = (file_hash, *self.parser_key(content_type))
+        entry = ParsedPages(list(pages), parse_seconds)
+        self.memory.set(key, entry)
+        self._db_set(key, entry)
+
+    def clear(self) -> None:
+        """Remove all cached parses"""
+        self.memory.clear()
+        db = SessionLocal()
+        try:
+            db.query(CachedParse).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[ParseCache] Failed to clear DB cache: {str(e)}")
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and parsing time saved"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "db_hits": self.db_hits,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "seconds_saved": round(self.seconds_saved, 3),
+                "memory": self.memory.stats()
+            }
+
+    def _db_get(self, key: Tuple[str, str, str]) -> Optional[ParsedPages]:
+        file_hash, parser_type, parser_version = key
+        db = SessionLocal()
+        try:
+            entry = db.query(CachedParse).filter(
+                CachedParse.file_hash == file_hash,
+                CachedParse.parser_type == parser_type,
+                CachedParse.parser_version == parser_version
+            ).first()
+            if entry is None:
+                return None
+            entry.last_used_at = datetime.now(timezone.utc)
+            db.commit()
+            return ParsedPages(entry.pages, entry.parse_seconds)
+        except Exception as e:
+            # Cache must never break uploads
+            db.rollback()
+            logger.warning(f"[ParseCache] DB lookup failed: {str(e)}")
+            return None
+        finally:
+            db.close()
+
+    def _db_set(self, key: Tuple[str, str, str], entry: ParsedPages) -> None:
+        file_hash, parser_type, parser_version = key
+        db = SessionLocal()
+        try:
+            db.add(CachedParse(
+                file_hash=file_hash,
+                parser_type=parser_type,
+                parser_version=parser_version,
+                pages=entry.pages,
+                text_length=sum(len(page) for page in entry.pages),
+                parse_seconds=entry.parse_seconds
+            ))
+            db.commit()
+
+            with self._lock:
+                self._writes += 1
+                should_prune = self._writes % PRUNE_EVERY == 0
+            if should_prune:
+                self._db_prune(db)
+        except IntegrityError:
+            # Same file was parsed concurrently and stored first
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[ParseCache] DB write failed: {str(e)}")
+        finally:
+            db.close()
+
+    def _db_prune(self, db) -> None:
+        """Delete entries of outdated parser versions and the least recently used ones above db_max_entries"""
+        current = {
+            parser_class.__name__: parser_class.VERSION
+            for parser_class in DocumentParserFactory.parser_classes()
+        }
+        outdated = db.query(CachedParse).filter(or_(
+            CachedParse.parser_type.notin_(list(current)),
+            *[
+                (CachedParse.parser_type == parser_type) & (CachedParse.parser_version != version)
+                for parser_type, version in current.items()
+            ]
+        )).delete(synchronize_session=False)
+        if outdated:
+            logger.info(f"[ParseCache] Deleted {outdated} entries of outdated parser versions")
+
+        cutoff = db.query(CachedParse.last_used_at, CachedParse.id).order_by(
+            CachedParse.last_used_at.desc(), CachedParse.id.desc()
+        ).offset(self.db_max_entries).limit(1).first()
+        if cutoff is not None:
+            deleted = db.query(CachedParse).filter(or_(
+                CachedParse.last_used_at < cutoff.last_used_at,
+                (CachedParse.last_used_at == cutoff.last_used_at) & (CachedParse.id <= cutoff.id)
+            )).delete(synchronize_session=False)
+            logger.info(f"[ParseCache] Evicted {deleted} least recently used DB entries")
+        db.commit()
+
+
+parse_cache = ParseCache()
@@ -0,0 +1,273 @@
+"""
+Document parsing off the event loop.
+CPU-heavy formats (PDF, presentations) are parsed in a bounded process
+pool, large PDFs split into page ranges parsed in parallel; URLs are
+fetched on the event loop by the pooled async fetcher; everything else
+(text files) runs in a thread pool. Each parse has
+a timeout; a worker process stuck on a document is killed and the pool
+recreated, so one pathological deck can't hold the API or a worker forever.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.services.parsers.base_parser import join_pages
+from app.services.parsers.document_parser_factory import DocumentParserFactory
+from app.services.parsers.pdf_parser import PDFParser
+from app.services.parsers.url_parser import URLParser
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Content types parsed in worker processes
+CPU_BOUND_TYPES = {"pdf", "pptx", "ppt"}
+# Content types fetched with async I/O, without a pool
+ASYNC_TYPES = {"url"}
+
+
+class ParserBusyError(Exception):
+    """Too many documents are already waiting for a parser"""
+
+
+class ParseTimeoutError(Exception):
+    """Document wasn't parsed within the timeout"""
+
+
+# Functions below run in pool workers
+
+def parse_document_pages(content_type: str, source: str) -> List[str]:
+    """Parse document into pages with the parser for content_type"""
+    return DocumentParserFactory.get_parser(content_type).parse_pages(source)
+
+
+def pdf_page_count(source: str) -> int:
+    """Number of pages in PDF file"""
+    return PDFParser().page_count(source)
+
+
+def parse_pdf_pages(source: str, start: int, end: int) -> List[str]:
+    """Text of PDF pages [start, end)"""
+    return PDFParser().parse_pages(source, start, end)
+
+
+class _PoolStats:
+    """Counters of one pool"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.workers),
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "avg_seconds": round(self.total_seconds / finished, 3) if finished else None,
+            "max_seconds": round(self.max_seconds, 3)
+        }
+
+
+class ParseExecutor:
+    """Process pool for CPU-bound parsers, thread pool for file-based I/O-bound ones, async fetching for URLs"""
+
+    def __init__(
+        self,
+        process_workers: Optional[int] = None,
+        thread_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_queue: Optional[int] = None
+    ):
+        """
+        Args:
+            process_workers: Worker processes for PDF/PPTX
+            thread_workers: Threads for text files
+            timeout: Seconds a single document may take
+            max_queue: Documents allowed to wait per pool before new ones are rejected
+        """
+        self.process_workers = process_workers or settings.PARSER_PROCESS_WORKERS
+        self.thread_workers = thread_workers or settings.PARSER_THREAD_WORKERS
+        self.timeout = timeout or settings.PARSER_TIMEOUT
+        self.max_queue = settings.PARSER_MAX_QUEUE if max_queue is None else max_queue
+        self.pdf_pages_per_task = settings.PARSER_PDF_PAGES_PER_TASK
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "process": _PoolStats(self.process_workers),
+            "thread": _PoolStats(self.thread_workers),
+            "async": _PoolStats(settings.URL_FETCH_MAX_CONNECTIONS)
+        }
+
+    async def parse(self, content_type: str, source: str) -> str:
+        """
+        Parse document without blocking the event loop
+
+        Args:
+            content_type: File extension or "url"
+            source: File path or URL
+
+        Returns:
+            Extracted text
+
+        Raises:
+            ParserBusyError: Pool queue is full
+            ParseTimeoutError: Parsing took longer than the timeout
+            ValueError: Parser failed
+        """
+        text, _ = join_pages(await self.parse_pages(content_type, source))
+        return text
+
+    async def parse_pages(self, content_type: str, source: str) -> List[str]:
+        """
+        Parse document into per-page (per-slide) texts without blocking the event loop.
+        PDFs with more than PDF_PAGES_PER_TASK pages are split into page ranges
+        parsed in parallel by the process pool.
+
+        Raises:
+            ParserBusyError: Pool queue is full
+            ParseTimeoutError: Parsing took longer than the timeout
+            ValueError: Parser failed
+        """
+        content_type = content_type.lower()
+        if content_type in CPU_BOUND_TYPES:
+            kind = "process"
+        elif content_type in ASYNC_TYPES:
+            kind = "async"
+        else:
+            kind = "thread"
+        stats = self._stats[kind]
+        with self._lock:
+            if stats.in_flight >= stats.workers + self.max_queue:
+                raise ParserBusyError(f"Too many documents are being parsed ({stats.in_flight}), try again later")
+            stats.in_flight += 1
+
+        started_at = time.monotonic()
+        futures: List[Future] = []
+        failed = True
+        timed_out = False
+        try:
+            pages = await asyncio.wait_for(self._parse_pages(kind, content_type, source, futures), timeout=self.timeout)
+            failed = False
+            return pages
+        except asyncio.TimeoutError:
+            timed_out = True
+            self._on_timeout(kind, futures)
+            raise ParseTimeoutError(f"Parsing {content_type} document took longer than {self.timeout:g}s")
+        except BrokenProcessPool:
+            raise ValueError("Parser worker crashed")
+        except asyncio.CancelledError:
+            # Client went away or shutdown: drop parts that haven't started
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            # Slot is released however the parse ends, including cancellation
+            self._finish(stats, started_at, failed=failed, timed_out=timed_out)
+
+    async def _parse_pages(self, kind: str, content_type: str, source: str, futures: List[Future]) -> List[str]:
+        """Submit parsing to the pool, recording submitted futures for timeout handling"""
+        if kind == "async":
+            # The fetch is cancelled on timeout, closing its connection
+            return [await URLParser().parse_async(source)]
+        if content_type != "pdf":
+            return await self._submit(kind, futures, parse_document_pages, content_type, source)
+
+        page_count = await self._submit(kind, futures, pdf_page_count, source)
+        ranges = [
+            (start, min(start + self.pdf_pages_per_task, page_count))
+            for start in range(0, page_count, self.pdf_pages_per_task)
+        ]
+        parts = await asyncio.gather(*[
+            self._submit(kind, futures, parse_pdf_pages, source, start, end) for start, end in ranges
+        ])
+        return [page for part in parts for page in part]
+
+    async def _submit(self, kind: str, futures: List[Future], function, *args):
+        with self._lock:
+            pool = self._pool(kind)
+        future = pool.submit(function, *args)
+        futures.append(future)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and timing counters of both pools"""
+        with self._lock:
+            return {kind: stats.as_dict() for kind, stats in self._stats.items()}
+
+    def shutdown(self) -> None:
+        """Stop pools, abandoning queued documents"""
+        with self._lock:
+            if self._process_pool:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+            if self._thread_pool:
+                self._thread_pool.shutdown(wait=False, cancel_futures=True)
+                self._thread_pool = None
+
+    def _pool(self, kind: str):
+        """Pool for kind, created on first use (called under lock)"""
+        if kind == "process":
+            if self._process_pool is None:
+                # Spawned, not forked: the API process has threads and open DB connections
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="parser")
+        return self._thread_pool
+
+    def _finish(self, stats: _PoolStats, started_at: float, failed: bool, timed_out: bool = False) -> None:
+        elapsed = time.monotonic() - started_at
+        with self._lock:
+            stats.in_flight -= 1
+            if timed_out:
+                stats.timeouts += 1
+                return
+            if failed:
+                stats.failed += 1
+            else:
+                stats.completed += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+
+    def _on_timeout(self, kind: str, futures: List[Future]) -> None:
+        # Queued parts are cancelled, running ones can't be
+        running = [future for future in futures if not future.done() and not future.cancel()]
+        if not running:
+            return
+
+        logger.warning(f"[ParseExecutor] {kind} parse timed out after {self.timeout:g}s")
+        if kind != "process":
+            # Threads can't be killed (async fetches are cancelled by wait_for)
+            return
+
+        # Kill the stuck worker processes: replace the pool and terminate the old one.
+        # Other documents running in the old pool fail with "Parser worker crashed".
+        with self._lock:
+            pool = self._process_pool
+            self._process_pool = None
+        if pool is None:
+            return
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+
+parse_executor = ParseExecutor()
@@ -1,33 +1,112 @@
-from app.services.parsers.base_parser import DocumentParser
+from typing import List, Optional
+from app.services.parsers.base_parser import DocumentParser, join_pages
 import PyPDF2
 import pdfplumber
 
 
 class PDFParser(DocumentParser):
-    """Parser for PDF files"""
-    
+    """
+    Parser for PDF files
+
+    The text layer is read with PyPDF2 first (fast). pdfplumber's slower layout
+    analysis is used only for pages that need it: no or little text, likely
+    tables, or pages PyPDF2 failed on. Failures are handled per page.
+    """
+
+    VERSION = "2"
+
+    # Pages with less text than this are re-read with pdfplumber
+    MIN_PAGE_CHARS = 20
+    # Share of digits among non-space characters above which a page is treated as a table
+    TABLE_DIGIT_RATIO = 0.3
+
     def parse(self, source: str) -> str:
         """Extract text from PDF file"""
-        text_parts = []
-        
-        # Try pdfplumber first (better for complex PDFs)
+        text, _ = join_pages(self.parse_pages(source))
+        return text
+
+    def page_count(self, source: str) -> int:
+        """Number of pages in PDF file"""
         try:
-            with pdfplumber.open(source) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
+            with open(source, 'rb') as file:
+                return len(PyPDF2.PdfReader(file).pages)
         except Exception:
-            # Fallback to PyPDF2
             try:
-                with open(source, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text = page.extract_text()
-                        if text:
-                            text_parts.append(text)
+                with pdfplumber.open(source) as pdf:
+                    return len(pdf.pages)
             except Exception as e:
                 raise ValueError(f"Failed to parse PDF: {str(e)}")
-        
-        return "\n\n".join(text_parts)
 
+    def parse_pages(self, source: str, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """
+        Extract text of pages [start, end)
+
+        Args:
+            source: PDF file path
+            start: First page index
+            end: Page index to stop before, None for the last page
+
+        Returns:
+            Text of each page ("" for pages without extractable text)
+        """
+        fast_pages = self._read_text_layer(source, start, end)
+        if fast_pages is None:
+            # PyPDF2 can't open the file at all, use pdfplumber for every page
+            return [text.strip() for text in self._read_layout(source, start, end)]
+
+        layout_indexes = [index for index, text in enumerate(fast_pages) if self._needs_layout(text)]
+        if not layout_indexes:
+            return [text.strip() for text in fast_pages]
+
+        pages = [text or "" for text in fast_pages]
+        try:
+            with pdfplumber.open(source) as pdf:
+                for index in layout_indexes:
+                    try:
+                        layout_text = pdf.pages[start + index].extract_text() or ""
+                    except Exception:
+                        continue  # Keep whatever the text layer gave for this page
+                    if len(layout_text.strip()) >= len(pages[index].strip()):
+                        pages[index] = layout_text
+        except Exception:
+            pass  # pdfplumber can't open the file, text layer is all we have
+        return [text.strip() for text in pages]
+
+    def _read_text_layer(self, source: str, start: int, end: Optional[int]) -> Optional[List[Optional[str]]]:
+        """Text layer of each page, None for pages that failed; None if the file can't be opened"""
+        try:
+            with open(source, 'rb') as file:
+                reader = PyPDF2.PdfReader(file)
+                pages = []
+                for page in reader.pages[start:end]:
+                    try:
+                        pages.append(page.extract_text() or "")
+                    except Exception:
+                        pages.append(None)
+                return pages
+        except Exception:
+            return None
+
+    def _read_layout(self, source: str, start: int, end: Optional[int]) -> List[str]:
+        """Text of each page with pdfplumber layout analysis"""
+        try:
+            with pdfplumber.open(source) as pdf:
+                pages = []
+                for page in pdf.pages[start:end]:
+                    try:
+                        pages.append(page.extract_text() or "")
+                    except Exception:
+                        pages.append("")
+                return pages
+        except Exception as e:
+            raise ValueError(f"Failed to parse PDF: {str(e)}")
+
+    def _needs_layout(self, text: Optional[str]) -> bool:
+        """Whether a page's text layer is missing, too short or looks like a table"""
+        if text is None:
+            return True
+        characters = [char for char in text if not char.isspace()]
+        if len(characters) < self.MIN_PAGE_CHARS:
+            return True
+        digits = sum(char.isdigit() for char in characters)
+        return digits / len(characters) > self.TABLE_DIGIT_RATIO
@@ -1,4 +1,5 @@
-from app.services.parsers.base_parser import DocumentParser
+from typing import List
+from app.services.parsers.base_parser import DocumentParser, join_pages
 from pptx import Presentation
 
 
@@ -7,7 +8,12 @@ class PresentationParser(DocumentParser):
     
     def parse(self, source: str) -> str:
         """Extract text from presentation slides"""
-        text_parts = []
+        text, _ = join_pages(self.parse_pages(source))
+        return text
+    
+    def parse_pages(self, source: str) -> List[str]:
+        """Extract text of each slide ("" for slides without text)"""
+        pages = []
         
         try:
             prs = Presentation(source)
@@ -17,9 +23,10 @@ class PresentationParser(DocumentParser):
                     if hasattr(shape, "text") and shape.text:
                         slide_text.append(shape.text)
                 if len(slide_text) > 1:  # More than just "Slide X:"
-                    text_parts.append("\n".join(slide_text))
+                    pages.append("\n".join(slide_text))
+                else:
+                    pages.append("")
         except Exception as e:
             raise ValueError(f"Failed to parse presentation: {str(e)}")
         
-        return "\n\n".join(text_parts)
-
+        return pages
@@ -0,0 +1,63 @@
+"""
+Streaming of uploaded files to UPLOAD_DIR.
+Files are copied in chunks with async file I/O, hashed on the way and
+rejected as soon as they exceed MAX_UPLOAD_SIZE, so an upload never has
+to fit in memory and its hash is available without re-reading it.
+"""
+from typing import Optional, Tuple
+from fastapi import UploadFile
+from app.core.config import settings
+import aiofiles
+import aiofiles.os
+import hashlib
+
+
+class UploadTooLargeError(Exception):
+    """Upload exceeds MAX_UPLOAD_SIZE"""
+
+
+async def save_upload(
+    upload: UploadFile,
+    path: str,
+    max_size: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Stream upload to path
+
+    Args:
+        upload: Uploaded file
+        path: Destination file path
+        max_size: Max size in bytes, defaults to MAX_UPLOAD_SIZE
+        chunk_size: Bytes read at a time, defaults to UPLOAD_CHUNK_SIZE
+
+    Returns:
+        Size in bytes and SHA-256 hex digest of the file
+
+    Raises:
+        UploadTooLargeError: Upload is larger than max_size (nothing is kept on disk)
+    """
+    max_size = max_size or settings.MAX_UPLOAD_SIZE
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+    partial_path = f"{path}.part"
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(partial_path, "wb") as f:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(f"File exceeds maximum upload size of {max_size} bytes")
+                digest.update(chunk)
+                await f.write(chunk)
+        await aiofiles.os.replace(partial_path, path)
+    except BaseException:
+        if await aiofiles.os.path.exists(partial_path):
+            await aiofiles.os.remove(partial_path)
+        raise
+
+    return size, digest.hexdigest()
@@ -0,0 +1,189 @@
+"""
+Async fetching of pitch web pages.
+Pages are downloaded through a pooled keep-alive httpx client, streamed
+into the HTML text extractor with a body size cap, and revalidated with
+conditional GETs (ETag / Last-Modified) against an in-process cache of
+extracted text, so an unchanged landing page is neither re-downloaded
+nor re-parsed.
+"""
+from typing import Any, Dict, Optional, Tuple
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.services.parsers.html_text import HTMLTextExtractor, clean_text
+import asyncio
+import codecs
+import logging
+import re
+import threading
+import httpx
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+# Bytes read from the response at a time
+CHUNK_SIZE = 64 * 1024
+# <meta charset> is looked for in this many leading bytes when the header has none
+CHARSET_SNIFF_BYTES = 2048
+CHARSET_PATTERN = re.compile(rb'charset=["\']?([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+
+class PageTooLargeError(ValueError):
+    """Page body exceeds URL_FETCH_MAX_BYTES"""
+
+
+class URLFetcher:
+    """Pooled async client with body size cap and conditional GET cache"""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        cache: Optional[LRUCache] = None
+    ):
+        """
+        Args:
+            max_bytes: Max page body size
+            timeout: Seconds for connect and for each read
+            max_connections: Connections kept in the pool
+            cache: Cache of extracted text to share, a new one by default
+        """
+        self.max_bytes = max_bytes or settings.URL_FETCH_MAX_BYTES
+        self.timeout = httpx.Timeout(timeout or settings.URL_FETCH_TIMEOUT)
+        self.max_connections = max_connections or settings.URL_FETCH_MAX_CONNECTIONS
+        # url -> (etag, last_modified, text)
+        self.cache = cache or LRUCache(
+            max_entries=settings.URL_CACHE_MAX_ENTRIES,
+            max_bytes=settings.URL_CACHE_MAX_BYTES,
+            size_of=lambda entry: len(entry[2])
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.not_modified = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Client is created lazily and reused until aclose()"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+
+    async def fetch_text(self, url: str) -> str:
+        """
+        Text of the web page at url
+
+        Raises:
+            PageTooLargeError: Body is larger than max_bytes
+            ValueError: Request failed or the page isn't HTML/text
+        """
+        cached = self.cache.get(url)
+        headers = _conditional_headers(cached)
+        try:
+            async with self.client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    with self._lock:
+                        self.not_modified += 1
+                    return cached[2]
+                response.raise_for_status()
+                text = await self._read_text(response)
+        except httpx.HTTPError as e:
+            raise ValueError(f"Failed to parse URL: {str(e)}")
+
+        with self._lock:
+            self.fetches += 1
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self.cache.set(url, (etag, last_modified, text))
+        else:
+            self.cache.delete(url)
+        return text
+
+    async def _read_text(self, response: httpx.Response) -> str:
+        """Stream body into the extractor, stopping at max_bytes"""
+        content_length = response.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise PageTooLargeError(f"Page exceeds maximum size of {self.max_bytes} bytes")
+
+        media_type = response.headers.get("content-type", "text/html").split(";")[0].strip().lower()
+        is_html = media_type in ("", "text/html", "application/xhtml+xml")
+        if not is_html and not media_type.startswith("text/"):
+            raise ValueError(f"Failed to parse URL: unsupported content type {media_type}")
+
+        extractor = HTMLTextExtractor() if is_html else None
+        parts = []
+        decoder = None
+        size = 0
+        async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise PageTooLargeError(f"Page exceeds maximum size of {self.max_bytes} bytes")
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(_charset(response, chunk))(errors="replace")
+            data = decoder.decode(chunk)
+            if extractor:
+                # HTML parsing is CPU work, keep it off the event loop
+                await asyncio.to_thread(extractor.feed, data)
+            else:
+                parts.append(data)
+
+        tail = decoder.decode(b"", final=True) if decoder else ""
+        if extractor:
+            extractor.feed(tail)
+            return extractor.text()
+        return clean_text("".join(parts) + tail)
+
+    def stats(self) -> Dict[str, Any]:
+        """Downloads, 304 revalidations and cache counters"""
+        with self._lock:
+            return {
+                "fetches": self.fetches,
+                "not_modified": self.not_modified,
+                "cache": self.cache.stats()
+            }
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _conditional_headers(cached: Optional[Tuple[Optional[str], Optional[str], str]]) -> Dict[str, str]:
+    if cached is None:
+        return {}
+    etag, last_modified, _ = cached
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _charset(response: httpx.Response, first_chunk: bytes) -> str:
+    """Charset from Content-Type, then from <meta> in the first chunk, UTF-8 otherwise"""
+    candidates = [response.charset_encoding]
+    match = CHARSET_PATTERN.search(first_chunk[:CHARSET_SNIFF_BYTES])
+    if match:
+        candidates.append(match.group(1).decode("ascii"))
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+url_fetcher = URLFetcher()
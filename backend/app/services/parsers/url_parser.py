@@ -1,35 +1,23 @@
 from app.services.parsers.base_parser import DocumentParser
-import requests
-from bs4 import BeautifulSoup
+from app.services.parsers.url_fetcher import URLFetcher, url_fetcher
+import asyncio
 
 
 class URLParser(DocumentParser):
     """Parser for web pages"""
     
+    async def parse_async(self, source: str) -> str:
+        """Extract text from web page with the shared pooled fetcher"""
+        return await url_fetcher.fetch_text(source)
+    
     def parse(self, source: str) -> str:
-        """Extract text from web page"""
+        """Extract text from web page (blocking, for callers outside the event loop)"""
+        return asyncio.run(self._parse_once(source))
+    
+    async def _parse_once(self, source: str) -> str:
+        # The pooled client belongs to the app's event loop, use a short-lived one sharing its cache
+        fetcher = URLFetcher(cache=url_fetcher.cache)
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(source, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
-            
-            return text
-        except Exception as e:
-            raise ValueError(f"Failed to parse URL: {str(e)}")
-
+            return await fetcher.fetch_text(source)
+        finally:
+            await fetcher.aclose()
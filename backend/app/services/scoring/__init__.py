@@ -1,4 +1,14 @@
 from app.services.scoring.scoring_service import ScoringService
+from app.services.scoring.scoring_jobs import ScoringJobRunner, enqueue_scoring_job, scoring_job_runner
+from app.services.scoring.reaggregation import reaggregate_scorings
+from app.services.scoring.latest_scoring import (
+    latest_scoring_id, latest_scorings, refresh_latest_score, rebuild_latest_scores, backfill_latest_scores
+)
+from app.services.scoring.what_if import Portfolio, normalize_weights, portfolio_cache, what_if
 
-__all__ = ["ScoringService"]
-
+__all__ = [
+    "ScoringService", "ScoringJobRunner", "enqueue_scoring_job", "scoring_job_runner",
+    "reaggregate_scorings", "latest_scoring_id", "latest_scorings",
+    "refresh_latest_score", "rebuild_latest_scores", "backfill_latest_scores",
+    "Portfolio", "normalize_weights", "portfolio_cache", "what_if",
+]
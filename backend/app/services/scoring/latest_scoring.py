@@ -0,0 +1,135 @@
+"""
+Latest scoring of startups in a single query, and the startup_latest_score
+projection the leaderboard reads instead of scanning scorings.
+Queries are served by the (startup_id, created_at DESC) index on scorings;
+ties on created_at are broken by the higher scoring id.
+"""
+from typing import Optional
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from app.models import Startup, Scoring, StartupLatestScore
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def latest_scoring_id(startup_id_column):
+    """
+    Correlated scalar subquery with the id of the latest scoring of a startup
+
+    Args:
+        startup_id_column: Startup id column of the outer query
+
+    Returns:
+        Scalar subquery, NULL for startups without scorings
+    """
+    return select(Scoring.id).where(
+        Scoring.startup_id == startup_id_column
+    ).order_by(
+        Scoring.created_at.desc(), Scoring.id.desc()
+    ).limit(1).correlate_except(Scoring).scalar_subquery()
+
+
+def latest_scorings():
+    """
+    Subquery with the latest scoring of every scored startup
+
+    Returns:
+        Subquery with startup_id, scoring_id, total_score, breakdown and created_at
+    """
+    ranked = select(
+        Scoring.startup_id,
+        Scoring.id.label("scoring_id"),
+        Scoring.total_score,
+        Scoring.breakdown,
+        Scoring.created_at,
+        func.row_number().over(
+            partition_by=Scoring.startup_id,
+            order_by=(Scoring.created_at.desc(), Scoring.id.desc())
+        ).label("position")
+    ).subquery()
+
+    return select(
+        ranked.c.startup_id,
+        ranked.c.scoring_id,
+        ranked.c.total_score,
+        ranked.c.breakdown,
+        ranked.c.created_at
+    ).where(ranked.c.position == 1).subquery("latest_scorings")
+
+
+def refresh_latest_score(db: Session, startup_id: int) -> Optional[StartupLatestScore]:
+    """
+    Point the startup's projection row at its latest scoring.
+    Call before committing any change to the startup's scorings or filter attributes,
+    so the projection is updated in the same transaction.
+
+    Args:
+        db: Database session
+        startup_id: Startup ID
+
+    Returns:
+        Projection row, None if the startup has no scorings
+    """
+    # Sessions don't autoflush: make pending scorings visible to the query
+    db.flush()
+    # Serialize refreshes of one startup until commit, so concurrent scorings neither both
+    # insert the row nor let an older scoring overwrite a newer one. NO KEY UPDATE doesn't
+    # conflict with the key share lock the scoring insert already holds on the startup.
+    db.query(Startup.id).filter(Startup.id == startup_id).with_for_update(key_share=True).first()
+    scoring = db.query(Scoring).filter(
+        Scoring.startup_id == startup_id
+    ).order_by(Scoring.created_at.desc(), Scoring.id.desc()).first()
+    # Re-read: another transaction may have written the row while we waited for the lock
+    entry = db.get(StartupLatestScore, startup_id, populate_existing=True)
+
+    if scoring is None:
+        if entry is not None:
+            db.delete(entry)
+        return None
+
+    if entry is None:
+        entry = StartupLatestScore(startup_id=startup_id)
+        db.add(entry)
+    startup = scoring.startup
+    entry.scoring_id = scoring.id
+    entry.total_score = scoring.total_score
+    entry.breakdown = scoring.breakdown
+    entry.industry = startup.industry
+    entry.stage = startup.stage
+    entry.geography = startup.geography
+    return entry
+
+
+def rebuild_latest_scores(db: Session) -> int:
+    """
+    Rebuild the whole projection from scorings (backfill)
+
+    Returns:
+        Number of startups in the projection
+    """
+    latest = latest_scorings()
+    db.query(StartupLatestScore).delete(synchronize_session=False)
+    db.execute(insert(StartupLatestScore).from_select(
+        ["startup_id", "scoring_id", "total_score", "breakdown", "industry", "stage", "geography"],
+        select(
+            latest.c.startup_id,
+            latest.c.scoring_id,
+            latest.c.total_score,
+            latest.c.breakdown,
+            Startup.industry,
+            Startup.stage,
+            Startup.geography
+        ).join(Startup, Startup.id == latest.c.startup_id)
+    ))
+    db.commit()
+    count = db.query(func.count(StartupLatestScore.startup_id)).scalar()
+    logger.info(f"[LatestScore] Rebuilt projection for {count} startups")
+    return count
+
+
+def backfill_latest_scores(db: Session) -> int:
+    """Rebuild the projection if it's empty while scorings exist (first start after upgrade)"""
+    if db.query(StartupLatestScore.startup_id).first() or not db.query(Scoring.id).first():
+        return 0
+    return rebuild_latest_scores(db)
@@ -0,0 +1,80 @@
+"""
+Offline re-aggregation of scorings from stored agent results.
+Recomputes breakdown, total, risks, recommendations and team info with the
+current ScoringService rules without calling any agent.
+"""
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session, selectinload
+from app.core.database import SessionLocal
+from app.core.data_version import portfolio_version
+from app.models import Scoring
+from app.services.scoring.scoring_service import ScoringService
+from app.services.scoring.latest_scoring import refresh_latest_score
+from app.services.scoring.what_if import portfolio_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def reaggregate_scorings(
+    db: Session,
+    scoring_ids: Optional[List[int]] = None,
+    batch_size: int = 200
+) -> Dict[str, int]:
+    """
+    Recompute scorings from their stored agent results
+
+    Args:
+        db: Database session
+        scoring_ids: Scorings to recompute, None for all
+        batch_size: Scorings loaded and committed at a time
+
+    Returns:
+        Counters: updated, unchanged and skipped (no complete set of agent results)
+    """
+    scoring_service = ScoringService(db)
+    required_agents = set(ScoringService.AGENT_CLASSES)
+    counters = {"updated": 0, "unchanged": 0, "skipped": 0}
+
+    last_id = 0
+    while True:
+        query = db.query(Scoring).options(selectinload(Scoring.agent_results)).filter(Scoring.id > last_id)
+        if scoring_ids is not None:
+            query = query.filter(Scoring.id.in_(scoring_ids))
+        scorings = query.order_by(Scoring.id).limit(batch_size).all()
+        if not scorings:
+            break
+
+        for scoring in scorings:
+            results = {agent_result.agent_name: agent_result.result for agent_result in scoring.agent_results}
+            if not required_agents.issubset(results):
+                counters["skipped"] += 1
+                continue
+
+            aggregated = scoring_service.aggregate({agent_name: results[agent_name] for agent_name in ScoringService.AGENT_CLASSES})
+            changed = False
+            for field, value in aggregated.items():
+                if getattr(scoring, field) != value:
+                    setattr(scoring, field, value)
+                    changed = True
+            counters["updated" if changed else "unchanged"] += 1
+            if changed:
+                refresh_latest_score(db, scoring.startup_id)
+
+        db.commit()
+        last_id = scorings[-1].id
+        db.expunge_all()
+
+    if counters["updated"]:
+        portfolio_cache.invalidate()
+        portfolio_version.bump()
+    logger.info(f"[Reaggregation] Done: {counters}")
+    return counters
+
+
+if __name__ == "__main__":
+    session = SessionLocal()
+    try:
+        print(reaggregate_scorings(session))
+    finally:
+        session.close()
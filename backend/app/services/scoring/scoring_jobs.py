@@ -0,0 +1,343 @@
+"""
+Durable scoring job queue backed by the scoring_jobs table.
+Workers in every backend replica claim queued jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, so each job is run exactly once.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import ScoringJob, PitchDocument
+from app.services.scoring.scoring_service import ScoringService
+import logging
+import os
+import socket
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# How often each worker looks for abandoned running jobs
+STALE_CHECK_INTERVAL = 30
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue_scoring_job(
+    db: Session,
+    startup_id: int,
+    pitch_document_id: int,
+    options: Optional[Dict[str, Any]] = None
+) -> ScoringJob:
+    """
+    Put scoring job into the queue
+
+    Args:
+        db: Database session
+        startup_id: Startup ID
+        pitch_document_id: Pitch document to score
+        options: Scoring options stored with the job
+
+    Returns:
+        Created job in 'queued' status
+    """
+    job = ScoringJob(
+        startup_id=startup_id,
+        pitch_document_id=pitch_document_id,
+        status=JOB_QUEUED,
+        options=options or {},
+        progress={
+            "total": len(ScoringService.AGENT_CLASSES),
+            "completed": 0,
+            "agents": {}
+        },
+        attempts=0
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    logger.info(f"[ScoringJobs] Job {job.id} queued for startup_id={startup_id}")
+
+    # Let a local worker pick it up without waiting for the next poll
+    scoring_job_runner.wake()
+    return job
+
+
+class JobProgress:
+    """
+    Collects agent events of a running job and writes them to the job row.
+    Every write, and a heartbeat while agents are busy, refreshes updated_at
+    so the job isn't taken for abandoned while it's still running.
+    Writes only apply while the job is owned by worker_id.
+    """
+
+    def __init__(self, job_id: int, worker_id: str, agent_names: List[str], heartbeat_interval: Optional[float] = None):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.heartbeat_interval = heartbeat_interval or settings.SCORING_JOB_HEARTBEAT_INTERVAL
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._progress: Dict[str, Any] = {
+            "total": len(agent_names),
+            "completed": 0,
+            "agents": {agent_name: {"status": "pending"} for agent_name in agent_names}
+        }
+
+    def on_event(self, event: str, payload: Dict[str, Any]) -> None:
+        """ScoringService progress callback, called from agent threads"""
+        agent_name = payload.get("agent")
+        with self._lock:
+            if event == "agent_started" and agent_name:
+                self._progress["agents"][agent_name] = {"status": "running"}
+            elif event == "agent_completed" and agent_name:
+                self._progress["agents"][agent_name] = {
+                    "status": "failed" if payload.get("failed") else "completed",
+                    "score": payload.get("score"),
+                    "duration": payload.get("duration")
+                }
+                self._progress["completed"] = sum(
+                    1 for agent in self._progress["agents"].values()
+                    if agent["status"] in ("completed", "failed")
+                )
+            else:
+                return
+            progress = {
+                "total": self._progress["total"],
+                "completed": self._progress["completed"],
+                "agents": dict(self._progress["agents"])
+            }
+            # Write while holding the lock so updates land in event order
+            self._save({ScoringJob.progress: progress})
+
+    def start(self) -> None:
+        """Start heartbeat thread"""
+        self._stop_event.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name=f"scoring-job-heartbeat-{self.job_id}",
+            daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def stop(self) -> None:
+        """Stop heartbeat thread"""
+        self._stop_event.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop_event.wait(self.heartbeat_interval):
+            with self._lock:
+                self._save({})
+
+    def _save(self, values: Dict[Any, Any]) -> None:
+        db = SessionLocal()
+        try:
+            owned_job(db, self.job_id, self.worker_id).update(
+                {**values, ScoringJob.updated_at: _now()}, synchronize_session=False
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[ScoringJobs] Failed to save progress of job {self.job_id}: {str(e)}")
+        finally:
+            db.close()
+
+
+def owned_job(db: Session, job_id: int, worker_id: str):
+    """Query of the job while it's running on worker_id (not requeued or claimed by another worker)"""
+    return db.query(ScoringJob).filter(
+        ScoringJob.id == job_id,
+        ScoringJob.worker_id == worker_id,
+        ScoringJob.status == JOB_RUNNING
+    )
+
+
+class ScoringJobRunner:
+    """Background worker threads processing the scoring job queue"""
+
+    def __init__(self, workers: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.workers = settings.SCORING_JOB_WORKERS if workers is None else workers
+        self.poll_interval = poll_interval or settings.SCORING_JOB_POLL_INTERVAL
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._last_stale_check = 0.0
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(self) -> None:
+        """Start worker threads"""
+        if self._threads or self.workers <= 0:
+            return
+        self._stop_event.clear()
+        for i in range(self.workers):
+            worker_id = f"{self._worker_prefix}:{i}"
+            thread = threading.Thread(
+                target=self._worker_loop,
+                args=(worker_id,),
+                name=f"scoring-job-worker-{i}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"[ScoringJobs] Started {self.workers} worker(s)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop worker threads, waiting for running jobs up to timeout"""
+        self._stop_event.set()
+        self._wake_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("[ScoringJobs] Workers stopped")
+
+    def wake(self) -> None:
+        """Wake idle workers to check the queue"""
+        self._wake_event.set()
+
+    def run_next(self, worker_id: str) -> bool:
+        """
+        Claim and process one job
+
+        Returns:
+            True if a job was processed, False if the queue was empty
+        """
+        job_id = self._claim(worker_id)
+        if job_id is None:
+            return False
+        self._process(job_id, worker_id)
+        return True
+
+    def _worker_loop(self, worker_id: str) -> None:
+        while not self._stop_event.is_set():
+            try:
+                processed = self.run_next(worker_id)
+            except Exception as e:
+                logger.error(f"[ScoringJobs] Worker {worker_id} error: {str(e)}", exc_info=True)
+                processed = False
+            if not processed:
+                self._wake_event.wait(self.poll_interval)
+                self._wake_event.clear()
+
+    def _claim(self, worker_id: str) -> Optional[int]:
+        """Lock the oldest queued job and mark it as running"""
+        db = SessionLocal()
+        try:
+            self._requeue_stale_jobs(db)
+
+            job = db.query(ScoringJob).filter(
+                ScoringJob.status == JOB_QUEUED
+            ).order_by(
+                ScoringJob.created_at, ScoringJob.id
+            ).with_for_update(skip_locked=True).first()
+
+            if not job:
+                db.rollback()
+                return None
+
+            job.status = JOB_RUNNING
+            job.worker_id = worker_id
+            job.attempts = (job.attempts or 0) + 1
+            job.started_at = _now()
+            job.updated_at = job.started_at
+            job.finished_at = None
+            job.error = None
+            db.commit()
+            logger.info(f"[ScoringJobs] Worker {worker_id} claimed job {job.id} (attempt {job.attempts})")
+            return job.id
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _process(self, job_id: int, worker_id: str) -> None:
+        """Run scoring for claimed job and record the outcome"""
+        db = SessionLocal()
+        progress = None
+        try:
+            job = db.query(ScoringJob).filter(ScoringJob.id == job_id).first()
+            pitch_doc = None
+            if job.pitch_document_id:
+                pitch_doc = db.query(PitchDocument).filter(PitchDocument.id == job.pitch_document_id).first()
+            if not pitch_doc or not pitch_doc.text_content:
+                raise ValueError("No text content available for scoring")
+
+            progress = JobProgress(job_id, worker_id, list(ScoringService.AGENT_CLASSES))
+            progress.start()
+            options = job.options or {}
+            scoring_service = ScoringService(db, mode=options.get("mode"))
+            scoring = scoring_service.score_and_save(
+                pitch_doc, on_event=progress.on_event, force=options.get("force", False)
+            )
+            progress.stop()
+
+            updated = owned_job(db, job_id, worker_id).update({
+                ScoringJob.status: JOB_SUCCEEDED,
+                ScoringJob.scoring_id: scoring.id,
+                ScoringJob.finished_at: _now()
+            }, synchronize_session=False)
+            db.commit()
+            if updated:
+                logger.info(f"[ScoringJobs] Job {job_id} succeeded. scoring_id={scoring.id}")
+            else:
+                logger.warning(f"[ScoringJobs] Job {job_id} was requeued while running, scoring_id={scoring.id} not recorded")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[ScoringJobs] Job {job_id} failed: {str(e)}", exc_info=True)
+            self._mark_failed(job_id, worker_id, str(e))
+        finally:
+            if progress:
+                progress.stop()
+            db.close()
+
+    def _mark_failed(self, job_id: int, worker_id: str, error: str) -> None:
+        db = SessionLocal()
+        try:
+            owned_job(db, job_id, worker_id).update({
+                ScoringJob.status: JOB_FAILED,
+                ScoringJob.error: error,
+                ScoringJob.finished_at: _now()
+            }, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[ScoringJobs] Failed to mark job {job_id} as failed: {str(e)}")
+        finally:
+            db.close()
+
+    def _requeue_stale_jobs(self, db: Session) -> None:
+        """Return jobs abandoned by crashed workers (no heartbeat within SCORING_JOB_TIMEOUT) to the queue"""
+        if time.monotonic() - self._last_stale_check < STALE_CHECK_INTERVAL:
+            return
+        self._last_stale_check = time.monotonic()
+
+        deadline = _now() - timedelta(seconds=settings.SCORING_JOB_TIMEOUT)
+        stale_jobs = db.query(ScoringJob).filter(
+            ScoringJob.status == JOB_RUNNING,
+            func.coalesce(ScoringJob.updated_at, ScoringJob.started_at) < deadline
+        ).with_for_update(skip_locked=True).all()
+
+        for job in stale_jobs:
+            if (job.attempts or 0) >= settings.SCORING_JOB_MAX_ATTEMPTS:
+                job.status = JOB_FAILED
+                job.error = "Job timed out"
+                job.finished_at = _now()
+            else:
+                job.status = JOB_QUEUED
+            logger.warning(f"[ScoringJobs] Job {job.id} abandoned by {job.worker_id}, now {job.status}")
+        db.commit()
+
+
+scoring_job_runner = ScoringJobRunner()
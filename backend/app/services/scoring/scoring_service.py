@@ -1,17 +1,38 @@
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.data_version import portfolio_version
+from app.models import PitchDocument, Scoring, AgentResult
 from app.services.agents.base.mcp_agent import MCPAgent
+from app.services.agents.base.call_log import capture_calls
 from app.services.agents.text_analyzer.agent import TextAnalyzerAgent
 from app.services.agents.financial_analyzer.agent import FinancialAnalyzerAgent
 from app.services.agents.market_analyzer.agent import MarketAnalyzerAgent
 from app.services.agents.team_analyzer.agent import TeamAnalyzerAgent
 from app.services.agents.risk_predictor.agent import RiskPredictorAgent
+from app.services.agents.combined_analyzer.agent import CombinedAnalyzerAgent
+from app.services.agents.config_registry import agent_config_registry
+from app.services.analysis.content_hash import content_hash
+from app.services.analysis.near_duplicates import near_duplicate_index
+from app.services.analysis.section_segmenter import SectionSegmenter
+from app.services.scoring.latest_scoring import refresh_latest_score
 import asyncio
+import hashlib
+import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Receives scoring progress events: (event_name, payload)
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+MODE_PER_AGENT = "per_agent"  # Each agent sends its own prompt
+MODE_COMBINED = "combined"  # One prompt covering all agents
+SCORING_MODES = (MODE_PER_AGENT, MODE_COMBINED)
+
 
 class ScoringService:
     """Service for orchestrating scoring agents and calculating final score"""
@@ -27,23 +48,75 @@ class ScoringService:
         "risk_assessment": "Risk Assessment"
     }
     
-    def __init__(self, db: Session):
+    # Category weights of the total score (weight profiles can override them for what-if ranking)
+    DEFAULT_WEIGHTS = {
+        "product_technology": 0.15,
+        "market_opportunity": 0.15,
+        "business_model": 0.15,
+        "financials": 0.15,
+        "team": 0.15,
+        "traction": 0.10,
+        "competition": 0.10,
+        "risk_assessment": 0.05
+    }
+    
+    AGENT_CLASSES = {
+        "text_analyzer": TextAnalyzerAgent,
+        "financial_analyzer": FinancialAnalyzerAgent,
+        "market_analyzer": MarketAnalyzerAgent,
+        "team_analyzer": TeamAnalyzerAgent,
+        "risk_predictor": RiskPredictorAgent,
+    }
+    
+    _shared_agents: Optional[Tuple[Dict[str, MCPAgent], CombinedAnalyzerAgent]] = None
+    
+    def __init__(
+        self,
+        db: Session,
+        parallel: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        mode: Optional[str] = None,
+        section_routing: Optional[bool] = None,
+        near_duplicate_threshold: Optional[float] = None,
+        incremental: Optional[bool] = None
+    ):
         self.db = db
-        self.agents = {
-            "text_analyzer": TextAnalyzerAgent(db),
-            "financial_analyzer": FinancialAnalyzerAgent(db),
-            "market_analyzer": MarketAnalyzerAgent(db),
-            "team_analyzer": TeamAnalyzerAgent(db),
-            "risk_predictor": RiskPredictorAgent(db),
-        }
+        self.incremental = settings.SCORING_INCREMENTAL if incremental is None else incremental
+        self.near_duplicate_threshold = near_duplicate_threshold or settings.SCORING_NEAR_DUPLICATE_THRESHOLD
+        self.section_routing = settings.SCORING_SECTION_ROUTING if section_routing is None else section_routing
+        self.mode = mode or settings.SCORING_MODE
+        if self.mode not in SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {self.mode}")
+        self.parallel = settings.SCORING_PARALLEL if parallel is None else parallel
+        self.max_concurrency = max(1, max_concurrency or settings.SCORING_MAX_CONCURRENCY)
+        self.agents, combined_agent = self.shared_agents()
+        self.combined_agent: Optional[CombinedAnalyzerAgent] = combined_agent if self.mode == MODE_COMBINED else None
+    
+    @classmethod
+    def shared_agents(cls) -> Tuple[Dict[str, MCPAgent], CombinedAnalyzerAgent]:
+        """Agents keep no per-request state, so one instance of each is reused by every scoring"""
+        if cls._shared_agents is None:
+            agents = {agent_name: agent_class() for agent_name, agent_class in cls.AGENT_CLASSES.items()}
+            cls._shared_agents = (agents, CombinedAnalyzerAgent(agents))
+        return cls._shared_agents
     
-    def score_startup(self, text: str, startup_id: int) -> Dict[str, Any]:
+    def score_startup(
+        self,
+        text: str,
+        startup_id: int,
+        on_event: Optional[ProgressCallback] = None,
+        sections: Optional[Dict[str, Any]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
         """
         Score startup by running all agents
         
         Args:
             text: Pitch document text
             startup_id: Startup ID
+            on_event: Optional callback notified when each agent starts and finishes
+            sections: Document sections (SectionSegmenter output) used to route agent inputs
+            force: Call every agent and the model even if a stored result or cached response could be reused
             
         Returns:
             Scoring result with total score, breakdown, risks, and recommendations
@@ -51,22 +124,41 @@ class ScoringService:
         logger.info(f"[ScoringService] Starting scoring for startup_id={startup_id}")
         logger.info(f"[ScoringService] Text length: {len(text)} chars")
         
-        # Run all agents in parallel (simulated - will be async with MCP)
-        results = {}
-        for agent_name, agent in self.agents.items():
-            try:
-                logger.info(f"[ScoringService] Running agent: {agent_name}")
-                result = agent.analyze(text)
-                logger.info(f"[ScoringService] Agent {agent_name} completed. Result: {result}")
-                results[agent_name] = result
-            except Exception as e:
-                logger.error(f"[ScoringService] Agent {agent_name} failed: {str(e)}", exc_info=True)
-                # If agent fails, use default scores
-                results[agent_name] = {
-                    "score": 50.0,
-                    "details": f"Agent error: {str(e)}"
-                }
+        started_at = time.monotonic()
+        agent_runs: Dict[str, Dict[str, Any]] = {}
+        if self.mode == MODE_COMBINED:
+            results = self._run_combined(text, on_event, agent_runs, force)
+        else:
+            inputs = self._agent_inputs(text, sections)
+            agent_runs = self._agent_runs(text, inputs, sections)
+            # Agents whose input and config didn't change since a previous scoring aren't called again
+            results = {} if force else self._reuse_agent_results(agent_runs, on_event)
+            pending = {agent_name: inputs[agent_name] for agent_name in inputs if agent_name not in results}
+            if self.parallel and len(pending) > 1:
+                results.update(self._run_agents_parallel(pending, on_event, agent_runs, force))
+            else:
+                results.update(self._run_agents_sequential(pending, on_event, agent_runs, force))
+            results = {agent_name: results[agent_name] for agent_name in self.agents}
+        for agent_name, run in agent_runs.items():
+            run["result"] = results[agent_name]
+        logger.info(f"[ScoringService] All agents completed in {time.monotonic() - started_at:.2f}s (mode={self.mode})")
         
+        scoring_result = self.aggregate(results)
+        self._emit(on_event, "scoring_completed", scoring_result)
+        # Per-agent inputs and results are for storing only, not part of the event
+        scoring_result = {**scoring_result, "agent_runs": agent_runs}
+        return scoring_result
+    
+    def aggregate(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Combine agent results into the scoring
+        
+        Args:
+            results: Agent results keyed by agent name
+            
+        Returns:
+            Total score, breakdown, risks, recommendations and team info
+        """
         # Calculate breakdown by categories
         breakdown = self._calculate_breakdown(results)
         
@@ -99,6 +191,438 @@ class ScoringService:
             "team_info": team_info
         }
     
+    def score_and_save(
+        self,
+        pitch_doc: PitchDocument,
+        on_event: Optional[ProgressCallback] = None,
+        force: bool = False
+    ) -> Scoring:
+        """
+        Score pitch document and persist the result
+        
+        Args:
+            pitch_doc: Pitch document with text content
+            on_event: Optional progress callback, see score_startup
+            force: Run agents and call the model even if identical text was already scored with the same configs
+            
+        Returns:
+            Created (or reused) Scoring record
+        """
+        config_versions = self.config_versions()
+        config_fingerprint = self.config_fingerprint(config_versions)
+        if not force:
+            existing = self.find_reusable_scoring(pitch_doc, config_fingerprint)
+            if existing:
+                scoring = self.reuse_scoring(pitch_doc, existing)
+                self._emit(on_event, "scoring_reused", {"scoring_id": scoring.id, "source_scoring_id": existing.id})
+                return scoring
+        
+        text = pitch_doc.text_content
+        sections = pitch_doc.sections
+        if self.section_routing and sections is None:
+            # Documents uploaded before segmentation existed; saved together with the scoring
+            sections = SectionSegmenter().segment(text)
+            pitch_doc.sections = sections
+        
+        scoring_result = self.score_startup(text, pitch_doc.startup_id, on_event, sections, force=force)
+        logger.info(f"[ScoringService] Scoring completed. Total score: {scoring_result.get('total_score', 'N/A')}")
+        
+        scoring = Scoring(
+            startup_id=pitch_doc.startup_id,
+            total_score=scoring_result["total_score"],
+            breakdown=scoring_result["breakdown"],
+            risks=scoring_result["risks"],
+            recommendations=scoring_result["recommendations"],
+            team_info=scoring_result.get("team_info", {}),
+            content_hash=self._ensure_content_hash(pitch_doc),
+            config_fingerprint=config_fingerprint,
+            config_versions=config_versions
+        )
+        for agent_name, run in scoring_result["agent_runs"].items():
+            call_log = run.get("call_log")
+            scoring.agent_results.append(AgentResult(
+                agent_name=agent_name,
+                input_hash=run["input_hash"],
+                config_version=run["config_version"],
+                result=run["result"],
+                raw_responses=call_log.raw_responses if call_log else None,
+                latency=run.get("latency"),
+                # A combined call serves all agents, its tokens can't be split between them
+                prompt_tokens=call_log.prompt_tokens if call_log and not run.get("shared_call") else None,
+                completion_tokens=call_log.completion_tokens if call_log and not run.get("shared_call") else None,
+                total_tokens=call_log.total_tokens if call_log and not run.get("shared_call") else None,
+                failed=run.get("failed", False) or self._is_failed_result(agent_name, run["result"]),
+                reused_from_id=run.get("reused_from_id")
+            ))
+        self.db.add(scoring)
+        refresh_latest_score(self.db, pitch_doc.startup_id)
+        self.db.commit()
+        portfolio_version.bump()
+        self.db.refresh(scoring)
+        return scoring
+    
+    def config_versions(self) -> Dict[str, str]:
+        """Versions of the agent configs this service scores with"""
+        agent_names = list(self.agents)
+        if self.combined_agent:
+            agent_names.append(self.combined_agent.agent_name)
+        return {agent_name: agent_config_registry.version(agent_name) for agent_name in agent_names}
+    
+    def config_fingerprint(self, config_versions: Dict[str, str]) -> str:
+        """Hash of everything besides the text that determines the scoring result"""
+        payload = {
+            "mode": self.mode,
+            "section_routing": self.section_routing,
+            "agents": config_versions
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def find_reusable_scoring(self, pitch_doc: PitchDocument, config_fingerprint: Optional[str] = None) -> Optional[Scoring]:
+        """
+        Find scoring of identical (or, if near_duplicate_threshold is set, near-identical)
+        text made with the same agent configs
+        
+        Args:
+            pitch_doc: Pitch document to be scored
+            config_fingerprint: Fingerprint of current configs, computed if not given
+            
+        Returns:
+            Most recent matching Scoring or None
+        """
+        pitch_hash = self._ensure_content_hash(pitch_doc)
+        if not pitch_hash:
+            return None
+        if config_fingerprint is None:
+            config_fingerprint = self.config_fingerprint(self.config_versions())
+        candidates = self.db.query(Scoring).filter(
+            Scoring.content_hash == pitch_hash,
+            Scoring.config_fingerprint == config_fingerprint,
+            self._without_failed_results()
+        ).order_by(Scoring.created_at.desc(), Scoring.id.desc())
+        scoring = next((candidate for candidate in candidates if self._is_reusable(candidate)), None)
+        if scoring or not self.near_duplicate_threshold:
+            return scoring
+        return self._find_near_duplicate_scoring(pitch_doc, config_fingerprint)
+    
+    def _find_near_duplicate_scoring(self, pitch_doc: PitchDocument, config_fingerprint: str) -> Optional[Scoring]:
+        """Scoring of the most similar document above near_duplicate_threshold"""
+        similar = near_duplicate_index.find_similar(self.db, pitch_doc, threshold=self.near_duplicate_threshold)
+        hashes = [doc.content_hash for doc, _ in similar if doc.content_hash]
+        if not hashes:
+            return None
+        
+        scorings = {}
+        for scoring in self.db.query(Scoring).filter(
+            Scoring.content_hash.in_(hashes),
+            Scoring.config_fingerprint == config_fingerprint,
+            self._without_failed_results()
+        ).order_by(Scoring.created_at, Scoring.id):
+            if self._is_reusable(scoring):
+                scorings[scoring.content_hash] = scoring  # Latest per hash wins
+        
+        for doc, similarity in similar:
+            if doc.content_hash in scorings:
+                logger.info(
+                    f"[ScoringService] Pitch is a near duplicate of pitch_document_id={doc.id} "
+                    f"(similarity {similarity:.2f})"
+                )
+                return scorings[doc.content_hash]
+        return None
+    
+    @staticmethod
+    def _without_failed_results():
+        """Filter out scorings holding fallback results of failed agent calls, they must be rescored"""
+        return ~Scoring.agent_results.any(AgentResult.failed.is_(True))
+    
+    def _is_reusable(self, scoring: Scoring) -> bool:
+        """No agent result of the scoring is a failure, including ones stored before they were flagged"""
+        return not any(
+            self._is_failed_result(agent_result.agent_name, agent_result.result)
+            for agent_result in scoring.agent_results
+        )
+    
+    def reuse_scoring(self, pitch_doc: PitchDocument, existing: Scoring) -> Scoring:
+        """
+        Use existing scoring for the pitch without calling agents
+        
+        Returns existing scoring if it's already the startup's latest one,
+        otherwise a copy of it made for the startup.
+        Copies keep the content hash of the text that was actually scored.
+        """
+        latest = self.db.query(Scoring.id).filter(
+            Scoring.startup_id == pitch_doc.startup_id
+        ).order_by(Scoring.created_at.desc(), Scoring.id.desc()).first()
+        
+        if latest and latest.id == existing.id:
+            logger.info(f"[ScoringService] Identical pitch already scored, reusing scoring_id={existing.id}")
+            self.db.commit()
+            return existing
+        
+        scoring = Scoring(
+            startup_id=pitch_doc.startup_id,
+            total_score=existing.total_score,
+            breakdown=existing.breakdown,
+            risks=existing.risks,
+            recommendations=existing.recommendations,
+            team_info=existing.team_info,
+            content_hash=existing.content_hash,
+            config_fingerprint=existing.config_fingerprint,
+            config_versions=existing.config_versions,
+            agent_results=[
+                AgentResult(
+                    agent_name=agent_result.agent_name,
+                    input_hash=agent_result.input_hash,
+                    config_version=agent_result.config_version,
+                    result=agent_result.result,
+                    failed=agent_result.failed,
+                    reused_from_id=agent_result.reused_from_id or agent_result.id
+                )
+                for agent_result in existing.agent_results
+            ]
+        )
+        self.db.add(scoring)
+        refresh_latest_score(self.db, pitch_doc.startup_id)
+        self.db.commit()
+        portfolio_version.bump()
+        self.db.refresh(scoring)
+        logger.info(f"[ScoringService] Identical pitch already scored, cloned scoring_id={existing.id} as {scoring.id}")
+        return scoring
+    
+    def _ensure_content_hash(self, pitch_doc: PitchDocument) -> Optional[str]:
+        """Content hash of the pitch, computed for documents stored before hashing existed"""
+        if pitch_doc.content_hash is None and pitch_doc.text_content:
+            pitch_doc.content_hash = content_hash(pitch_doc.text_content)
+        return pitch_doc.content_hash
+    
+    def _emit(self, on_event: Optional[ProgressCallback], event: str, payload: Dict[str, Any]) -> None:
+        """Notify progress callback, never letting it break scoring"""
+        if on_event is None:
+            return
+        try:
+            on_event(event, payload)
+        except Exception as e:
+            logger.warning(f"[ScoringService] Progress callback failed on {event}: {str(e)}")
+    
+    def _run_agent(
+        self,
+        agent_name: str,
+        agent: MCPAgent,
+        text: str,
+        on_event: Optional[ProgressCallback] = None,
+        run: Optional[Dict[str, Any]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run single agent, falling back to default score on failure
+        
+        Latency, failure flag and the call log (raw responses, token usage) are stored into run if given.
+        """
+        self._emit(on_event, "agent_started", {"agent": agent_name})
+        started_at = time.monotonic()
+        failed = False
+        try:
+            logger.info(f"[ScoringService] Running agent: {agent_name}")
+            with capture_calls() as call_log:
+                result = agent.analyze_document(text, force=force)
+            logger.info(
+                f"[ScoringService] Agent {agent_name} completed in {time.monotonic() - started_at:.2f}s. "
+                f"Result: {result}"
+            )
+        except Exception as e:
+            logger.error(f"[ScoringService] Agent {agent_name} failed: {str(e)}", exc_info=True)
+            failed = True
+            # If agent fails, use default scores
+            result = {
+                "score": 50.0,
+                "details": f"Agent error: {str(e)}"
+            }
+        duration = round(time.monotonic() - started_at, 2)
+        if run is not None:
+            run.update(latency=duration, failed=failed, call_log=call_log)
+        self._emit(on_event, "agent_completed", {
+            "agent": agent_name,
+            "score": result.get("score"),
+            "details": result.get("details"),
+            "result": result,
+            "duration": duration,
+            "failed": failed
+        })
+        return result
+    
+    def _agent_inputs(self, text: str, sections: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Text each agent receives: its relevant sections when routing is on, otherwise the whole document"""
+        if not self.section_routing or not sections:
+            return {agent_name: text for agent_name in self.agents}
+        return {
+            agent_name: agent.select_input(text, sections)
+            for agent_name, agent in self.agents.items()
+        }
+    
+    def _agent_runs(
+        self,
+        text: str,
+        inputs: Dict[str, str],
+        sections: Optional[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Input hash and config version of each agent run
+        
+        Routed agents are keyed by their sections only, so an edit elsewhere in the
+        document (including the summary they get as context) doesn't re-run them.
+        """
+        agent_runs = {}
+        for agent_name, agent_input in inputs.items():
+            if agent_input != text:
+                agent_input = self.agents[agent_name].relevant_text(sections)
+            agent_runs[agent_name] = {
+                "input_hash": content_hash(agent_input),
+                "config_version": agent_config_registry.version(agent_name)
+            }
+        return agent_runs
+    
+    def _reuse_agent_results(
+        self,
+        agent_runs: Dict[str, Dict[str, Any]],
+        on_event: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Find stored results of agents that already analyzed the same input with the same config
+        
+        Args:
+            agent_runs: Output of _agent_runs, marked with reused_from_id for reused agents
+            on_event: Optional progress callback
+            
+        Returns:
+            Reused results keyed by agent name
+        """
+        if not self.incremental:
+            return {}
+        
+        reused = {}
+        for agent_name, run in agent_runs.items():
+            stored = self.db.query(AgentResult).filter(
+                AgentResult.agent_name == agent_name,
+                AgentResult.input_hash == run["input_hash"],
+                AgentResult.config_version == run["config_version"],
+                AgentResult.failed.isnot(True)
+            ).order_by(AgentResult.created_at.desc(), AgentResult.id.desc()).first()
+            if not stored or self._is_failed_result(agent_name, stored.result):
+                continue
+            
+            run["reused_from_id"] = stored.reused_from_id or stored.id
+            run["latency"] = 0.0
+            reused[agent_name] = stored.result
+            self._emit(on_event, "agent_started", {"agent": agent_name})
+            self._emit(on_event, "agent_completed", {
+                "agent": agent_name,
+                "score": stored.result.get("score"),
+                "details": stored.result.get("details"),
+                "result": stored.result,
+                "duration": 0.0,
+                "failed": False,
+                "reused": True
+            })
+        
+        if reused:
+            logger.info(f"[ScoringService] Inputs unchanged, reusing results of: {', '.join(reused)}")
+        return reused
+    
+    def _is_failed_result(self, agent_name: str, result: Dict[str, Any]) -> bool:
+        """Fallback result of a failed call, or default result of a response that couldn't be parsed"""
+        agent = self.agents.get(agent_name)
+        return agent.is_failed(result) if agent else MCPAgent.is_failed_result(result)
+    
+    def _run_agents_sequential(
+        self,
+        inputs: Dict[str, str],
+        on_event: Optional[ProgressCallback] = None,
+        agent_runs: Optional[Dict[str, Dict[str, Any]]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """Run agents one after another"""
+        agent_runs = agent_runs or {}
+        return {
+            agent_name: self._run_agent(agent_name, self.agents[agent_name], agent_input, on_event, agent_runs.get(agent_name), force)
+            for agent_name, agent_input in inputs.items()
+        }
+    
+    def _run_agents_parallel(
+        self,
+        inputs: Dict[str, str],
+        on_event: Optional[ProgressCallback] = None,
+        agent_runs: Optional[Dict[str, Dict[str, Any]]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """Run agents concurrently, at most max_concurrency at a time"""
+        max_workers = min(self.max_concurrency, len(inputs))
+        logger.info(f"[ScoringService] Running {len(inputs)} agents in parallel (max_workers={max_workers})")
+        
+        agent_runs = agent_runs or {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scoring-agent") as executor:
+            futures = {
+                agent_name: executor.submit(
+                    self._run_agent, agent_name, self.agents[agent_name], agent_input, on_event, agent_runs.get(agent_name), force
+                )
+                for agent_name, agent_input in inputs.items()
+            }
+            # Keep results in agent order regardless of completion order
+            return {agent_name: future.result() for agent_name, future in futures.items()}
+    
+    def _run_combined(
+        self,
+        text: str,
+        on_event: Optional[ProgressCallback] = None,
+        agent_runs: Optional[Dict[str, Dict[str, Any]]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run all agents with a single combined GigaChat call
+        
+        Per-agent run info is added to agent_runs if given. Its config version is the
+        combined agent's, so per-agent scorings never reuse these results.
+        """
+        for agent_name in self.agents:
+            self._emit(on_event, "agent_started", {"agent": agent_name})
+        
+        started_at = time.monotonic()
+        failed = False
+        try:
+            logger.info(f"[ScoringService] Running combined analysis for {len(self.agents)} agents")
+            with capture_calls() as call_log:
+                results = self.combined_agent.analyze_document(text, force=force)
+        except Exception as e:
+            logger.error(f"[ScoringService] Combined analysis failed: {str(e)}", exc_info=True)
+            failed = True
+            results = {
+                agent_name: {"score": 50.0, "details": f"Agent error: {str(e)}"}
+                for agent_name in self.agents
+            }
+        duration = round(time.monotonic() - started_at, 2)
+        
+        if agent_runs is not None:
+            input_hash = content_hash(text)
+            config_version = f"{self.combined_agent.agent_name}:{agent_config_registry.version(self.combined_agent.agent_name)}"
+            for agent_name in results:
+                agent_runs[agent_name] = {
+                    "input_hash": input_hash,
+                    "config_version": config_version,
+                    "latency": duration,
+                    "failed": failed,
+                    "call_log": call_log,
+                    "shared_call": True
+                }
+        
+        for agent_name, result in results.items():
+            self._emit(on_event, "agent_completed", {
+                "agent": agent_name,
+                "score": result.get("score"),
+                "details": result.get("details"),
+                "result": result,
+                "duration": duration,
+                "failed": failed
+            })
+        return results
+    
     def _calculate_breakdown(self, results: Dict[str, Any]) -> Dict[str, float]:
         """Calculate score breakdown by 8 categories"""
         breakdown = {}
@@ -130,16 +654,7 @@ class ScoringService:
     
     def _calculate_total_score(self, breakdown: Dict[str, float]) -> float:
         """Calculate total score as weighted average"""
-        weights = {
-            "product_technology": 0.15,
-            "market_opportunity": 0.15,
-            "business_model": 0.15,
-            "financials": 0.15,
-            "team": 0.15,
-            "traction": 0.10,
-            "competition": 0.10,
-            "risk_assessment": 0.05
-        }
+        weights = self.DEFAULT_WEIGHTS
         
         total = sum(breakdown.get(cat, 50.0) * weights.get(cat, 0.125) for cat in breakdown.keys())
         return round(total, 2)
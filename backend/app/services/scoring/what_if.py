@@ -0,0 +1,254 @@
+"""
+What-if ranking of the portfolio under alternative category weights.
+Latest breakdowns of all startups are loaded into a (startups x categories)
+NumPy matrix; totals for a weight profile are one matrix-vector product and
+ranks one argsort, so re-ranking doesn't depend on Python loops over startups.
+The matrix is cached per worker until a new scoring appears or a change
+(re-aggregation, startup edit/delete) is announced over LISTEN/NOTIFY.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.data_version import portfolio_version
+from app.core.notifications import notify, notification_listener
+from app.models import Startup, Scoring, StartupLatestScore, WeightProfile, ProfileRanking
+from app.services.scoring.scoring_service import ScoringService
+import logging
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = list(ScoringService.CATEGORIES)
+
+# Breakdown value used for categories missing from old scorings (same as ScoringService)
+DEFAULT_CATEGORY_SCORE = 50.0
+
+PORTFOLIO_CHANNEL = "portfolio_changed"
+
+
+def normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    Validate weights and scale them to sum 1
+
+    Args:
+        weights: Category -> non-negative weight, missing categories weigh 0
+
+    Returns:
+        Weights for every category, summing to 1
+
+    Raises:
+        ValueError: Unknown category, negative weight or all weights zero
+    """
+    unknown = set(weights) - set(CATEGORIES)
+    if unknown:
+        raise ValueError(f"Unknown categories: {', '.join(sorted(unknown))}. Available: {', '.join(CATEGORIES)}")
+    if any(weight < 0 for weight in weights.values()):
+        raise ValueError("Weights must be non-negative")
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("At least one weight must be positive")
+    return {category: weights.get(category, 0.0) / total for category in CATEGORIES}
+
+
+def ordinal_ranks(scores: np.ndarray) -> np.ndarray:
+    """Rank 1 for the highest score, ties keep portfolio order"""
+    order = np.argsort(-scores, kind="stable")
+    ranks = np.empty(len(scores), dtype=np.int64)
+    ranks[order] = np.arange(1, len(scores) + 1)
+    return ranks
+
+
+class Portfolio:
+    """Latest scoring of every scored startup as column arrays"""
+
+    def __init__(self, rows: List[Any]):
+        self.size = len(rows)
+        self.startup_ids = np.array([row.startup_id for row in rows], dtype=np.int64)
+        self.scoring_ids = np.array([row.scoring_id for row in rows], dtype=np.int64)
+        self.names = np.array([row.name for row in rows], dtype=object)
+        self.industries = np.array([row.industry for row in rows], dtype=object)
+        self.stages = np.array([row.stage for row in rows], dtype=object)
+        self.geographies = np.array([row.geography for row in rows], dtype=object)
+        self.baseline = np.array([row.total_score for row in rows], dtype=np.float64)
+        self.matrix = np.array(
+            [[(row.breakdown or {}).get(category, DEFAULT_CATEGORY_SCORE) for category in CATEGORIES] for row in rows],
+            dtype=np.float64
+        ).reshape(self.size, len(CATEGORIES))
+
+    @classmethod
+    def load(cls, db: Session) -> "Portfolio":
+        """Load latest scoring of each startup"""
+        rows = db.query(
+            Startup.id.label("startup_id"),
+            Startup.name,
+            StartupLatestScore.industry,
+            StartupLatestScore.stage,
+            StartupLatestScore.geography,
+            StartupLatestScore.scoring_id,
+            StartupLatestScore.total_score,
+            StartupLatestScore.breakdown
+        ).join(
+            StartupLatestScore, Startup.id == StartupLatestScore.startup_id
+        ).order_by(Startup.id).all()
+        return cls(rows)
+
+    def totals(self, weights: Dict[str, float]) -> np.ndarray:
+        """Total score of every startup under normalized weights"""
+        vector = np.array([weights[category] for category in CATEGORIES], dtype=np.float64)
+        return np.round(self.matrix @ vector, 2)
+
+    def mask(
+        self,
+        industry: Optional[str] = None,
+        stage: Optional[str] = None,
+        geography: Optional[str] = None
+    ) -> np.ndarray:
+        """Boolean mask of startups matching the filters"""
+        selected = np.ones(self.size, dtype=bool)
+        if industry:
+            selected &= self.industries == industry
+        if stage:
+            selected &= self.stages == stage
+        if geography:
+            selected &= self.geographies == geography
+        return selected
+
+
+class PortfolioCache:
+    """Portfolio loaded once and reused by what-if requests while scorings don't change"""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = settings.PORTFOLIO_CACHE_TTL if ttl is None else ttl
+        self._portfolio: Optional[Portfolio] = None
+        self._version: Optional[int] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        notification_listener.subscribe(PORTFOLIO_CHANNEL, lambda payload: self._drop())
+
+    def get(self, db: Session) -> Portfolio:
+        """Cached portfolio, reloaded when a scoring was added since it was loaded"""
+        # New scorings (including reused copies) always get a higher id
+        version = db.query(func.max(Scoring.id)).scalar()
+        with self._lock:
+            fresh = notification_listener.is_listening or time.monotonic() - self._loaded_at < self.ttl
+            if self._portfolio is not None and self._version == version and fresh:
+                return self._portfolio
+
+        portfolio = Portfolio.load(db)
+        with self._lock:
+            self._portfolio = portfolio
+            self._version = version
+            self._loaded_at = time.monotonic()
+        return portfolio
+
+    def invalidate(self) -> None:
+        """Drop cached portfolio in every worker (after changes that don't add scorings)"""
+        self._drop()
+        notify(PORTFOLIO_CHANNEL)
+
+    def _drop(self) -> None:
+        with self._lock:
+            self._portfolio = None
+
+
+portfolio_cache = PortfolioCache()
+
+
+def what_if(
+    db: Session,
+    weights: Dict[str, float],
+    limit: int = 50,
+    industry: Optional[str] = None,
+    stage: Optional[str] = None,
+    geography: Optional[str] = None,
+    profile: Optional[WeightProfile] = None,
+    persist: bool = False
+) -> Dict[str, Any]:
+    """
+    Rank portfolio under weights and compare with the current leaderboard
+
+    Args:
+        db: Database session
+        weights: Category weights (normalized here)
+        limit: Number of top entries returned
+        industry, stage, geography: Leaderboard filters
+        profile: Profile the weights come from, required for persist
+        persist: Store ranking of the whole portfolio as the profile's leaderboard
+
+    Returns:
+        Applied weights, number of ranked startups and top entries with rank changes
+    """
+    weights = normalize_weights(weights)
+    started_at = time.monotonic()
+
+    portfolio = portfolio_cache.get(db)
+    totals = portfolio.totals(weights)
+    loaded_at = time.monotonic()
+
+    persisted = False
+    if persist and profile is not None:
+        persist_rankings(db, profile, portfolio, totals)
+        persisted = True
+
+    selected = np.flatnonzero(portfolio.mask(industry, stage, geography))
+    ranks = ordinal_ranks(totals[selected])
+    baseline_ranks = ordinal_ranks(portfolio.baseline[selected])
+    top = np.argsort(ranks, kind="stable")[:limit]
+
+    results = []
+    for position in top:
+        index = selected[position]
+        results.append({
+            "rank": int(ranks[position]),
+            "startup": {
+                "id": int(portfolio.startup_ids[index]),
+                "name": portfolio.names[index],
+                "industry": portfolio.industries[index],
+                "stage": portfolio.stages[index],
+                "geography": portfolio.geographies[index]
+            },
+            "score": float(totals[index]),
+            "baseline_rank": int(baseline_ranks[position]),
+            "baseline_score": float(portfolio.baseline[index]),
+            "rank_change": int(baseline_ranks[position] - ranks[position]),
+            "scoring_id": int(portfolio.scoring_ids[index])
+        })
+
+    logger.info(
+        f"[WhatIf] Ranked {portfolio.size} startups: load {loaded_at - started_at:.3f}s, "
+        f"rank {time.monotonic() - loaded_at:.3f}s"
+    )
+    return {
+        "profile": profile.name if profile else None,
+        "weights": weights,
+        "total": int(len(selected)),
+        "persisted": persisted,
+        "results": results
+    }
+
+
+def persist_rankings(db: Session, profile: WeightProfile, portfolio: Portfolio, totals: np.ndarray) -> None:
+    """Replace stored ranking of profile with ranking of the whole portfolio"""
+    ranks = ordinal_ranks(totals)
+    db.query(ProfileRanking).filter(ProfileRanking.profile_id == profile.id).delete(synchronize_session=False)
+    if portfolio.size:
+        db.execute(insert(ProfileRanking), [
+            {
+                "profile_id": profile.id,
+                "startup_id": int(startup_id),
+                "scoring_id": int(scoring_id),
+                "total_score": float(total),
+                "rank": int(rank)
+            }
+            for startup_id, scoring_id, total, rank in zip(
+                portfolio.startup_ids, portfolio.scoring_ids, totals, ranks
+            )
+        ])
+    profile.ranked_at = datetime.now(timezone.utc)
+    db.commit()
+    portfolio_version.bump()
+    logger.info(f"[WhatIf] Persisted ranking of {portfolio.size} startups for profile '{profile.name}'")
@@ -0,0 +1,73 @@
+"""
+Test setup: a throwaway SQLite database and GigaChat calls replaced by canned responses.
+Run from backend/: python -m pytest tests
+"""
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import types
+import pytest
+from app.api.response_cache import portfolio_responses
+from app.core.data_version import portfolio_version
+from app.core.database import Base, SessionLocal, engine
+from app.models import Startup, PitchDocument
+from app.services.agents.base import mcp_agent
+from app.services.gigachat.auth import token_provider
+from app.services.gigachat.response_cache import response_cache
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    response_cache.memory.clear()
+    # Tables are recreated: forget versions and responses cached from the previous test's data
+    portfolio_version._version = None
+    portfolio_responses.entries.clear()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def pitch_doc(db):
+    startup = Startup(name="Acme")
+    db.add(startup)
+    db.flush()
+    doc = PitchDocument(
+        startup_id=startup.id,
+        content_type="text",
+        source_type="text",
+        extracted_text="Acme builds scoring tools for venture funds."
+    )
+    db.add(doc)
+    db.commit()
+    return doc
+
+
+class FakeGigaChat:
+    """Returns content as the message of every chat completion and counts calls"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    def chat_completion(self, data, token):
+        self.calls += 1
+        body = {"choices": [{"message": {"content": self.content}}], "usage": {}}
+        return types.SimpleNamespace(status_code=200, raise_for_status=lambda: None, json=lambda: body)
+
+
+@pytest.fixture
+def gigachat(monkeypatch):
+    fake = FakeGigaChat(json.dumps({"score": 80.0, "details": "Solid pitch"}))
+    monkeypatch.setattr(mcp_agent.gigachat_client, "chat_completion", fake.chat_completion)
+    monkeypatch.setattr(token_provider, "get_token", lambda: "token")
+    return fake
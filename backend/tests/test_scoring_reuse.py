@@ -0,0 +1,55 @@
+from app.models import AgentResult, Scoring
+from app.services.analysis.content_hash import content_hash
+from app.services.scoring.scoring_service import ScoringService
+
+
+def _stored_scoring(db, pitch_doc, service, agent_result):
+    scoring = Scoring(
+        startup_id=pitch_doc.startup_id,
+        total_score=50.0,
+        breakdown={},
+        risks=[],
+        recommendations=[],
+        content_hash=content_hash(pitch_doc.text_content),
+        config_fingerprint=service.config_fingerprint(service.config_versions()),
+        agent_results=[agent_result]
+    )
+    db.add(scoring)
+    db.commit()
+    return scoring
+
+
+def test_scoring_with_default_result_is_not_reused(db, pitch_doc):
+    service = ScoringService(db)
+    # Stored before default results were flagged as failed
+    default = service.agents["text_analyzer"].default_result()
+    _stored_scoring(db, pitch_doc, service, AgentResult(
+        agent_name="text_analyzer", input_hash="h", config_version="1", result=default, failed=False
+    ))
+
+    assert service.find_reusable_scoring(pitch_doc) is None
+
+
+def test_scoring_with_successful_results_is_reused(db, pitch_doc):
+    service = ScoringService(db)
+    scoring = _stored_scoring(db, pitch_doc, service, AgentResult(
+        agent_name="text_analyzer", input_hash="h", config_version="1",
+        result={"score": 80.0, "details": "Solid pitch"}, failed=False
+    ))
+
+    assert service.find_reusable_scoring(pitch_doc).id == scoring.id
+
+
+def test_unparseable_responses_are_rescored(db, pitch_doc, gigachat):
+    gigachat.content = "not json"
+    first = ScoringService(db).score_and_save(pitch_doc)
+    assert all(agent_result.failed for agent_result in first.agent_results)
+    calls = gigachat.calls
+
+    gigachat.content = '{"score": 80.0, "details": "Solid pitch"}'
+    second = ScoringService(db).score_and_save(pitch_doc)
+
+    # Neither the scoring, the agent results nor the cached responses were replayed
+    assert second.id != first.id
+    assert gigachat.calls == calls * 2
+    assert not any(agent_result.failed for agent_result in second.agent_results)
@@ -0,0 +1,26 @@
+from fastapi.testclient import TestClient
+from app.main import app
+
+WEIGHTS = {"team": 2.0, "traction": 1.0}
+
+
+def test_rename_invalidates_cached_leaderboard(db):
+    client = TestClient(app)
+    assert client.post("/api/weight-profiles/", json={"name": "growth", "weights": WEIGHTS}).status_code == 200
+    assert client.get("/api/leaderboard/", params={"profile": "growth"}).status_code == 200
+
+    response = client.put("/api/weight-profiles/growth", json={"name": "expansion"})
+
+    assert response.status_code == 200
+    assert client.get("/api/leaderboard/", params={"profile": "growth"}).status_code == 404
+    assert client.get("/api/leaderboard/", params={"profile": "expansion"}).status_code == 200
+
+
+def test_rename_to_existing_name_is_rejected(db):
+    client = TestClient(app)
+    client.post("/api/weight-profiles/", json={"name": "growth", "weights": WEIGHTS})
+    client.post("/api/weight-profiles/", json={"name": "defensive", "weights": WEIGHTS})
+
+    response = client.put("/api/weight-profiles/growth", json={"name": "defensive"})
+
+    assert response.status_code == 400
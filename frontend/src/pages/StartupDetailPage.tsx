@@ -13,9 +13,17 @@ export default function StartupDetailPage() {
   })
 
   const scoreMutation = useMutation({
-    mutationFn: () => scoringsApi.create(startupId),
-    onSuccess: (data) => {
-      navigate(`/scoring/${data.data.id}`)
+    mutationFn: async () => {
+      const response = await scoringsApi.create(startupId)
+      if (response.status === 200) {
+        // Identical pitch was already scored, scoring is returned right away
+        return response.data.id
+      }
+      const job = await scoringsApi.waitForJob(response.data.id)
+      return job.scoring_id
+    },
+    onSuccess: (scoringId) => {
+      navigate(`/scoring/${scoringId}`)
     },
   })
 
@@ -12,6 +12,7 @@ const api = axios.create({
 // Startups
 export const startupsApi = {
   getAll: (params?: any) => api.get('/startups/', { params }),
+  getFacets: () => api.get('/startups/facets'),
   getById: (id: number) => api.get(`/startups/${id}`),
   create: (data: any) => api.post('/startups/', data),
   update: (id: number, data: any) => api.put(`/startups/${id}`, data),
@@ -33,6 +34,20 @@ export const scoringsApi = {
   getAll: (params?: any) => api.get('/scorings/', { params }),
   getById: (id: number) => api.get(`/scorings/${id}`),
   create: (startupId: number) => api.post(`/scorings/startups/${startupId}/score`),
+  getJob: (jobId: number) => api.get(`/scorings/jobs/${jobId}`),
+  waitForJob: async (jobId: number, intervalMs = 1500) => {
+    // Poll scoring job until it finishes
+    while (true) {
+      const { data: job } = await api.get(`/scorings/jobs/${jobId}`)
+      if (job.status === 'succeeded') {
+        return job
+      }
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Scoring job failed')
+      }
+      await new Promise(resolve => setTimeout(resolve, intervalMs))
+    }
+  },
   addComment: (id: number, text: string) => api.post(`/scorings/${id}/comments`, { text }),
 }
 